@@ -17,6 +17,84 @@ class Settings(BaseSettings):
     # CORS - UPDATED for network access
     FRONTEND_URL: str = "http://172.16.2.4:4200"
     
+    # Principal cache (get_current_user) - set TTL to 0 to disable. Per worker: other
+    # workers may see an approval/deactivation up to TTL seconds late
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 1024
+    
+    # Password hashing pool - hashes run off the event loop
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 256
+    
+    # Build missing inventory indexes (app/models/indexes.py) at startup
+    RECONCILE_INDEXES_ON_STARTUP: bool = True
+    
+    # Inventory/audit exports - rows per cursor batch and per streamed chunk
+    EXPORT_BATCH_SIZE: int = 1000
+    
+    # Bulk inventory import - documents per insert_many and max rows per upload
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_ROWS: int = 100000
+    
+    # PAR document uploads - streamed to disk in chunks, rejected past the size cap
+    PAR_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE: int = 256 * 1024
+    
+    # Content-addressed document store: "local" (BLOB_STORE_DIR - one node or shared disk),
+    # "gridfs" (application database) or "s3" (any S3-compatible service, e.g. MinIO)
+    STORAGE_BACKEND: str = "local"
+    BLOB_STORE_DIR: str = "app/uploads/blobs"
+    GRIDFS_BUCKET: str = "blob_files"
+    S3_ENDPOINT_URL: str = "http://localhost:9000"
+    S3_PUBLIC_ENDPOINT_URL: str = ""
+    S3_BUCKET: str = "pcc-pass"
+    S3_ACCESS_KEY: str = ""
+    S3_SECRET_KEY: str = ""
+    S3_REGION: str = "us-east-1"
+    # Uploads are spooled here before they reach a remote backend (empty = system temp dir)
+    UPLOAD_TEMP_DIR: str = ""
+    # Lifetime of direct download links (presigned URLs or signed /api/files links)
+    DOWNLOAD_LINK_TTL_SECONDS: int = 300
+    # Unreferenced blobs younger than this are never garbage-collected
+    BLOB_GC_GRACE_SECONDS: int = 3600
+    
+    # PAR downloads: "stream" serves bytes from Python; "x-accel-redirect" (nginx) or
+    # "x-sendfile" (Apache/lighttpd) hand the transfer to the fronting server after auth;
+    # "redirect" sends a 307 to a direct download link
+    PAR_DOWNLOAD_MODE: str = "stream"
+    # nginx `internal` location aliased to BLOB_STORE_DIR
+    PAR_ACCEL_REDIRECT_PREFIX: str = "/_protected/blobs/"
+    
+    # PAR previews - first-page thumbnail and page count, rendered in a process pool after upload
+    PREVIEW_WORKERS: int = 2
+    PREVIEW_MAX_PENDING: int = 64
+    PREVIEW_THUMBNAIL_WIDTH: int = 320
+    # A preview still "pending" after this long (node restarted mid-render) may be claimed again
+    PREVIEW_STALE_SECONDS: int = 600
+    
+    # Audit writer - entries are queued and written in batches by a background task;
+    # batches MongoDB rejects go to the spool file and are replayed later
+    AUDIT_QUEUE_MAX_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 0.5
+    AUDIT_SPOOL_FILE: str = "app/spool/audit_log.jsonl"
+    AUDIT_DRAIN_TIMEOUT_SECONDS: float = 10.0
+    # Rollup rebuilds leave alone the hours the writer may still be adding entries to
+    AUDIT_ROLLUP_SETTLE_SECONDS: int = 300
+    
+    # Audit retention - whole days older than the hot window are moved out of audit_logs
+    # into compressed archive chunks (audit_archive)
+    AUDIT_HOT_DAYS: int = 180
+    # Chunks belong to a fixed window of the day (should divide 1440), so reruns land in the
+    # same window; a busy window is split into chunks of at most AUDIT_ARCHIVE_BATCH_SIZE entries
+    AUDIT_ARCHIVE_CHUNK_MINUTES: int = 60
+    AUDIT_ARCHIVE_BATCH_SIZE: int = 5000
+    # 0 hours disables the background job
+    AUDIT_ARCHIVE_INTERVAL_HOURS: float = 24
+    
+    # Admin diagnostics endpoints (full-collection scans) - off by default
+    ENABLE_DIAGNOSTICS: bool = False
+    
     class Config:
         env_file = ".env"
 
@@ -1,10 +1,16 @@
 # backend/app/database.py
-from motor.motor_asyncio import AsyncIOMotorClient
+from typing import Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from beanie import init_beanie
+from pymongo import IndexModel
+from pymongo.errors import PyMongoError
 from app.config import settings
 from app.models.user import User
 from app.models.equipment import Equipment, Furniture
-from app.models.audit import AuditLog  # ✅ Add this
+from app.models.audit import AuditLog, AuditRollup, AuditArchiveChunk  # ✅ Add this
+from app.models.stats import InventoryCounters
+from app.models.blob import StoredBlob
+from app.models.indexes import INDEX_REGISTRY
 
 async def init_db():
     """Initialize database connection and collections"""
@@ -13,7 +19,7 @@ async def init_db():
     
     await init_beanie(
         database=database,
-        document_models=[User, Equipment, Furniture, AuditLog]  # ✅ Add AuditLog
+        document_models=[User, Equipment, Furniture, AuditLog, AuditRollup, AuditArchiveChunk, InventoryCounters, StoredBlob]
     )
     
     # Create indexes
@@ -21,9 +27,106 @@ async def init_db():
     await User.find_all().motor_collection.create_index("is_approved")
     await User.find_all().motor_collection.create_index("role")
     
-    # ✅ Add audit log indexes
-    await AuditLog.find_all().motor_collection.create_index("timestamp")
-    await AuditLog.find_all().motor_collection.create_index("user_id")
-    await AuditLog.find_all().motor_collection.create_index("resource_type")
+    # Audit log indexes are declared in AuditLog.Settings and built by init_beanie;
+    # inventory indexes come from the registry in app/models/indexes.py
+    await reconcile_indexes(database)
     
-    print("✅ Database initialized with indexes")
\ No newline at end of file
+    print("✅ Database initialized with indexes")
+
+
+def _index_signature(key, unique: bool, weights: Optional[Dict] = None) -> Tuple:
+    """Comparable identity of an index: its key pattern and uniqueness"""
+    items = list(key.items() if hasattr(key, "items") else key)
+    
+    if any(direction == "text" for _, direction in items):
+        # MongoDB reports text indexes as _fts/_ftsx keys; compare the weighted fields instead
+        text_fields = {field: 1 for field, direction in items if direction == "text" and field != "_fts"}
+        text_fields.update(weights or {})
+        return (("$text", tuple(sorted(text_fields.items()))), bool(unique))
+    
+    return (
+        tuple((field, int(direction) if isinstance(direction, (int, float)) else direction)
+              for field, direction in items),
+        bool(unique)
+    )
+
+
+async def reconcile_indexes(
+    database: AsyncIOMotorDatabase,
+    build: bool = True,
+    drop_extra: bool = False
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Compare INDEX_REGISTRY with the indexes that exist in MongoDB.
+
+    Args:
+        database: Database holding the inventory collections
+        build: Create missing indexes
+        drop_extra: Drop indexes that exist but are not declared
+
+    Returns:
+        Per-collection report of missing, extra, built, dropped and failed indexes
+    """
+    report = {}
+
+    for collection_name, declared in INDEX_REGISTRY.items():
+        collection = database[collection_name]
+        existing = await collection.index_information()
+        existing_signatures = {
+            _index_signature(info["key"], info.get("unique", False), info.get("weights")): name
+            for name, info in existing.items()
+        }
+
+        declared_by_signature: Dict[Tuple, IndexModel] = {
+            _index_signature(
+                index.document["key"], index.document.get("unique", False), index.document.get("weights")
+            ): index
+            for index in declared
+        }
+
+        missing = [
+            index for signature, index in declared_by_signature.items()
+            if signature not in existing_signatures
+        ]
+        extra = [
+            name for signature, name in existing_signatures.items()
+            if name != "_id_" and signature not in declared_by_signature
+        ]
+
+        result = {
+            "missing": [index.document["name"] for index in missing],
+            "extra": extra,
+            "built": [],
+            "dropped": [],
+            "failed": []
+        }
+
+        if drop_extra:
+            for name in extra:
+                try:
+                    await collection.drop_index(name)
+                    result["dropped"].append(name)
+                except PyMongoError as e:
+                    result["failed"].append(f"drop {name}: {e}")
+
+        if build:
+            for index in missing:
+                name = index.document["name"]
+                try:
+                    await collection.create_indexes([index])
+                    result["built"].append(name)
+                except PyMongoError as e:
+                    # e.g. duplicate property numbers blocking a unique index
+                    result["failed"].append(f"build {name}: {e}")
+
+        report[collection_name] = result
+
+        print(
+            f"📑 Indexes on {collection_name}: "
+            f"{len(result['missing'])} missing, {len(extra)} extra, "
+            f"{len(result['built'])} built, {len(result['dropped'])} dropped"
+        )
+        for failure in result["failed"]:
+            print(f"⚠️  {collection_name}: {failure}")
+
+    return report
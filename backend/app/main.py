@@ -1,17 +1,24 @@
 # backend/app/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 from contextlib import asynccontextmanager
-import os
+import asyncio
 
 from app.config import settings
+from app.database import reconcile_indexes
 from app.models.user import User
 from app.models.equipment import Equipment, Furniture
-from app.routes import auth, admin, equipment, furniture, audit
-from app.models.audit import AuditLog
+from app.routes import auth, admin, equipment, furniture, audit, files, me
+from app.models.audit import AuditLog, AuditRollup, AuditArchiveChunk
+from app.models.stats import InventoryCounters
+from app.models.blob import StoredBlob
+from app.utils.security import shutdown_password_hasher
+from app.storage import get_blob_store
+from app.services.preview_service import shutdown_preview_worker
+from app.services.audit_writer import audit_writer
+from app.services.audit_retention_service import start_audit_retention, shutdown_audit_retention
 
 
 @asynccontextmanager
@@ -23,22 +30,38 @@ async def lifespan(app: FastAPI):
     # Initialize beanie with ALL document models
     await init_beanie(
         database=database,
-        document_models=[User, Equipment, Furniture, AuditLog]
+        document_models=[User, Equipment, Furniture, AuditLog, AuditRollup, AuditArchiveChunk, InventoryCounters, StoredBlob]
     )
     
     print("✅ Connected to MongoDB")
     print(f"📦 Database: {settings.MONGODB_DB_NAME}")
-    print("📋 Collections initialized: users, equipment, furniture, audit_logs")
+    print("📋 Collections initialized: users, equipment, furniture, audit_logs, audit_rollups, audit_archive, inventory_counters, blobs")
     
-    # Create upload directories
-    os.makedirs("app/static/uploads/equipment_pars", exist_ok=True)
-    os.makedirs("app/static/uploads/furniture_pars", exist_ok=True)
-    os.makedirs("app/static/uploads/hr_files", exist_ok=True)
-    print("📁 Upload directories created")
+    # Reconcile inventory indexes in the background so startup isn't blocked by builds
+    index_task = None
+    if settings.RECONCILE_INDEXES_ON_STARTUP:
+        index_task = asyncio.create_task(reconcile_indexes(database))
+    
+    # Audit entries are written in batches by a background task
+    await audit_writer.start()
+    # Entries older than the hot window are moved to the compressed archive periodically
+    start_audit_retention()
+    
+    # Uploaded documents live in the configured store, not on this node's disk
+    blob_store = get_blob_store()
+    print(f"🗄️  Document store: {settings.STORAGE_BACKEND} ({type(blob_store).__name__})")
     
     yield
     
-    # Shutdown: Close MongoDB connection
+    # Shutdown: Stop background work and close MongoDB connection
+    if index_task is not None and not index_task.done():
+        index_task.cancel()
+    shutdown_password_hasher()
+    shutdown_preview_worker()
+    shutdown_audit_retention()
+    # Flush queued audit entries while MongoDB is still connected
+    await audit_writer.drain()
+    await blob_store.close()
     client.close()
     print("❌ Disconnected from MongoDB")
 
@@ -62,10 +85,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "Content-Disposition", "Content-Range", "Accept-Ranges"],
 )
 
-# Mount static files for uploads
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+# No /static mount: PAR documents are only served through the authenticated download endpoints
 
 # Include routers
 app.include_router(auth.router)
@@ -73,6 +96,8 @@ app.include_router(admin.router)
 app.include_router(equipment.router)
 app.include_router(furniture.router)
 app.include_router(audit.router)
+app.include_router(files.router)
+app.include_router(me.router)
 
 # Root endpoint
 @app.get("/")
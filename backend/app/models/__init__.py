@@ -1,6 +1,8 @@
 # backend/app/models/__init__.py
 from app.models.user import User
 from app.models.equipment import Equipment, Furniture
-from app.models.audit import AuditLog
+from app.models.audit import AuditLog, AuditRollup, AuditArchiveChunk
+from app.models.stats import InventoryCounters
+from app.models.blob import StoredBlob
 
-__all__ = ['User', 'Equipment', 'Furniture', 'AuditLog']
\ No newline at end of file
+__all__ = ['User', 'Equipment', 'Furniture', 'AuditLog', 'AuditRollup', 'AuditArchiveChunk', 'InventoryCounters', 'StoredBlob']
\ No newline at end of file
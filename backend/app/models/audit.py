@@ -1,8 +1,9 @@
 # backend/app/models/audit.py
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from beanie import Document
 from pydantic import Field
+from pymongo import IndexModel
 
 class AuditLog(Document):
     """Audit log for tracking all system changes"""
@@ -13,7 +14,7 @@ class AuditLog(Document):
     user_role: str = Field(..., description="Role of user (admin/user)")
     
     # What action was performed
-    action: str = Field(..., description="Action performed: CREATE, UPDATE, DELETE, ASSIGN, UNASSIGN, APPROVE, REJECT")
+    action: str = Field(..., description="Action performed: CREATE, UPDATE, DELETE, ASSIGN, UNASSIGN, TRANSFER, APPROVE, REJECT")
     
     # What resource was affected
     resource_type: str = Field(..., description="Type of resource: EQUIPMENT, FURNITURE, USER, HR_FILE")
@@ -40,9 +41,12 @@ class AuditLog(Document):
             "action",
             "resource_type",
             "resource_id",
-            "timestamp",
-            [("resource_type", 1), ("resource_id", 1)],  # Compound index
-            [("user_id", 1), ("timestamp", -1)],  # Compound index
+            # Keyset pages and exports are ordered by (timestamp, _id), newest first. The _id
+            # suffix lets that order come from the index; each still serves every query the
+            # shorter (timestamp), (resource_type, resource_id) and (user_id, timestamp) did
+            [("timestamp", -1), ("_id", -1)],
+            [("resource_type", 1), ("resource_id", 1), ("timestamp", -1), ("_id", -1)],  # Compound index
+            [("user_id", 1), ("timestamp", -1), ("_id", -1)],  # Compound index
         ]
     
     class Config:
@@ -68,4 +72,49 @@ class AuditLog(Document):
                     "assigned_to": "John Doe"
                 }
             }
-        }
\ No newline at end of file
+        }
+
+
+class AuditRollup(Document):
+    """Write-maintained audit counters - one document per UTC hour or day"""
+    
+    granularity: str = Field(..., description="Bucket size: hour or day")
+    bucket: datetime = Field(..., description="Start of the bucket (UTC)")
+    total: int = Field(default=0, description="Audit entries in the bucket")
+    by_action: Dict[str, int] = Field(default_factory=dict, description="Entry count per action")
+    by_resource_type: Dict[str, int] = Field(default_factory=dict, description="Entry count per resource type")
+    by_user: Dict[str, int] = Field(default_factory=dict, description="Entry count per user ID")
+    
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    class Settings:
+        name = "audit_rollups"
+        indexes = [
+            IndexModel([("granularity", 1), ("bucket", 1)], unique=True),
+        ]
+
+
+class AuditArchiveChunk(Document):
+    """Compressed audit entries moved out of audit_logs - up to AUDIT_ARCHIVE_BATCH_SIZE from one window of a UTC day"""
+    
+    day: datetime = Field(..., description="UTC day the entries belong to (the partition)")
+    batch_id: str = Field(..., description="Window start and sequence number, e.g. 2025-01-01T10:00/0002")
+    entries: int = Field(..., description="Number of entries in the chunk")
+    first_timestamp: datetime
+    last_timestamp: datetime
+    resources: List[str] = Field(default_factory=list, description="RESOURCE_TYPE:resource_id of every entry, for history lookups")
+    
+    # gzip-compressed NDJSON (MongoDB extended JSON, one entry per line)
+    data: bytes
+    size: int = Field(..., description="Compressed size in bytes")
+    sha256: str = Field(..., description="SHA-256 of data")
+    
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    class Settings:
+        name = "audit_archive"
+        indexes = [
+            IndexModel("batch_id", unique=True),
+            [("day", 1)],
+            [("resources", 1), ("last_timestamp", -1)],
+        ]
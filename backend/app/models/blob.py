@@ -0,0 +1,35 @@
+# backend/app/models/blob.py
+from datetime import datetime
+from typing import Dict, Optional
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+class StoredBlob(Document):
+    """Reference count for a content-addressed blob (PAR documents)"""
+    
+    digest: str = Field(..., description="SHA-256 of the content (hex)")
+    size: int = Field(..., description="Size in bytes")
+    content_type: str = Field(default="application/pdf", description="MIME type")
+    ref_count: int = Field(default=0, description="Number of items pointing at this blob")
+    
+    # Preview, generated in the background after upload (app/services/preview_service.py)
+    preview_status: Optional[str] = Field(None, description="pending, ready, failed or unavailable")
+    preview_started_at: Optional[datetime] = None
+    page_count: Optional[int] = None
+    pdf_metadata: Dict[str, str] = Field(default_factory=dict, description="Document Info (title, author, ...)")
+    thumbnail: Optional[bytes] = Field(None, description="First page, small WebP")
+    thumbnail_width: Optional[int] = None
+    thumbnail_height: Optional[int] = None
+    preview_error: Optional[str] = None
+    
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last reference change")
+    deleting_at: Optional[datetime] = Field(None, description="Set while garbage collection removes the bytes")
+    
+    class Settings:
+        name = "blobs"
+        indexes = [
+            IndexModel([("digest", ASCENDING)], unique=True),
+            [("ref_count", 1), ("updated_at", 1)],  # Garbage collection sweep
+        ]
@@ -1,7 +1,7 @@
 # backend/app/models/equipment.py
 from beanie import Document
 from pydantic import Field
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 EQUIPMENT_TYPES = [
@@ -37,6 +37,7 @@ class Equipment(Document):
     assigned_date: Optional[datetime] = Field(None, description="Date assigned")
     assignment_type: Optional[str] = Field(None, description="PAR or Job Order")  # NEW
     previous_recipient: Optional[str] = Field(None, description="Previous recipient")
+    custody_history: List[Dict] = Field(default_factory=list, description="Append-only log of custody transfers")
     
     # Status
     condition: str = Field(default="Good", description="Equipment condition")
@@ -45,6 +46,7 @@ class Equipment(Document):
     
     # PAR Document
     par_file_path: Optional[str] = Field(None, description="Path to PAR document")
+    par_sha256: Optional[str] = Field(None, description="SHA-256 of the PAR document in the blob store")
     par_number: Optional[str] = Field(None, description="PAR number")
     
     # Audit
@@ -54,6 +56,7 @@ class Equipment(Document):
     
     class Settings:
         name = "equipment"
+        # Indexes live in app/models/indexes.py (reconciled at startup)
 
 
 class Furniture(Document):
@@ -80,6 +83,8 @@ class Furniture(Document):
     assigned_date: Optional[datetime] = Field(None, description="Date assigned")
     assignment_type: Optional[str] = Field(None, description="PAR or Job Order")  # NEW
     location: Optional[str] = Field(None, description="Current location")
+    previous_recipient: Optional[str] = Field(None, description="Previous recipient")
+    custody_history: List[Dict] = Field(default_factory=list, description="Append-only log of custody transfers")
     
     # Status
     condition: str = Field(default="Good", description="Furniture condition")
@@ -88,6 +93,7 @@ class Furniture(Document):
     
     # PAR Document
     par_file_path: Optional[str] = Field(None, description="Path to PAR document")
+    par_sha256: Optional[str] = Field(None, description="SHA-256 of the PAR document in the blob store")
     par_number: Optional[str] = Field(None, description="PAR number")
     
     # Audit
@@ -97,6 +103,7 @@ class Furniture(Document):
     
     class Settings:
         name = "furniture"
+        # Indexes live in app/models/indexes.py (reconciled at startup)
 
 FURNITURE_TYPES = [
     "Office Chair", "Executive Chair", "Office Desk", "Conference Table",
@@ -0,0 +1,64 @@
+# backend/app/models/indexes.py
+"""
+Index registry for the inventory collections.
+
+These are NOT declared in the models' `Settings.indexes` (Beanie would build
+them synchronously inside `init_beanie`). Instead `app.database.reconcile_indexes`
+compares this registry with what exists in MongoDB, reports missing/extra
+indexes and builds the missing ones in the background.
+"""
+from typing import Dict, List
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+
+EQUIPMENT_INDEXES: List[IndexModel] = [
+    IndexModel([("property_number", ASCENDING)], unique=True),
+    IndexModel([("status", ASCENDING)]),
+    IndexModel([("assigned_to_user_id", ASCENDING)]),
+    IndexModel([("status", ASCENDING), ("equipment_type", ASCENDING)]),
+    IndexModel([("status", ASCENDING), ("property_number", ASCENDING)]),
+    IndexModel([("updated_at", DESCENDING)]),
+    # Search: prefix matching on identifiers + ranked full-text
+    IndexModel([("gsd_code", ASCENDING)]),
+    IndexModel([("serial_number", ASCENDING)]),
+    IndexModel(
+        [
+            ("property_number", TEXT), ("gsd_code", TEXT), ("serial_number", TEXT),
+            ("brand", TEXT), ("model", TEXT), ("specifications", TEXT),
+        ],
+        name="search_text",
+        default_language="none",
+        weights={
+            "property_number": 10, "gsd_code": 10, "serial_number": 10,
+            "brand": 5, "model": 5, "specifications": 1,
+        },
+    ),
+]
+
+FURNITURE_INDEXES: List[IndexModel] = [
+    IndexModel([("property_number", ASCENDING)], unique=True),
+    IndexModel([("status", ASCENDING)]),
+    IndexModel([("assigned_to_user_id", ASCENDING)]),
+    IndexModel([("status", ASCENDING), ("furniture_type", ASCENDING)]),
+    IndexModel([("status", ASCENDING), ("property_number", ASCENDING)]),
+    IndexModel([("updated_at", DESCENDING)]),
+    # Search: prefix matching on identifiers + ranked full-text
+    IndexModel([("gsd_code", ASCENDING)]),
+    IndexModel(
+        [
+            ("property_number", TEXT), ("gsd_code", TEXT), ("description", TEXT),
+            ("brand", TEXT), ("material", TEXT), ("color", TEXT),
+        ],
+        name="search_text",
+        default_language="none",
+        weights={
+            "property_number": 10, "gsd_code": 10,
+            "description": 5, "brand": 5, "material": 1, "color": 1,
+        },
+    ),
+]
+
+# Collection name -> declared indexes
+INDEX_REGISTRY: Dict[str, List[IndexModel]] = {
+    "equipment": EQUIPMENT_INDEXES,
+    "furniture": FURNITURE_INDEXES,
+}
@@ -0,0 +1,25 @@
+# backend/app/models/stats.py
+from datetime import datetime
+from typing import Dict
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel
+
+class InventoryCounters(Document):
+    """Write-maintained inventory breakdowns - one document per inventory kind"""
+    
+    kind: str = Field(..., description="Inventory kind: equipment or furniture")
+    total: int = Field(default=0, description="Total number of items")
+    by_status: Dict[str, int] = Field(default_factory=dict, description="Item count per status")
+    by_type: Dict[str, int] = Field(default_factory=dict, description="Item count per equipment/furniture type")
+    by_condition: Dict[str, int] = Field(default_factory=dict, description="Item count per condition")
+    version: int = Field(default=0, description="Bumped on every write to the inventory collection (ETags)")
+    
+    rebuilt_at: datetime = Field(default_factory=datetime.utcnow, description="Last full recount")
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    class Settings:
+        name = "inventory_counters"
+        indexes = [
+            IndexModel("kind", unique=True),
+        ]
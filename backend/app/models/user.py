@@ -1,8 +1,20 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from beanie import Document
 from pydantic import EmailStr, Field
 
+def format_full_name(first_name: str, middle_name: Optional[str], surname: str) -> str:
+    """Display name - the middle name is left out when there is none"""
+    if middle_name:
+        return f"{first_name} {middle_name} {surname}"
+    return f"{first_name} {surname}"
+
+
+def full_name_of(doc: Dict) -> str:
+    """User.full_name for a raw users document"""
+    return format_full_name(doc["first_name"], doc.get("middle_name"), doc["surname"])
+
+
 class User(Document):
     # Personal Information
     surname: str
@@ -35,10 +47,10 @@ class User(Document):
             "email",
             "is_approved",
             "role",
+            "created_at",
+            [("is_approved", 1), ("created_at", 1)],  # Pending-users listing
         ]
     
     @property
     def full_name(self) -> str:
-        if self.middle_name:
-            return f"{self.first_name} {self.middle_name} {self.surname}"
-        return f"{self.first_name} {self.surname}"
\ No newline at end of file
+        return format_full_name(self.first_name, self.middle_name, self.surname)
\ No newline at end of file
@@ -0,0 +1,78 @@
+# backend/app/repositories/asset_repository.py
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+
+from beanie import Document
+from bson import ObjectId
+from pydantic import BaseModel
+
+from app.repositories.pagination import find_page
+from app.utils.serialization import documents_to_rows
+
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+
+class AssetRepository:
+    """Projected, raw-document reads for equipment and furniture"""
+
+    @staticmethod
+    def response_projection(schema: Type[BaseModel]) -> Dict[str, int]:
+        """Mongo projection containing only the fields of a response schema"""
+        return {name: 1 for name in schema.model_fields if name != "id"}
+
+    @staticmethod
+    def to_response(schema: Type[SchemaType], doc: Dict) -> SchemaType:
+        """Build a response schema from a raw (projected) Mongo document"""
+        values = {name: doc.get(name) for name in schema.model_fields if name != "id"}
+        return schema(id=str(doc["_id"]), **values)
+
+    @staticmethod
+    def to_rows(schema: Type[BaseModel], docs: List[Dict]) -> List[Dict]:
+        """Reshape raw documents into response rows without model validation"""
+        return documents_to_rows(docs, AssetRepository.response_projection(schema))
+
+    @staticmethod
+    async def find_one_row(
+        document_model: Type[Document],
+        schema: Type[BaseModel],
+        item_id: str
+    ) -> Optional[Dict]:
+        """Response row of a single item by id, or None if it doesn't exist"""
+        if not ObjectId.is_valid(item_id):
+            return None
+        doc = await document_model.get_motor_collection().find_one(
+            {"_id": ObjectId(item_id)},
+            AssetRepository.response_projection(schema)
+        )
+        return AssetRepository.to_rows(schema, [doc])[0] if doc else None
+
+    @staticmethod
+    async def find_assigned_to(
+        document_model: Type[Document],
+        schema: Type[BaseModel],
+        user_id: str
+    ) -> List[Dict]:
+        """Response rows of items assigned to a user - served by the assigned_to_user_id index"""
+        cursor = document_model.get_motor_collection().find(
+            {"assigned_to_user_id": user_id},
+            AssetRepository.response_projection(schema)
+        )
+        return AssetRepository.to_rows(schema, await cursor.to_list(length=None))
+
+    @staticmethod
+    async def find_page(
+        document_model: Type[Document],
+        schema: Type[BaseModel],
+        query: Dict,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """A keyset page of response rows ordered by property number"""
+        docs, next_cursor = await find_page(
+            document_model.get_motor_collection(),
+            query,
+            "property_number",
+            limit,
+            cursor=cursor,
+            projection=AssetRepository.response_projection(schema)
+        )
+        return AssetRepository.to_rows(schema, docs), next_cursor
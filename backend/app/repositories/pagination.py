@@ -0,0 +1,61 @@
+# backend/app/repositories/pagination.py
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.utils.cursor import encode_cursor, decode_cursor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+async def find_page(
+    collection: AsyncIOMotorCollection,
+    query: Dict,
+    sort_field: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict] = None,
+    descending: bool = False
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Keyset (cursor) pagination ordered by (sort_field, _id)
+
+    Every page is a range scan starting right after the last item of the
+    previous page, so page N costs the same as page 1. Returns raw documents
+    and the cursor of the next page (None on the last page).
+    """
+    limit = min(limit, MAX_PAGE_SIZE)
+    direction = -1 if descending else 1
+    page_query = dict(query)
+
+    if cursor:
+        position = decode_cursor(cursor)
+        if position.get("s") != sort_field or "id" not in position:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor does not belong to this listing"
+            )
+        op = "$lt" if descending else "$gt"
+        after = {
+            "$or": [
+                {sort_field: {op: position["v"]}},
+                {sort_field: position["v"], "_id": {op: position["id"]}}
+            ]
+        }
+        page_query = {"$and": [query, after]} if query else after
+
+    docs = await collection.find(page_query, dict(projection) if projection else None) \
+        .sort([(sort_field, direction), ("_id", direction)]) \
+        .limit(limit + 1) \
+        .to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        last = docs[-1]
+        next_cursor = encode_cursor({"s": sort_field, "v": last.get(sort_field), "id": last["_id"]})
+
+    return docs, next_cursor
+
@@ -1,29 +1,50 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
-from app.models.user import User
-from app.schemas.user_schema import UserResponseSchema, PendingUserResponseSchema
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from typing import Optional
+from app.models.user import User, full_name_of
+from app.schemas.user_schema import UserResponseSchema, PendingUserPageSchema, UserPageSchema
 from app.utils.dependencies import get_current_admin
+from app.utils.user_cache import principal_cache
+from app.services.stats_service import InventoryStatsService
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, find_page
+from app.utils.serialization import RawJSONResponse, documents_to_rows
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
-@router.get("/pending-users", response_model=List[PendingUserResponseSchema])
-async def get_pending_users(current_admin: User = Depends(get_current_admin)):
-    """Get all users pending approval"""
-    pending_users = await User.find(User.is_approved == False).to_list()
+# Never read password hashes for listings
+USER_RESPONSE_PROJECTION = {
+    field: 1 for field in UserResponseSchema.model_fields if field != "id"
+}
+
+@router.get("/pending-users", response_model=PendingUserPageSchema)
+async def get_pending_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get users pending approval, oldest registration first (cursor-paginated)"""
+    docs, next_cursor = await find_page(
+        User.get_motor_collection(),
+        {"is_approved": False},
+        "created_at",
+        limit,
+        cursor=cursor,
+        projection=USER_RESPONSE_PROJECTION
+    )
     
-    return [
-        PendingUserResponseSchema(
-            id=str(user.id),
-            full_name=user.full_name,
-            email=user.email,
-            position=user.position,
-            salary_grade=user.salary_grade,
-            job_category=user.job_category,
-            assigned_unit=user.assigned_unit,
-            created_at=user.created_at
-        )
-        for user in pending_users
+    rows = [
+        {
+            "id": str(doc["_id"]),
+            "full_name": full_name_of(doc),
+            "email": doc["email"],
+            "position": doc["position"],
+            "salary_grade": doc["salary_grade"],
+            "job_category": doc["job_category"],
+            "assigned_unit": doc["assigned_unit"],
+            "created_at": doc["created_at"]
+        }
+        for doc in docs
     ]
+    return RawJSONResponse({"items": rows, "next_cursor": next_cursor})
 
 @router.put("/approve-user/{user_id}", response_model=UserResponseSchema)
 async def approve_user(user_id: str, current_admin: User = Depends(get_current_admin)):
@@ -44,6 +65,7 @@ async def approve_user(user_id: str, current_admin: User = Depends(get_current_a
     
     user.is_approved = True
     await user.save()
+    principal_cache.invalidate(str(user.id))
     
     return UserResponseSchema(
         id=str(user.id),
@@ -74,32 +96,29 @@ async def reject_user(user_id: str, current_admin: User = Depends(get_current_ad
         )
     
     await user.delete()
+    principal_cache.invalidate(str(user.id))
     return {"message": "User rejected and removed"}
 
-@router.get("/all-users", response_model=List[UserResponseSchema])
-async def get_all_users(current_admin: User = Depends(get_current_admin)):
-    """Get all users"""
-    users = await User.find_all().to_list()
+@router.get("/all-users", response_model=UserPageSchema)
+async def get_all_users(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get all users, oldest registration first (cursor-paginated)"""
+    docs, next_cursor = await find_page(
+        User.get_motor_collection(),
+        {},
+        "created_at",
+        limit,
+        cursor=cursor,
+        projection=USER_RESPONSE_PROJECTION
+    )
     
-    return [
-        UserResponseSchema(
-            id=str(user.id),
-            surname=user.surname,
-            first_name=user.first_name,
-            middle_name=user.middle_name,
-            email=user.email,
-            position=user.position,
-            salary_grade=user.salary_grade,
-            starting_date=user.starting_date,
-            job_category=user.job_category,
-            assigned_unit=user.assigned_unit,
-            role=user.role,
-            is_approved=user.is_approved,
-            is_active=user.is_active,
-            created_at=user.created_at
-        )
-        for user in users
-    ]
+    return RawJSONResponse({
+        "items": documents_to_rows(docs, USER_RESPONSE_PROJECTION),
+        "next_cursor": next_cursor
+    })
 
 @router.put("/deactivate-user/{user_id}")
 async def deactivate_user(user_id: str, current_admin: User = Depends(get_current_admin)):
@@ -120,5 +139,28 @@ async def deactivate_user(user_id: str, current_admin: User = Depends(get_curren
     
     user.is_active = False
     await user.save()
+    principal_cache.invalidate(str(user.id))
+    
+    return {"message": "User deactivated successfully"}
+
+@router.get("/principal-cache/stats")
+async def get_principal_cache_stats(current_admin: User = Depends(get_current_admin)):
+    """Get hit/miss counters of the authenticated-user cache"""
+    return principal_cache.stats()
+
+@router.get("/stats")
+async def get_dashboard_stats(
+    refresh: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get dashboard statistics (users + inventory counters) - Admin only"""
+    collection = User.get_motor_collection()
     
-    return {"message": "User deactivated successfully"}
\ No newline at end of file
+    return {
+        "users": {
+            "total": await collection.estimated_document_count(),
+            "pending_approvals": await collection.count_documents({"is_approved": False})
+        },
+        "equipment": await InventoryStatsService.get_stats("equipment", refresh=refresh),
+        "furniture": await InventoryStatsService.get_stats("furniture", refresh=refresh)
+    }
\ No newline at end of file
@@ -1,27 +1,39 @@
 # backend/app/routes/audit.py
 from fastapi import APIRouter, Depends, Query
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from datetime import datetime
 
+from app.config import settings
 from app.models.user import User
 from app.models.audit import AuditLog
-from app.schemas.audit_schema import AuditLogResponseSchema
+from app.schemas.audit_schema import AuditLogPageSchema, AuditLogResponseSchema, AuditRollupSeriesSchema
+from app.services.audit_service import AuditService
+from app.services.audit_rollup_service import AuditRollupService
+from app.services.audit_retention_service import AuditRetentionService
+from app.services.export_service import ExportService
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, find_page
 from app.utils.dependencies import get_current_admin
+from app.utils.serialization import RawJSONResponse, documents_to_rows
 
 router = APIRouter(prefix="/api/audit", tags=["Audit Logs"])
 
-@router.get("/", response_model=List[AuditLogResponseSchema])
-async def get_audit_logs(
-    limit: int = Query(100, ge=1, le=500),
+AUDIT_RESPONSE_PROJECTION = {
+    field: 1 for field in AuditLogResponseSchema.model_fields if field != "id"
+}
+
+# Compliance exports carry the full entry, including request context
+AUDIT_EXPORT_FIELDS = [
+    field for field in AuditLog.model_fields if field not in ("id", "revision_id")
+]
+
+
+def _audit_query(
     action: Optional[str] = None,
     resource_type: Optional[str] = None,
     user_id: Optional[str] = None,
     start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
-    current_admin: User = Depends(get_current_admin)
-):
-    """Get audit logs with filters - Admin only"""
-    
+    end_date: Optional[datetime] = None
+) -> Dict:
     query = {}
     
     if action:
@@ -40,57 +52,94 @@ async def get_audit_logs(
         if end_date:
             query["timestamp"]["$lte"] = end_date
     
-    logs = await AuditLog.find(query).sort(-AuditLog.timestamp).limit(limit).to_list()
+    return query
+
+
+def _page_response(logs: List[Dict], next_cursor: Optional[str]) -> RawJSONResponse:
+    return RawJSONResponse({
+        "items": documents_to_rows(logs, AUDIT_RESPONSE_PROJECTION),
+        "next_cursor": next_cursor
+    })
+
+
+async def _audit_page(query: Dict, limit: int, cursor: Optional[str]) -> RawJSONResponse:
+    """Newest first, keyset-paginated on (timestamp, _id)"""
+    logs, next_cursor = await find_page(
+        AuditLog.get_motor_collection(),
+        query,
+        "timestamp",
+        limit,
+        cursor=cursor,
+        projection=AUDIT_RESPONSE_PROJECTION,
+        descending=True
+    )
+    return _page_response(logs, next_cursor)
+
+
+@router.get("/", response_model=AuditLogPageSchema)
+async def get_audit_logs(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    user_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get audit logs with filters, newest first - Admin only
     
-    return [
-        AuditLogResponseSchema(
-            id=str(log.id),
-            user_id=log.user_id,
-            user_email=log.user_email,
-            user_role=log.user_role,
-            action=log.action,
-            resource_type=log.resource_type,
-            resource_id=log.resource_id,
-            resource_name=log.resource_name,
-            changes=log.changes,
-            old_values=log.old_values,
-            new_values=log.new_values,
-            timestamp=log.timestamp
-        )
-        for log in logs
-    ]
-
-
-@router.get("/resource/{resource_type}/{resource_id}", response_model=List[AuditLogResponseSchema])
+    Pass `next_cursor` back as `cursor` (with the same filters) to fetch the
+    next page; it is null on the last page.
+    """
+    query = _audit_query(action, resource_type, user_id, start_date, end_date)
+    return await _audit_page(query, limit, cursor)
+
+
+@router.get("/resource/{resource_type}/{resource_id}", response_model=AuditLogPageSchema)
 async def get_resource_history(
     resource_type: str,
     resource_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_archive: bool = False,
     current_admin: User = Depends(get_current_admin)
 ):
-    """Get complete history of a specific resource - Admin only"""
+    """Get the history of a specific resource, newest first and cursor-paginated - Admin only
     
-    logs = await AuditLog.find(
-        AuditLog.resource_type == resource_type.upper(),
-        AuditLog.resource_id == resource_id
-    ).sort(-AuditLog.timestamp).to_list()
+    Pass `next_cursor` back as `cursor` for the next page. With
+    include_archive, paging continues past the hot window into entries
+    moved to the audit archive.
+    """
+    if not include_archive:
+        query = {"resource_type": resource_type.upper(), "resource_id": resource_id}
+        return await _audit_page(query, limit, cursor)
     
-    return [
-        AuditLogResponseSchema(
-            id=str(log.id),
-            user_id=log.user_id,
-            user_email=log.user_email,
-            user_role=log.user_role,
-            action=log.action,
-            resource_type=log.resource_type,
-            resource_id=log.resource_id,
-            resource_name=log.resource_name,
-            changes=log.changes,
-            old_values=log.old_values,
-            new_values=log.new_values,
-            timestamp=log.timestamp
-        )
-        for log in logs
-    ]
+    logs, next_cursor = await AuditRetentionService.resource_history_page(
+        resource_type.upper(), resource_id, limit, cursor, projection=AUDIT_RESPONSE_PROJECTION
+    )
+    return _page_response(logs, next_cursor)
+
+
+@router.get("/export")
+async def export_audit_logs(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    user_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Stream filtered audit logs as NDJSON or CSV without loading them into memory - Admin only"""
+    return ExportService.stream_response(
+        AuditLog.get_motor_collection(),
+        _audit_query(action, resource_type, user_id, start_date, end_date),
+        AUDIT_EXPORT_FIELDS,
+        export_format,
+        filename=f"audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+        sort=[("timestamp", -1), ("_id", -1)]
+    )
 
 
 @router.get("/stats")
@@ -98,32 +147,36 @@ async def get_audit_stats(
     days: int = Query(30, ge=1, le=365),
     current_admin: User = Depends(get_current_admin)
 ):
-    """Get audit statistics - Admin only"""
-    
-    start_date = datetime.utcnow() - timedelta(days=days)
-    
-    logs = await AuditLog.find(
-        AuditLog.timestamp >= start_date
-    ).to_list()
-    
-    # Calculate stats
-    actions_count = {}
-    resource_types_count = {}
-    users_count = {}
-    
-    for log in logs:
-        actions_count[log.action] = actions_count.get(log.action, 0) + 1
-        resource_types_count[log.resource_type] = resource_types_count.get(log.resource_type, 0) + 1
-        users_count[log.user_email] = users_count.get(log.user_email, 0) + 1
-    
+    """Get audit statistics - Admin only (counted server-side in one aggregation)"""
+    return await AuditService.get_stats(days)
+
+
+@router.get("/rollups", response_model=AuditRollupSeriesSchema, response_model_exclude_none=True)
+async def get_audit_rollups(
+    granularity: str = Query("day", pattern="^(hour|day)$"),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_users: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Activity per UTC hour or day from the audit rollups - Admin only"""
+    return await AuditRollupService.get_buckets(granularity, start_date, end_date, include_users)
+
+
+@router.get("/rollups/summary")
+async def get_audit_rollup_summary(
+    days: int = Query(30, ge=1, le=366 * 5),
+    current_admin: User = Depends(get_current_admin)
+):
+    """Audit statistics over whole UTC days, read from the daily rollups - Admin only"""
+    return await AuditRollupService.get_summary(days)
+
+
+@router.get("/archive")
+async def get_audit_archive_manifest(current_admin: User = Depends(get_current_admin)):
+    """Archived audit days with entry counts and compressed size - Admin only"""
     return {
-        "total_actions": len(logs),
-        "date_range": {
-            "start": start_date,
-            "end": datetime.utcnow(),
-            "days": days
-        },
-        "actions_breakdown": actions_count,
-        "resource_types_breakdown": resource_types_count,
-        "most_active_users": dict(sorted(users_count.items(), key=lambda x: x[1], reverse=True)[:10])
-    }
\ No newline at end of file
+        "hot_days": settings.AUDIT_HOT_DAYS,
+        "cutoff": AuditRetentionService.cutoff(),
+        "days": await AuditRetentionService.manifest()
+    }
@@ -13,7 +13,7 @@ from app.schemas.user_schema import (
     UserResponseSchema,
     PendingUserResponseSchema
 )
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.utils.security import hash_password_async, verify_password_async, create_access_token
 from app.utils.dependencies import get_current_admin
 from app.config import settings
 
@@ -37,7 +37,7 @@ async def register_user(user_data: UserRegisterSchema):
         first_name=user_data.first_name,
         middle_name=user_data.middle_name,
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         position=user_data.position,
         salary_grade=user_data.salary_grade,
         starting_date=user_data.starting_date,
@@ -93,7 +93,7 @@ async def register_admin(admin_data: AdminRegisterSchema):
         first_name="System",
         middle_name=None,
         email=admin_data.email,
-        password_hash=hash_password(admin_data.password),
+        password_hash=await hash_password_async(admin_data.password),
         position="System Administrator",
         salary_grade="SG 30",
         starting_date=datetime.utcnow(),
@@ -138,7 +138,7 @@ async def login(login_data: UserLoginSchema):
         )
     
     # Verify password
-    if not verify_password(login_data.password, user.password_hash):
+    if not await verify_password_async(login_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
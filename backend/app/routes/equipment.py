@@ -1,25 +1,51 @@
 # backend/app/routes/equipment.py
 from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File
-from fastapi.responses import FileResponse
-import aiofiles
-import os
+from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query, Request
+from pymongo.errors import DuplicateKeyError
+import re
 
+from app.config import settings
 from app.models.user import User
-from app.models.equipment import Equipment, EQUIPMENT_TYPES, CONDITIONS, STATUSES
+from app.models.equipment import Equipment, EQUIPMENT_TYPES, CONDITIONS, STATUSES, ASSIGNMENT_TYPES
 from app.schemas.equipment_schema import (
     EquipmentCreateSchema,
     EquipmentUpdateSchema,
     EquipmentAssignSchema,
     EquipmentResponseSchema,
-    EquipmentTransferSchema
+    EquipmentTransferSchema,
+    EquipmentSearchResponseSchema,
+    EquipmentPageSchema,
+    EquipmentBulkAssignSchema,
+    CustodyHistorySchema,
+    BulkIdsSchema,
+    BulkStatusSchema,
+    BulkOperationResultSchema
 )
 from app.utils.dependencies import get_current_admin, get_current_user
 from app.services.audit_service import AuditService
+from app.repositories.asset_repository import AssetRepository
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.utils.serialization import RawJSONResponse
+from app.services.stats_service import InventoryStatsService
+from app.services.search_service import InventorySearchService
+from app.services.export_service import ExportService
+from app.services.import_service import ImportService
+from app.services.assignment_service import AssignmentService
+from app.services.document_service import ParDocumentService
+from app.services.preview_service import ParPreviewService
+from app.utils.http_cache import (
+    REFERENCE_DATA, make_etag, cacheable_json, not_modified_response, set_cache_validators
+)
 
 router = APIRouter(prefix="/api/equipment", tags=["Equipment"])
 
+# Reference lists are constants - hash them once
+ASSIGNMENT_TYPES_ETAG = make_etag("assignment_types", *ASSIGNMENT_TYPES)
+EQUIPMENT_TYPES_ETAG = make_etag("equipment_types", *EQUIPMENT_TYPES)
+CONDITIONS_ETAG = make_etag("conditions", *CONDITIONS)
+STATUSES_ETAG = make_etag("statuses", *STATUSES)
+
 
 # Add this debugging endpoint temporarily to check what's happening
 @router.get("/debug/my-info")
@@ -34,138 +60,137 @@ async def debug_my_info(current_user: User = Depends(get_current_user)):
 
 # ============ USER ROUTES - MUST BE BEFORE /{equipment_id} ROUTE ============
 @router.get("/my-equipment", response_model=List[EquipmentResponseSchema])
-async def get_my_equipment(current_user: User = Depends(get_current_user)):
+async def get_my_equipment(request: Request, current_user: User = Depends(get_current_user)):
     """Get equipment assigned to current user - USER ACCESS"""
+    # Any equipment write bumps the version, so an unchanged version means an unchanged list
+    version, last_modified = await InventoryStatsService.get_version("equipment")
+    etag = make_etag("my-equipment", current_user.id, version)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    
+    rows = await AssetRepository.find_assigned_to(
+        Equipment, EquipmentResponseSchema, str(current_user.id)
+    )
+    response = RawJSONResponse(rows)
+    set_cache_validators(response, etag, last_modified)
+    return response
+
+
+@router.get("/diagnostics/assignments")
+async def get_assignment_diagnostics(
+    user_id: str,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Diagnose why a user sees no equipment - Admin only, opt-in via ENABLE_DIAGNOSTICS"""
+    if not settings.ENABLE_DIAGNOSTICS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Diagnostics are disabled"
+        )
     
-    # Debug logging
-    user_id_str = str(current_user.id)
-    print(f"🔍 DEBUG - User requesting equipment:")
-    print(f"   Email: {current_user.email}")
-    print(f"   User ID: {user_id_str}")
-    print(f"   Role: {current_user.role}")
-    print(f"   Approved: {current_user.is_approved}")
-    
-    # Try to find ALL equipment first to debug
-    all_equipment = await Equipment.find_all().to_list()
-    print(f"📊 Total equipment in database: {len(all_equipment)}")
-    
-    # Show assigned equipment IDs
-    assigned_equipment = [eq for eq in all_equipment if eq.assigned_to_user_id]
-    print(f"📊 Total assigned equipment: {len(assigned_equipment)}")
-    for eq in assigned_equipment:
-        print(f"   - {eq.brand} {eq.model}: assigned_to_user_id = '{eq.assigned_to_user_id}'")
-    
-    # Now try the actual query
-    equipment_list = await Equipment.find(
-        Equipment.assigned_to_user_id == user_id_str
-    ).to_list()
-    
-    print(f"✅ Found {len(equipment_list)} equipment items for user {user_id_str}")
+    collection = Equipment.get_motor_collection()
+    exact_matches = await collection.count_documents({"assigned_to_user_id": user_id})
     
-    if len(equipment_list) == 0:
-        print("⚠️  No equipment found. Checking if there's a mismatch...")
-        # Check if any equipment has similar ID
-        for eq in all_equipment:
-            if eq.assigned_to_user_id and user_id_str in str(eq.assigned_to_user_id):
-                print(f"⚠️  Found similar: {eq.assigned_to_user_id} vs {user_id_str}")
+    # Full scan - IDs that contain the user ID but don't match exactly (whitespace, quoting, etc.)
+    similar_cursor = collection.find(
+        {
+            "assigned_to_user_id": {"$regex": re.escape(user_id), "$ne": user_id}
+        },
+        {"brand": 1, "model": 1, "property_number": 1, "assigned_to_user_id": 1}
+    ).limit(100)
     
-    return [
-        EquipmentResponseSchema(
-            id=str(eq.id),
-            property_number=eq.property_number,
-            gsd_code=eq.gsd_code,
-            item_number=eq.item_number,
-            equipment_type=eq.equipment_type,
-            brand=eq.brand,
-            model=eq.model,
-            serial_number=eq.serial_number,
-            specifications=eq.specifications,
-            acquisition_date=eq.acquisition_date,
-            acquisition_cost=eq.acquisition_cost,
-            assigned_to_user_id=eq.assigned_to_user_id,
-            assigned_to_name=eq.assigned_to_name,
-            assigned_date=eq.assigned_date,
-            assignment_type=eq.assignment_type,
-            previous_recipient=eq.previous_recipient,
-            condition=eq.condition,
-            status=eq.status,
-            remarks=eq.remarks,
-            par_file_path=eq.par_file_path,
-            par_number=eq.par_number,
-            created_by=eq.created_by,
-            created_at=eq.created_at,
-            updated_at=eq.updated_at
-        )
-        for eq in equipment_list
-    ]
+    return {
+        "user_id": user_id,
+        "total_equipment": await collection.estimated_document_count(),
+        "total_assigned": await collection.count_documents({"assigned_to_user_id": {"$ne": None}}),
+        "assigned_to_user": exact_matches,
+        "similar_assignments": [
+            {
+                "id": str(doc["_id"]),
+                "property_number": doc.get("property_number"),
+                "name": f"{doc.get('brand')} {doc.get('model')}",
+                "assigned_to_user_id": doc.get("assigned_to_user_id")
+            }
+            async for doc in similar_cursor
+        ]
+    }
 
 # ============ UTILITY ENDPOINTS - BEFORE PARAMETERIZED ROUTES ============
 @router.get("/assignment-types/list")
-async def get_assignment_types():
+async def get_assignment_types(request: Request):
     """Get list of assignment types"""
-    from app.models.equipment import ASSIGNMENT_TYPES
-    return {"assignment_types": ASSIGNMENT_TYPES}
+    return cacheable_json(
+        request, {"assignment_types": ASSIGNMENT_TYPES}, ASSIGNMENT_TYPES_ETAG,
+        cache_control=REFERENCE_DATA
+    )
 
 
 @router.get("/types/list")
-async def get_equipment_types():
+async def get_equipment_types(request: Request):
     """Get list of equipment types"""
-    return {"equipment_types": EQUIPMENT_TYPES}
+    return cacheable_json(
+        request, {"equipment_types": EQUIPMENT_TYPES}, EQUIPMENT_TYPES_ETAG,
+        cache_control=REFERENCE_DATA
+    )
 
 @router.get("/stats")
-async def get_equipment_stats(current_admin: User = Depends(get_current_admin)):
+async def get_equipment_stats(
+    refresh: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get equipment statistics from the inventory counters - Admin only"""
+    stats = await InventoryStatsService.get_stats("equipment", refresh=refresh)
+    by_status = stats["by_status"]
+    
     return {
-        "total": await Equipment.count(),
-        "available": await Equipment.find(Equipment.status == "Available").count(),
-        "assigned": await Equipment.find(Equipment.status == "Assigned").count(),
-        "under_repair": await Equipment.find(Equipment.status == "Under Repair").count()
+        "total": stats["total"],
+        "available": by_status.get("Available", 0),
+        "assigned": by_status.get("Assigned", 0),
+        "under_repair": by_status.get("Under Repair", 0),
+        "disposed": by_status.get("Disposed", 0),
+        "by_status": by_status,
+        "by_type": stats["by_type"],
+        "by_condition": stats["by_condition"],
+        "rebuilt_at": stats["rebuilt_at"]
     }
 
 @router.get("/conditions/list")
-async def get_conditions():
+async def get_conditions(request: Request):
     """Get list of equipment conditions"""
-    return {"conditions": CONDITIONS}
+    return cacheable_json(
+        request, {"conditions": CONDITIONS}, CONDITIONS_ETAG, cache_control=REFERENCE_DATA
+    )
 
 
 @router.get("/statuses/list")
-async def get_statuses():
+async def get_statuses(request: Request):
     """Get list of equipment statuses"""
-    return {"statuses": STATUSES}
+    return cacheable_json(
+        request, {"statuses": STATUSES}, STATUSES_ETAG, cache_control=REFERENCE_DATA
+    )
 
 
-@router.get("/available", response_model=List[EquipmentResponseSchema])
-async def get_available_equipment(current_admin: User = Depends(get_current_admin)):
-    """Get all available (unassigned) equipment - Admin only"""
-    equipment_list = await Equipment.find(Equipment.status == "Available").to_list()
-    
-    return [
-        EquipmentResponseSchema(
-            id=str(eq.id),
-            property_number=eq.property_number,
-            gsd_code=eq.gsd_code,
-            item_number=eq.item_number,
-            equipment_type=eq.equipment_type,
-            brand=eq.brand,
-            model=eq.model,
-            serial_number=eq.serial_number,
-            specifications=eq.specifications,
-            acquisition_date=eq.acquisition_date,
-            acquisition_cost=eq.acquisition_cost,
-            assigned_to_user_id=eq.assigned_to_user_id,
-            assigned_to_name=eq.assigned_to_name,
-            assigned_date=eq.assigned_date,
-            previous_recipient=eq.previous_recipient,
-            condition=eq.condition,
-            status=eq.status,
-            remarks=eq.remarks,
-            par_file_path=eq.par_file_path,
-            par_number=eq.par_number,
-            created_by=eq.created_by,
-            created_at=eq.created_at,
-            updated_at=eq.updated_at
-        )
-        for eq in equipment_list
-    ]
+@router.get("/available", response_model=EquipmentPageSchema)
+async def get_available_equipment(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get available (unassigned) equipment, cursor-paginated - Admin only"""
+    version, last_modified = await InventoryStatsService.get_version("equipment")
+    etag = make_etag("available-equipment", version, limit, cursor)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    
+    items, next_cursor = await AssetRepository.find_page(
+        Equipment, EquipmentResponseSchema, {"status": "Available"}, limit, cursor
+    )
+    response = RawJSONResponse({"items": items, "next_cursor": next_cursor})
+    set_cache_validators(response, etag, last_modified)
+    return response
 
 
 # ============ ADMIN ROUTES ============
@@ -203,7 +228,17 @@ async def create_equipment(
         created_by=current_admin.email
     )
     
-    await new_equipment.insert()
+    try:
+        await new_equipment.insert()
+    except DuplicateKeyError:
+        # Unique property_number index catches concurrent creates that passed the check above
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Property number already exists"
+        )
+    await InventoryStatsService.record_change(
+        "equipment", new=InventoryStatsService.snapshot("equipment", new_equipment)
+    )
 
     await AuditService.log_action(
     user=current_admin,
@@ -252,96 +287,192 @@ async def create_equipment(
     )
 
 
-@router.get("/", response_model=List[EquipmentResponseSchema])
+@router.post("/import")
+async def import_equipment(
+    file: UploadFile = File(...),
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    dry_run: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Bulk-create equipment from a CSV or NDJSON file - Admin only
+
+    Rows are validated like POST /api/equipment/; invalid rows and duplicate
+    property numbers are reported per line and the rest are inserted.
+    """
+    return await ImportService.import_file(
+        "equipment",
+        EquipmentCreateSchema,
+        file.file,
+        ImportService.resolve_format(file.filename, import_format),
+        current_admin,
+        dry_run=dry_run
+    )
+
+
+# Bulk routes must stay above /{equipment_id}/assign and /{equipment_id}/unassign
+@router.post("/bulk/assign", response_model=BulkOperationResultSchema)
+async def bulk_assign_equipment(
+    assign_data: EquipmentBulkAssignSchema,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Assign many equipment items to one user - Admin only (already assigned items are skipped)"""
+    return await AssignmentService.bulk_assign("equipment", assign_data, current_admin)
+
+
+@router.post("/bulk/unassign", response_model=BulkOperationResultSchema)
+async def bulk_unassign_equipment(
+    bulk_data: BulkIdsSchema,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Unassign many equipment items - Admin only (items that aren't assigned are skipped)"""
+    return await AssignmentService.bulk_unassign("equipment", bulk_data.ids, current_admin)
+
+
+@router.post("/bulk/status", response_model=BulkOperationResultSchema)
+async def bulk_set_equipment_status(
+    status_data: BulkStatusSchema,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Change the status of many unassigned equipment items - Admin only"""
+    return await AssignmentService.bulk_set_status(
+        "equipment", status_data.ids, status_data.status, current_admin
+    )
+
+
+@router.get("/", response_model=EquipmentPageSchema)
 async def get_all_equipment(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_admin: User = Depends(get_current_admin)
 ):
-    """Get all equipment with pagination - Admin only"""
-
-    # Fetch with pagination
-    equipment_list = (
-        await Equipment.find_all()
-        .skip(skip)
-        .limit(limit)
-        .to_list()
+    """Get all equipment, cursor-paginated - Admin only
+
+    Pages are ordered by property number; pass `next_cursor` back as
+    `cursor` to fetch the next page (it is null on the last page). Send the ETag back as
+    If-None-Match to get a 304 while nothing has been written.
+    """
+    version, last_modified = await InventoryStatsService.get_version("equipment")
+    etag = make_etag("equipment", version, limit, cursor)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    
+    items, next_cursor = await AssetRepository.find_page(
+        Equipment, EquipmentResponseSchema, {}, limit, cursor
     )
+    response = RawJSONResponse({"items": items, "next_cursor": next_cursor})
+    set_cache_validators(response, etag, last_modified)
+    return response
 
-    # Convert to response model
-    return [
-        EquipmentResponseSchema(
-            id=str(eq.id),
-            **eq.model_dump(exclude={"id"})   # Pydantic v2
-        )
-        for eq in equipment_list
-    ]
 
+@router.get("/export")
+async def export_equipment(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    equipment_type: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    current_admin: User = Depends(get_current_admin)
+):
+    """Stream equipment as NDJSON or CSV without loading it into memory - Admin only"""
+    query = {}
+    if equipment_type:
+        query["equipment_type"] = equipment_type
+    if status_filter:
+        query["status"] = status_filter
+    
+    return ExportService.stream_response(
+        Equipment.get_motor_collection(),
+        query,
+        list(AssetRepository.response_projection(EquipmentResponseSchema)),
+        export_format,
+        filename=f"equipment_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+        sort=[("property_number", 1)]
+    )
 
 
-@router.get("/search")
+@router.get("/search", response_model=EquipmentSearchResponseSchema)
 async def search_equipment(
-    query: str,
+    query: str = Query(..., min_length=1, max_length=100),
     equipment_type: Optional[str] = None,
-    status: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    limit: int = Query(25, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_admin: User = Depends(get_current_admin)
 ):
+    """Ranked search by identifiers, brand, model and specifications - Admin only"""
     filters = {}
     if equipment_type:
         filters["equipment_type"] = equipment_type
-    if status:
-        filters["status"] = status
-    # Add text search logic
+    if status_filter:
+        filters["status"] = status_filter
+    
+    items, next_cursor = await InventorySearchService.search(
+        Equipment, EquipmentResponseSchema, query.strip(), filters, limit, cursor
+    )
+    return EquipmentSearchResponseSchema(items=items, next_cursor=next_cursor)
 
 
 @router.get("/{equipment_id}", response_model=EquipmentResponseSchema)
 async def get_equipment(
     equipment_id: str,
+    request: Request,
     current_admin: User = Depends(get_current_admin)
 ):
     """Get single equipment by ID - Admin only"""
-    equipment = await Equipment.get(equipment_id)
+    row = await AssetRepository.find_one_row(Equipment, EquipmentResponseSchema, equipment_id)
     
-    if not equipment:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Equipment not found"
         )
     
-    return EquipmentResponseSchema(
-        id=str(equipment.id),
-        property_number=equipment.property_number,
-        gsd_code=equipment.gsd_code,
-        item_number=equipment.item_number,
-        equipment_type=equipment.equipment_type,
-        brand=equipment.brand,
-        model=equipment.model,
-        serial_number=equipment.serial_number,
-        specifications=equipment.specifications,
-        acquisition_date=equipment.acquisition_date,
-        acquisition_cost=equipment.acquisition_cost,
-        assigned_to_user_id=equipment.assigned_to_user_id,
-        assigned_to_name=equipment.assigned_to_name,
-        assigned_date=equipment.assigned_date,
-        previous_recipient=equipment.previous_recipient,
-        condition=equipment.condition,
-        status=equipment.status,
-        remarks=equipment.remarks,
-        par_file_path=equipment.par_file_path,
-        par_number=equipment.par_number,
-        created_by=equipment.created_by,
-        created_at=equipment.created_at,
-        updated_at=equipment.updated_at
-    )
+    etag = make_etag("equipment", row["id"], row["updated_at"])
+    return cacheable_json(request, row, etag, last_modified=row["updated_at"])
 
-@router.post("/{equipment_id}/transfer")
+@router.post("/{equipment_id}/transfer", response_model=EquipmentResponseSchema)
 async def transfer_equipment(
     equipment_id: str,
     transfer_data: EquipmentTransferSchema,
     current_admin: User = Depends(get_current_admin)
 ):
-    # Transfer from one user to another with history tracking
-    pass
+    """Transfer assigned equipment to another user in one atomic update - Admin only"""
+    before, equipment = await AssignmentService.transfer(
+        "equipment", EquipmentResponseSchema, equipment_id, transfer_data, current_admin
+    )
+    
+    await AuditService.log_action(
+        user=current_admin,
+        action="TRANSFER",
+        resource_type="EQUIPMENT",
+        resource_id=equipment["id"],
+        resource_name=f"{equipment['brand']} {equipment['model']}",
+        changes={
+            "assigned_to": transfer_data.new_user_name,
+            "previous_recipient": equipment["previous_recipient"],
+            "reason": transfer_data.transfer_reason
+        },
+        old_values={
+            "assigned_to": before.get("assigned_to_name"),
+            "assigned_to_user_id": before.get("assigned_to_user_id")
+        },
+        new_values={
+            "assigned_to": equipment["assigned_to_name"],
+            "assigned_to_user_id": equipment["assigned_to_user_id"],
+            "assignment_type": equipment["assignment_type"]
+        }
+    )
+    
+    return equipment
+
+
+@router.get("/{equipment_id}/custody", response_model=CustodyHistorySchema)
+async def get_equipment_custody(
+    equipment_id: str,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Custody transfers of one equipment item, oldest first - Admin only"""
+    return await AssignmentService.custody_history("equipment", equipment_id)
 
 
 @router.put("/{equipment_id}", response_model=EquipmentResponseSchema)
@@ -350,80 +481,31 @@ async def update_equipment(
     equipment_data: EquipmentUpdateSchema,
     current_admin: User = Depends(get_current_admin)
 ):
-    """Update equipment - Admin only"""
-    equipment = await Equipment.get(equipment_id)
-    
-    if not equipment:
+    """Update equipment - Admin only (writes only the fields sent)"""
+    update_data = equipment_data.dict(exclude_unset=True)
+    try:
+        before, equipment = await AssignmentService.update(
+            "equipment", EquipmentResponseSchema, equipment_id, update_data
+        )
+    except DuplicateKeyError:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Equipment not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Property number already exists"
         )
-    
-        # ✅ CAPTURE OLD VALUES
-    old_values = {
-        "property_number": equipment.property_number,
-        "equipment_type": equipment.equipment_type,
-        "brand": equipment.brand,
-        "model": equipment.model,
-        "status": equipment.status,
-        "condition": equipment.condition
-    }
-
-    # Update fields
-    update_data = equipment_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(equipment, field, value)
-    
-    equipment.updated_at = datetime.utcnow()
-    await equipment.save()
-
-        # ✅ CAPTURE NEW VALUES
-    new_values = {
-        "property_number": equipment.property_number,
-        "equipment_type": equipment.equipment_type,
-        "brand": equipment.brand,
-        "model": equipment.model,
-        "status": equipment.status,
-        "condition": equipment.condition
-    }
 
-        # ✅ ADD AUDIT LOG
+    audited = ["property_number", "equipment_type", "brand", "model", "status", "condition"]
     await AuditService.log_action(
         user=current_admin,
         action="UPDATE",
         resource_type="EQUIPMENT",
-        resource_id=str(equipment.id),
-        resource_name=f"{equipment.brand} {equipment.model}",
+        resource_id=equipment["id"],
+        resource_name=f"{equipment['brand']} {equipment['model']}",
         changes=update_data,
-        old_values=old_values,
-        new_values=new_values
+        old_values={field: before.get(field) for field in audited},
+        new_values={field: equipment[field] for field in audited}
     )
     
-    return EquipmentResponseSchema(
-        id=str(equipment.id),
-        property_number=equipment.property_number,
-        gsd_code=equipment.gsd_code,
-        item_number=equipment.item_number,
-        equipment_type=equipment.equipment_type,
-        brand=equipment.brand,
-        model=equipment.model,
-        serial_number=equipment.serial_number,
-        specifications=equipment.specifications,
-        acquisition_date=equipment.acquisition_date,
-        acquisition_cost=equipment.acquisition_cost,
-        assigned_to_user_id=equipment.assigned_to_user_id,
-        assigned_to_name=equipment.assigned_to_name,
-        assigned_date=equipment.assigned_date,
-        previous_recipient=equipment.previous_recipient,
-        condition=equipment.condition,
-        status=equipment.status,
-        remarks=equipment.remarks,
-        par_file_path=equipment.par_file_path,
-        par_number=equipment.par_number,
-        created_by=equipment.created_by,
-        created_at=equipment.created_at,
-        updated_at=equipment.updated_at
-    )
+    return equipment
 
 
 @router.delete("/{equipment_id}")
@@ -440,6 +522,8 @@ async def delete_equipment(
             detail="Equipment not found"
         )
     
+    old_snapshot = InventoryStatsService.snapshot("equipment", equipment)
+    
     # Check if equipment is assigned
     if equipment.status == "Assigned":
         raise HTTPException(
@@ -451,6 +535,8 @@ async def delete_equipment(
     equipment_info = f"{equipment.brand} {equipment.model} ({equipment.property_number})"
     
     await equipment.delete()
+    await InventoryStatsService.record_change("equipment", old=old_snapshot)
+    await ParDocumentService.release(equipment.par_sha256)
     # ✅ ADD AUDIT LOG
     await AuditService.log_action(
         user=current_admin,
@@ -476,85 +562,30 @@ async def assign_equipment(
     assign_data: EquipmentAssignSchema,
     current_admin: User = Depends(get_current_admin)
 ):
-    """Assign equipment to user - Admin only"""
-    equipment = await Equipment.get(equipment_id)
-    
-    if not equipment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Equipment not found"
-        )
-    
-    # Check if already assigned
-    if equipment.status == "Assigned":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Equipment is already assigned. Please unassign first or transfer."
-        )
-    
-    # Validate assignment type
-    if assign_data.assignment_type not in ["PAR", "Job Order"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Assignment type must be either 'PAR' or 'Job Order'"
-        )
-    
-    # Validate PAR number for PAR assignments
-    if assign_data.assignment_type == "PAR" and not assign_data.par_number:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="PAR number is required for PAR assignments"
-        )
-    
-    # Verify user exists
-    user = await User.get(assign_data.assigned_to_user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    # Assign equipment
-    equipment.assigned_to_user_id = assign_data.assigned_to_user_id
-    equipment.assigned_to_name = assign_data.assigned_to_name
-    equipment.assigned_date = assign_data.assigned_date
-    equipment.assignment_type = assign_data.assignment_type  # NEW
-    equipment.previous_recipient = assign_data.previous_recipient
-    equipment.par_number = assign_data.par_number if assign_data.assignment_type == "PAR" else None
-    equipment.status = "Assigned"
-    equipment.updated_at = datetime.utcnow()
-    
-    # ✅ CAPTURE OLD STATE
-    old_status = equipment.status
-    old_assigned = equipment.assigned_to_name
-    
-    # Assign equipment
-    equipment.assigned_to_user_id = assign_data.assigned_to_user_id
-    equipment.assigned_to_name = assign_data.assigned_to_name
-    equipment.assigned_date = assign_data.assigned_date
-    equipment.assignment_type = assign_data.assignment_type
-    equipment.previous_recipient = assign_data.previous_recipient
-    equipment.par_number = assign_data.par_number if assign_data.assignment_type == "PAR" else None
-    equipment.status = "Assigned"
-    equipment.updated_at = datetime.utcnow()
-    
-    await equipment.save()
+    """Assign equipment to user - Admin only
+
+    A single conditional update: if two admins assign the same item at
+    once, only one succeeds and the other gets "already assigned".
+    """
+    before, equipment = await AssignmentService.assign(
+        "equipment", EquipmentResponseSchema, equipment_id, assign_data
+    )
     
     # ✅ ADD AUDIT LOG
     await AuditService.log_action(
         user=current_admin,
         action="ASSIGN",
         resource_type="EQUIPMENT",
-        resource_id=str(equipment.id),
-        resource_name=f"{equipment.brand} {equipment.model}",
+        resource_id=equipment["id"],
+        resource_name=f"{equipment['brand']} {equipment['model']}",
         changes={
             "assigned_to": assign_data.assigned_to_name,
             "assignment_type": assign_data.assignment_type,
             "status": "Assigned"
         },
         old_values={
-            "status": old_status,
-            "assigned_to": old_assigned
+            "status": before["status"],
+            "assigned_to": before.get("assigned_to_name")
         },
         new_values={
             "status": "Assigned",
@@ -563,32 +594,7 @@ async def assign_equipment(
         }
     )
     
-    return EquipmentResponseSchema(
-        id=str(equipment.id),
-        property_number=equipment.property_number,
-        gsd_code=equipment.gsd_code,
-        item_number=equipment.item_number,
-        equipment_type=equipment.equipment_type,
-        brand=equipment.brand,
-        model=equipment.model,
-        serial_number=equipment.serial_number,
-        specifications=equipment.specifications,
-        acquisition_date=equipment.acquisition_date,
-        acquisition_cost=equipment.acquisition_cost,
-        assigned_to_user_id=equipment.assigned_to_user_id,
-        assigned_to_name=equipment.assigned_to_name,
-        assigned_date=equipment.assigned_date,
-        assignment_type=equipment.assignment_type,  # NEW
-        previous_recipient=equipment.previous_recipient,
-        condition=equipment.condition,
-        status=equipment.status,
-        remarks=equipment.remarks,
-        par_file_path=equipment.par_file_path,
-        par_number=equipment.par_number,
-        created_by=equipment.created_by,
-        created_at=equipment.created_at,
-        updated_at=equipment.updated_at
-    )
+    return equipment
 
 @router.post("/{equipment_id}/unassign", response_model=EquipmentResponseSchema)
 async def unassign_equipment(
@@ -596,52 +602,8 @@ async def unassign_equipment(
     current_admin: User = Depends(get_current_admin)
 ):
     """Unassign equipment from user - Admin only"""
-    equipment = await Equipment.get(equipment_id)
-    
-    if not equipment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Equipment not found"
-        )
-    
-    # Store previous recipient
-    if equipment.assigned_to_name:
-        equipment.previous_recipient = equipment.assigned_to_name
-    
-    # Unassign
-    equipment.assigned_to_user_id = None
-    equipment.assigned_to_name = None
-    equipment.assigned_date = None
-    equipment.status = "Available"
-    equipment.updated_at = datetime.utcnow()
-    
-    await equipment.save()
-    
-    return EquipmentResponseSchema(
-        id=str(equipment.id),
-        property_number=equipment.property_number,
-        gsd_code=equipment.gsd_code,
-        item_number=equipment.item_number,
-        equipment_type=equipment.equipment_type,
-        brand=equipment.brand,
-        model=equipment.model,
-        serial_number=equipment.serial_number,
-        specifications=equipment.specifications,
-        acquisition_date=equipment.acquisition_date,
-        acquisition_cost=equipment.acquisition_cost,
-        assigned_to_user_id=equipment.assigned_to_user_id,
-        assigned_to_name=equipment.assigned_to_name,
-        assigned_date=equipment.assigned_date,
-        previous_recipient=equipment.previous_recipient,
-        condition=equipment.condition,
-        status=equipment.status,
-        remarks=equipment.remarks,
-        par_file_path=equipment.par_file_path,
-        par_number=equipment.par_number,
-        created_by=equipment.created_by,
-        created_at=equipment.created_at,
-        updated_at=equipment.updated_at
-    )
+    _, equipment = await AssignmentService.unassign("equipment", EquipmentResponseSchema, equipment_id, current_admin)
+    return equipment
 
 
 # ============ FILE UPLOAD (PAR DOCUMENTS) ============
@@ -652,86 +614,53 @@ async def upload_par_document(
     file: UploadFile = File(...),
     current_admin: User = Depends(get_current_admin)
 ):
-    
-        # Add file size limit (e.g., 10MB)
-    MAX_FILE_SIZE = 10 * 1024 * 1024
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="File too large. Maximum size is 10MB"
-        )
-    
-    """Upload PAR document for equipment - Admin only"""
-    equipment = await Equipment.get(equipment_id)
-    
-    if not equipment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Equipment not found"
-        )
-    
-    # Validate file type
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only PDF files are allowed"
-        )
-    
-    # Create upload directory
-    upload_dir = "app/static/uploads/equipment_pars"
-    os.makedirs(upload_dir, exist_ok=True)
-    
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{equipment.property_number}_{timestamp}.pdf"
-    file_path = os.path.join(upload_dir, filename)
-    
-    # Save file
-    async with aiofiles.open(file_path, 'wb') as f:
-        content = await file.read()
-        await f.write(content)
-    
-    # Update equipment
-    equipment.par_file_path = file_path
-    equipment.updated_at = datetime.utcnow()
-    await equipment.save()
-    
-    return {
-        "message": "PAR document uploaded successfully",
-        "file_path": file_path
-    }
+    """Upload PAR document for equipment - Admin only (PDF, streamed to disk, size-capped)
+
+    Documents are stored by content hash, so one PAR covering several items
+    is kept once no matter how many times it is uploaded.
+    """
+    result = await ParDocumentService.attach("equipment", equipment_id, file)
+    # Thumbnail and page count are rendered off the request path
+    ParPreviewService.schedule(result["sha256"])
+    return result
 
 
 @router.get("/{equipment_id}/download-par")
 async def download_par_document(
     equipment_id: str,
+    request: Request,
+    v: Optional[str] = Query(None, description="Document SHA-256 - makes the response cacheable for a year"),
     current_user: User = Depends(get_current_user)
 ):
-    """Download PAR document - User or Admin"""
-    equipment = await Equipment.get(equipment_id)
-    
-    if not equipment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Equipment not found"
-        )
-    
-    # Check if user has access (assigned to them or admin)
-    if current_user.role != "admin" and equipment.assigned_to_user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this PAR document"
-        )
-    
-    if not equipment.par_file_path or not os.path.exists(equipment.par_file_path):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="PAR document not found"
-        )
-    
-    return FileResponse(
-        path=equipment.par_file_path,
-        filename=f"PAR_{equipment.property_number}.pdf",
-        media_type="application/pdf"
-    )
\ No newline at end of file
+    """Download PAR document - User or Admin (supports Range and conditional requests)"""
+    return await ParDocumentService.download("equipment", equipment_id, request, current_user, version=v)
+
+
+@router.get("/{equipment_id}/par-link")
+async def get_par_document_link(
+    equipment_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """Time-limited direct download link for the PAR document - User or Admin"""
+    return await ParDocumentService.link("equipment", equipment_id, request, current_user)
+
+
+@router.get("/{equipment_id}/par-preview")
+async def get_par_document_preview(
+    equipment_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """PAR page count, metadata and thumbnail link (no PDF download) - User or Admin"""
+    return await ParPreviewService.get_preview("equipment", equipment_id, current_user)
+
+
+@router.get("/{equipment_id}/par-thumbnail")
+async def get_par_document_thumbnail(
+    equipment_id: str,
+    request: Request,
+    v: Optional[str] = Query(None, description="Document SHA-256 - makes the response cacheable for a year"),
+    current_user: User = Depends(get_current_user)
+):
+    """First-page thumbnail of the PAR document (WebP) - User or Admin"""
+    return await ParPreviewService.thumbnail("equipment", equipment_id, request, current_user, version=v)
\ No newline at end of file
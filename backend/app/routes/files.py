@@ -0,0 +1,12 @@
+# backend/app/routes/files.py
+from fastapi import APIRouter, Request
+
+from app.services.file_link_service import FileLinkService
+
+router = APIRouter(prefix="/api/files", tags=["Files"])
+
+
+@router.get("/{token}", name="download_signed_file")
+async def download_signed_file(token: str, request: Request):
+    """Download through a signed direct link - the link is the credential (supports Range)"""
+    return await FileLinkService.serve_link(request, token)
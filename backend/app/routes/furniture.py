@@ -1,67 +1,66 @@
 # backend/app/routes/furniture.py
 from datetime import datetime
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File
-from fastapi.responses import FileResponse
-import aiofiles
-import os
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query, Request
+from pymongo.errors import DuplicateKeyError
 
 from app.models.user import User
-from app.models.equipment import Furniture, FURNITURE_TYPES, CONDITIONS, STATUSES
+from app.models.equipment import Furniture, FURNITURE_TYPES, CONDITIONS, STATUSES, ASSIGNMENT_TYPES
 from app.schemas.equipment_schema import (
     FurnitureCreateSchema,
     FurnitureUpdateSchema,
     FurnitureAssignSchema,
-    FurnitureResponseSchema
+    FurnitureTransferSchema,
+    FurnitureResponseSchema,
+    FurnitureSearchResponseSchema,
+    FurniturePageSchema,
+    FurnitureBulkAssignSchema,
+    CustodyHistorySchema,
+    BulkIdsSchema,
+    BulkStatusSchema,
+    BulkOperationResultSchema
 )
 from app.utils.dependencies import get_current_admin, get_current_user
+from app.services.audit_service import AuditService
+from app.repositories.asset_repository import AssetRepository
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.utils.serialization import RawJSONResponse
+from app.services.stats_service import InventoryStatsService
+from app.services.search_service import InventorySearchService
+from app.services.export_service import ExportService
+from app.services.import_service import ImportService
+from app.services.assignment_service import AssignmentService
+from app.services.document_service import ParDocumentService
+from app.services.preview_service import ParPreviewService
+from app.utils.http_cache import (
+    REFERENCE_DATA, make_etag, cacheable_json, not_modified_response, set_cache_validators
+)
 
 # INITIALIZE ROUTER
 router = APIRouter(prefix="/api/furniture", tags=["Furniture"])
 
+# Reference lists are constants - hash them once
+FURNITURE_TYPES_ETAG = make_etag("furniture_types", *FURNITURE_TYPES)
+ASSIGNMENT_TYPES_ETAG = make_etag("assignment_types", *ASSIGNMENT_TYPES)
+
 # ============ USER ROUTES ============
 
 @router.get("/my-furniture", response_model=List[FurnitureResponseSchema])
-async def get_my_furniture(current_user: User = Depends(get_current_user)):
+async def get_my_furniture(request: Request, current_user: User = Depends(get_current_user)):
     """Get furniture assigned to current user - USER ACCESS"""
-    print(f"🔍 User requesting furniture: {current_user.email}, ID: {current_user.id}")
-    
-    furniture_list = await Furniture.find(
-        Furniture.assigned_to_user_id == str(current_user.id)
-    ).to_list()
-    
-    print(f"✅ Found {len(furniture_list)} furniture items for user")
-    
-    return [
-        FurnitureResponseSchema(
-            id=str(fur.id),
-            property_number=fur.property_number,
-            gsd_code=fur.gsd_code,
-            item_number=fur.item_number,
-            furniture_type=fur.furniture_type,
-            description=fur.description,
-            brand=fur.brand,
-            material=fur.material,
-            color=fur.color,
-            dimensions=fur.dimensions,
-            acquisition_date=fur.acquisition_date,
-            acquisition_cost=fur.acquisition_cost,
-            assigned_to_user_id=fur.assigned_to_user_id,
-            assigned_to_name=fur.assigned_to_name,
-            assigned_date=fur.assigned_date,
-            assignment_type=fur.assignment_type,  # ADDED
-            location=fur.location,
-            condition=fur.condition,
-            status=fur.status,
-            remarks=fur.remarks,
-            par_file_path=fur.par_file_path,
-            par_number=fur.par_number,
-            created_by=fur.created_by,
-            created_at=fur.created_at,
-            updated_at=fur.updated_at
-        )
-        for fur in furniture_list
-    ]
+    # Any furniture write bumps the version, so an unchanged version means an unchanged list
+    version, last_modified = await InventoryStatsService.get_version("furniture")
+    etag = make_etag("my-furniture", current_user.id, version)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    
+    rows = await AssetRepository.find_assigned_to(
+        Furniture, FurnitureResponseSchema, str(current_user.id)
+    )
+    response = RawJSONResponse(rows)
+    set_cache_validators(response, etag, last_modified)
+    return response
 
 
 # ============ ADMIN ROUTES ============
@@ -100,7 +99,17 @@ async def create_furniture(
         created_by=current_admin.email
     )
     
-    await new_furniture.insert()
+    try:
+        await new_furniture.insert()
+    except DuplicateKeyError:
+        # Unique property_number index catches concurrent creates that passed the check above
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Property number already exists"
+        )
+    await InventoryStatsService.record_change(
+        "furniture", new=InventoryStatsService.snapshot("furniture", new_furniture)
+    )
     
     return FurnitureResponseSchema(
         id=str(new_furniture.id),
@@ -131,121 +140,239 @@ async def create_furniture(
     )
 
 
-@router.get("/", response_model=List[FurnitureResponseSchema])
-async def get_all_furniture(current_admin: User = Depends(get_current_admin)):
-    """Get all furniture - Admin only"""
-    furniture_list = await Furniture.find_all().to_list()
-    
-    return [
-        FurnitureResponseSchema(
-            id=str(fur.id),
-            property_number=fur.property_number,
-            gsd_code=fur.gsd_code,
-            item_number=fur.item_number,
-            furniture_type=fur.furniture_type,
-            description=fur.description,
-            brand=fur.brand,
-            material=fur.material,
-            color=fur.color,
-            dimensions=fur.dimensions,
-            acquisition_date=fur.acquisition_date,
-            acquisition_cost=fur.acquisition_cost,
-            assigned_to_user_id=fur.assigned_to_user_id,
-            assigned_to_name=fur.assigned_to_name,
-            assigned_date=fur.assigned_date,
-            assignment_type=fur.assignment_type,  # ADDED
-            location=fur.location,
-            condition=fur.condition,
-            status=fur.status,
-            remarks=fur.remarks,
-            par_file_path=fur.par_file_path,
-            par_number=fur.par_number,
-            created_by=fur.created_by,
-            created_at=fur.created_at,
-            updated_at=fur.updated_at
-        )
-        for fur in furniture_list
-    ]
+@router.post("/import")
+async def import_furniture(
+    file: UploadFile = File(...),
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    dry_run: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Bulk-create furniture from a CSV or NDJSON file - Admin only
+
+    Rows are validated like POST /api/furniture/; invalid rows and duplicate
+    property numbers are reported per line and the rest are inserted.
+    """
+    return await ImportService.import_file(
+        "furniture",
+        FurnitureCreateSchema,
+        file.file,
+        ImportService.resolve_format(file.filename, import_format),
+        current_admin,
+        dry_run=dry_run
+    )
+
+
+# Bulk routes must stay above /{furniture_id}/assign and /{furniture_id}/unassign
+@router.post("/bulk/assign", response_model=BulkOperationResultSchema)
+async def bulk_assign_furniture(
+    assign_data: FurnitureBulkAssignSchema,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Assign many furniture items to one user - Admin only (already assigned items are skipped)"""
+    return await AssignmentService.bulk_assign("furniture", assign_data, current_admin)
 
 
-@router.get("/available", response_model=List[FurnitureResponseSchema])
-async def get_available_furniture(current_admin: User = Depends(get_current_admin)):
-    """Get all available (unassigned) furniture - Admin only"""
-    furniture_list = await Furniture.find(Furniture.status == "Available").to_list()
+@router.post("/bulk/unassign", response_model=BulkOperationResultSchema)
+async def bulk_unassign_furniture(
+    bulk_data: BulkIdsSchema,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Unassign many furniture items - Admin only (items that aren't assigned are skipped)"""
+    return await AssignmentService.bulk_unassign("furniture", bulk_data.ids, current_admin)
+
+
+@router.post("/bulk/status", response_model=BulkOperationResultSchema)
+async def bulk_set_furniture_status(
+    status_data: BulkStatusSchema,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Change the status of many unassigned furniture items - Admin only"""
+    return await AssignmentService.bulk_set_status(
+        "furniture", status_data.ids, status_data.status, current_admin
+    )
+
+
+@router.get("/", response_model=FurniturePageSchema)
+async def get_all_furniture(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get all furniture, cursor-paginated - Admin only
+
+    Pages are ordered by property number; pass `next_cursor` back as
+    `cursor` to fetch the next page (it is null on the last page). Send the ETag back as
+    If-None-Match to get a 304 while nothing has been written.
+    """
+    version, last_modified = await InventoryStatsService.get_version("furniture")
+    etag = make_etag("furniture", version, limit, cursor)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    
+    items, next_cursor = await AssetRepository.find_page(
+        Furniture, FurnitureResponseSchema, {}, limit, cursor
+    )
+    response = RawJSONResponse({"items": items, "next_cursor": next_cursor})
+    set_cache_validators(response, etag, last_modified)
+    return response
+
+
+@router.get("/available", response_model=FurniturePageSchema)
+async def get_available_furniture(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get available (unassigned) furniture, cursor-paginated - Admin only"""
+    version, last_modified = await InventoryStatsService.get_version("furniture")
+    etag = make_etag("available-furniture", version, limit, cursor)
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    
+    items, next_cursor = await AssetRepository.find_page(
+        Furniture, FurnitureResponseSchema, {"status": "Available"}, limit, cursor
+    )
+    response = RawJSONResponse({"items": items, "next_cursor": next_cursor})
+    set_cache_validators(response, etag, last_modified)
+    return response
+
+
+@router.get("/stats")
+async def get_furniture_stats(
+    refresh: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Get furniture statistics from the inventory counters - Admin only"""
+    stats = await InventoryStatsService.get_stats("furniture", refresh=refresh)
+    by_status = stats["by_status"]
     
-    return [
-        FurnitureResponseSchema(
-            id=str(fur.id),
-            property_number=fur.property_number,
-            gsd_code=fur.gsd_code,
-            item_number=fur.item_number,
-            furniture_type=fur.furniture_type,
-            description=fur.description,
-            brand=fur.brand,
-            material=fur.material,
-            color=fur.color,
-            dimensions=fur.dimensions,
-            acquisition_date=fur.acquisition_date,
-            acquisition_cost=fur.acquisition_cost,
-            assigned_to_user_id=fur.assigned_to_user_id,
-            assigned_to_name=fur.assigned_to_name,
-            assigned_date=fur.assigned_date,
-            assignment_type=fur.assignment_type,  # ADDED
-            location=fur.location,
-            condition=fur.condition,
-            status=fur.status,
-            remarks=fur.remarks,
-            par_file_path=fur.par_file_path,
-            par_number=fur.par_number,
-            created_by=fur.created_by,
-            created_at=fur.created_at,
-            updated_at=fur.updated_at
-        )
-        for fur in furniture_list
-    ]
+    return {
+        "total": stats["total"],
+        "available": by_status.get("Available", 0),
+        "assigned": by_status.get("Assigned", 0),
+        "under_repair": by_status.get("Under Repair", 0),
+        "disposed": by_status.get("Disposed", 0),
+        "by_status": by_status,
+        "by_type": stats["by_type"],
+        "by_condition": stats["by_condition"],
+        "rebuilt_at": stats["rebuilt_at"]
+    }
+
+
+@router.get("/export")
+async def export_furniture(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    furniture_type: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    current_admin: User = Depends(get_current_admin)
+):
+    """Stream furniture as NDJSON or CSV without loading it into memory - Admin only"""
+    query = {}
+    if furniture_type:
+        query["furniture_type"] = furniture_type
+    if status_filter:
+        query["status"] = status_filter
+    
+    return ExportService.stream_response(
+        Furniture.get_motor_collection(),
+        query,
+        list(AssetRepository.response_projection(FurnitureResponseSchema)),
+        export_format,
+        filename=f"furniture_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+        sort=[("property_number", 1)]
+    )
+
+
+@router.get("/search", response_model=FurnitureSearchResponseSchema)
+async def search_furniture(
+    query: str = Query(..., min_length=1, max_length=100),
+    furniture_type: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    limit: int = Query(25, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Ranked search by identifiers, description, brand, material and color - Admin only"""
+    filters = {}
+    if furniture_type:
+        filters["furniture_type"] = furniture_type
+    if status_filter:
+        filters["status"] = status_filter
+    
+    items, next_cursor = await InventorySearchService.search(
+        Furniture, FurnitureResponseSchema, query.strip(), filters, limit, cursor
+    )
+    return FurnitureSearchResponseSchema(items=items, next_cursor=next_cursor)
 
 
 @router.get("/{furniture_id}", response_model=FurnitureResponseSchema)
 async def get_furniture(
     furniture_id: str,
+    request: Request,
     current_admin: User = Depends(get_current_admin)
 ):
     """Get single furniture by ID - Admin only"""
-    furniture = await Furniture.get(furniture_id)
+    row = await AssetRepository.find_one_row(Furniture, FurnitureResponseSchema, furniture_id)
     
-    if not furniture:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Furniture not found"
         )
     
-    return FurnitureResponseSchema(
-        id=str(furniture.id),
-        property_number=furniture.property_number,
-        gsd_code=furniture.gsd_code,
-        item_number=furniture.item_number,
-        furniture_type=furniture.furniture_type,
-        description=furniture.description,
-        brand=furniture.brand,
-        material=furniture.material,
-        color=furniture.color,
-        dimensions=furniture.dimensions,
-        acquisition_date=furniture.acquisition_date,
-        acquisition_cost=furniture.acquisition_cost,
-        assigned_to_user_id=furniture.assigned_to_user_id,
-        assigned_to_name=furniture.assigned_to_name,
-        assigned_date=furniture.assigned_date,
-        assignment_type=furniture.assignment_type,  # ADDED
-        location=furniture.location,
-        condition=furniture.condition,
-        status=furniture.status,
-        remarks=furniture.remarks,
-        par_file_path=furniture.par_file_path,
-        par_number=furniture.par_number,
-        created_by=furniture.created_by,
-        created_at=furniture.created_at,
-        updated_at=furniture.updated_at
+    etag = make_etag("furniture", row["id"], row["updated_at"])
+    return cacheable_json(request, row, etag, last_modified=row["updated_at"])
+
+
+@router.post("/{furniture_id}/transfer", response_model=FurnitureResponseSchema)
+async def transfer_furniture(
+    furniture_id: str,
+    transfer_data: FurnitureTransferSchema,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Transfer assigned furniture to another user in one atomic update - Admin only"""
+    before, furniture = await AssignmentService.transfer(
+        "furniture", FurnitureResponseSchema, furniture_id, transfer_data, current_admin
     )
+    
+    await AuditService.log_action(
+        user=current_admin,
+        action="TRANSFER",
+        resource_type="FURNITURE",
+        resource_id=furniture["id"],
+        resource_name=furniture["description"],
+        changes={
+            "assigned_to": transfer_data.new_user_name,
+            "previous_recipient": furniture["previous_recipient"],
+            "reason": transfer_data.transfer_reason
+        },
+        old_values={
+            "assigned_to": before.get("assigned_to_name"),
+            "assigned_to_user_id": before.get("assigned_to_user_id"),
+            "location": before.get("location")
+        },
+        new_values={
+            "assigned_to": furniture["assigned_to_name"],
+            "assigned_to_user_id": furniture["assigned_to_user_id"],
+            "assignment_type": furniture["assignment_type"],
+            "location": furniture["location"]
+        }
+    )
+    
+    return furniture
+
+
+@router.get("/{furniture_id}/custody", response_model=CustodyHistorySchema)
+async def get_furniture_custody(
+    furniture_id: str,
+    current_admin: User = Depends(get_current_admin)
+):
+    """Custody transfers of one furniture item, oldest first - Admin only"""
+    return await AssignmentService.custody_history("furniture", furniture_id)
 
 
 @router.put("/{furniture_id}", response_model=FurnitureResponseSchema)
@@ -254,50 +381,19 @@ async def update_furniture(
     furniture_data: FurnitureUpdateSchema,
     current_admin: User = Depends(get_current_admin)
 ):
-    """Update furniture - Admin only"""
-    furniture = await Furniture.get(furniture_id)
-    
-    if not furniture:
+    """Update furniture - Admin only (writes only the fields sent)"""
+    update_data = furniture_data.dict(exclude_unset=True)
+    try:
+        _, furniture = await AssignmentService.update(
+            "furniture", FurnitureResponseSchema, furniture_id, update_data
+        )
+    except DuplicateKeyError:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Furniture not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Property number already exists"
         )
     
-    # Update fields
-    update_data = furniture_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(furniture, field, value)
-    
-    furniture.updated_at = datetime.utcnow()
-    await furniture.save()
-    
-    return FurnitureResponseSchema(
-        id=str(furniture.id),
-        property_number=furniture.property_number,
-        gsd_code=furniture.gsd_code,
-        item_number=furniture.item_number,
-        furniture_type=furniture.furniture_type,
-        description=furniture.description,
-        brand=furniture.brand,
-        material=furniture.material,
-        color=furniture.color,
-        dimensions=furniture.dimensions,
-        acquisition_date=furniture.acquisition_date,
-        acquisition_cost=furniture.acquisition_cost,
-        assigned_to_user_id=furniture.assigned_to_user_id,
-        assigned_to_name=furniture.assigned_to_name,
-        assigned_date=furniture.assigned_date,
-        assignment_type=furniture.assignment_type,  # ADDED
-        location=furniture.location,
-        condition=furniture.condition,
-        status=furniture.status,
-        remarks=furniture.remarks,
-        par_file_path=furniture.par_file_path,
-        par_number=furniture.par_number,
-        created_by=furniture.created_by,
-        created_at=furniture.created_at,
-        updated_at=furniture.updated_at
-    )
+    return furniture
 
 
 @router.delete("/{furniture_id}")
@@ -314,6 +410,8 @@ async def delete_furniture(
             detail="Furniture not found"
         )
     
+    old_snapshot = InventoryStatsService.snapshot("furniture", furniture)
+    
     # Check if furniture is assigned
     if furniture.status == "Assigned":
         raise HTTPException(
@@ -322,6 +420,8 @@ async def delete_furniture(
         )
     
     await furniture.delete()
+    await InventoryStatsService.record_change("furniture", old=old_snapshot)
+    await ParDocumentService.release(furniture.par_sha256)
     return {"message": "Furniture deleted successfully"}
 
 
@@ -331,83 +431,11 @@ async def assign_furniture(
     assign_data: FurnitureAssignSchema,
     current_admin: User = Depends(get_current_admin)
 ):
-    """Assign furniture to user - Admin only"""
-    furniture = await Furniture.get(furniture_id)
-    
-    if not furniture:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Furniture not found"
-        )
-    
-    # Check if already assigned
-    if furniture.status == "Assigned":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Furniture is already assigned. Please unassign first or transfer."
-        )
-    
-    # Validate assignment type
-    if assign_data.assignment_type not in ["PAR", "Job Order"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Assignment type must be either 'PAR' or 'Job Order'"
-        )
-    
-    # Validate PAR number for PAR assignments
-    if assign_data.assignment_type == "PAR" and not assign_data.par_number:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="PAR number is required for PAR assignments"
-        )
-    
-    # Verify user exists
-    user = await User.get(assign_data.assigned_to_user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    # Assign furniture
-    furniture.assigned_to_user_id = assign_data.assigned_to_user_id
-    furniture.assigned_to_name = assign_data.assigned_to_name
-    furniture.assigned_date = assign_data.assigned_date
-    furniture.assignment_type = assign_data.assignment_type  # ADDED
-    furniture.location = assign_data.location
-    furniture.par_number = assign_data.par_number if assign_data.assignment_type == "PAR" else None
-    furniture.status = "Assigned"
-    furniture.updated_at = datetime.utcnow()
-    
-    await furniture.save()
-    
-    return FurnitureResponseSchema(
-        id=str(furniture.id),
-        property_number=furniture.property_number,
-        gsd_code=furniture.gsd_code,
-        item_number=furniture.item_number,
-        furniture_type=furniture.furniture_type,
-        description=furniture.description,
-        brand=furniture.brand,
-        material=furniture.material,
-        color=furniture.color,
-        dimensions=furniture.dimensions,
-        acquisition_date=furniture.acquisition_date,
-        acquisition_cost=furniture.acquisition_cost,
-        assigned_to_user_id=furniture.assigned_to_user_id,
-        assigned_to_name=furniture.assigned_to_name,
-        assigned_date=furniture.assigned_date,
-        assignment_type=furniture.assignment_type,  # ADDED
-        location=furniture.location,
-        condition=furniture.condition,
-        status=furniture.status,
-        remarks=furniture.remarks,
-        par_file_path=furniture.par_file_path,
-        par_number=furniture.par_number,
-        created_by=furniture.created_by,
-        created_at=furniture.created_at,
-        updated_at=furniture.updated_at
+    """Assign furniture to user - Admin only (one conditional update, safe under concurrency)"""
+    _, furniture = await AssignmentService.assign(
+        "furniture", FurnitureResponseSchema, furniture_id, assign_data
     )
+    return furniture
 
 
 @router.post("/{furniture_id}/unassign", response_model=FurnitureResponseSchema)
@@ -416,53 +444,8 @@ async def unassign_furniture(
     current_admin: User = Depends(get_current_admin)
 ):
     """Unassign furniture from user - Admin only"""
-    furniture = await Furniture.get(furniture_id)
-    
-    if not furniture:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Furniture not found"
-        )
-    
-    # Unassign
-    furniture.assigned_to_user_id = None
-    furniture.assigned_to_name = None
-    furniture.assigned_date = None
-    furniture.assignment_type = None  # ADDED
-    furniture.location = None
-    furniture.par_number = None  # Clear PAR number on unassign
-    furniture.status = "Available"
-    furniture.updated_at = datetime.utcnow()
-    
-    await furniture.save()
-    
-    return FurnitureResponseSchema(
-        id=str(furniture.id),
-        property_number=furniture.property_number,
-        gsd_code=furniture.gsd_code,
-        item_number=furniture.item_number,
-        furniture_type=furniture.furniture_type,
-        description=furniture.description,
-        brand=furniture.brand,
-        material=furniture.material,
-        color=furniture.color,
-        dimensions=furniture.dimensions,
-        acquisition_date=furniture.acquisition_date,
-        acquisition_cost=furniture.acquisition_cost,
-        assigned_to_user_id=furniture.assigned_to_user_id,
-        assigned_to_name=furniture.assigned_to_name,
-        assigned_date=furniture.assigned_date,
-        assignment_type=furniture.assignment_type,  # ADDED
-        location=furniture.location,
-        condition=furniture.condition,
-        status=furniture.status,
-        remarks=furniture.remarks,
-        par_file_path=furniture.par_file_path,
-        par_number=furniture.par_number,
-        created_by=furniture.created_by,
-        created_at=furniture.created_at,
-        updated_at=furniture.updated_at
-    )
+    _, furniture = await AssignmentService.unassign("furniture", FurnitureResponseSchema, furniture_id, current_admin)
+    return furniture
 
 
 # ============ FILE UPLOAD (PAR DOCUMENTS) ============
@@ -473,92 +456,74 @@ async def upload_par_document(
     file: UploadFile = File(...),
     current_admin: User = Depends(get_current_admin)
 ):
-    """Upload PAR document for furniture - Admin only"""
-    furniture = await Furniture.get(furniture_id)
-    
-    if not furniture:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Furniture not found"
-        )
-    
-    # Validate file type
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only PDF files are allowed"
-        )
-    
-    # Create upload directory
-    upload_dir = "app/static/uploads/furniture_pars"
-    os.makedirs(upload_dir, exist_ok=True)
-    
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{furniture.property_number}_{timestamp}.pdf"
-    file_path = os.path.join(upload_dir, filename)
-    
-    # Save file
-    async with aiofiles.open(file_path, 'wb') as f:
-        content = await file.read()
-        await f.write(content)
-    
-    # Update furniture
-    furniture.par_file_path = file_path
-    furniture.updated_at = datetime.utcnow()
-    await furniture.save()
-    
-    return {
-        "message": "PAR document uploaded successfully",
-        "file_path": file_path
-    }
+    """Upload PAR document for furniture - Admin only (PDF, streamed to disk, size-capped)
+
+    Documents are stored by content hash, so one PAR covering several items
+    is kept once no matter how many times it is uploaded.
+    """
+    result = await ParDocumentService.attach("furniture", furniture_id, file)
+    # Thumbnail and page count are rendered off the request path
+    ParPreviewService.schedule(result["sha256"])
+    return result
 
 
 @router.get("/{furniture_id}/download-par")
 async def download_par_document(
     furniture_id: str,
+    request: Request,
+    v: Optional[str] = Query(None, description="Document SHA-256 - makes the response cacheable for a year"),
     current_user: User = Depends(get_current_user)
 ):
-    """Download PAR document - User or Admin"""
-    furniture = await Furniture.get(furniture_id)
-    
-    if not furniture:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Furniture not found"
-        )
-    
-    # Check if user has access (assigned to them or admin)
-    if current_user.role != "admin" and furniture.assigned_to_user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this PAR document"
-        )
-    
-    if not furniture.par_file_path or not os.path.exists(furniture.par_file_path):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="PAR document not found"
-        )
-    
-    return FileResponse(
-        path=furniture.par_file_path,
-        filename=f"PAR_{furniture.property_number}.pdf",
-        media_type="application/pdf"
-    )
+    """Download PAR document - User or Admin (supports Range and conditional requests)"""
+    return await ParDocumentService.download("furniture", furniture_id, request, current_user, version=v)
 
 
 # ============ UTILITY ENDPOINTS ============
 
 @router.get("/types/list")
-async def get_furniture_types():
+async def get_furniture_types(request: Request):
     """Get list of furniture types"""
-    return {"furniture_types": FURNITURE_TYPES}
+    return cacheable_json(
+        request, {"furniture_types": FURNITURE_TYPES}, FURNITURE_TYPES_ETAG,
+        cache_control=REFERENCE_DATA
+    )
 
 
 # Add endpoint to get assignment types
 @router.get("/assignment-types/list")
-async def get_assignment_types():
+async def get_assignment_types(request: Request):
     """Get list of assignment types"""
-    from app.models.equipment import ASSIGNMENT_TYPES
-    return {"assignment_types": ASSIGNMENT_TYPES}
\ No newline at end of file
+    return cacheable_json(
+        request, {"assignment_types": ASSIGNMENT_TYPES}, ASSIGNMENT_TYPES_ETAG,
+        cache_control=REFERENCE_DATA
+    )
+
+
+@router.get("/{furniture_id}/par-link")
+async def get_par_document_link(
+    furniture_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """Time-limited direct download link for the PAR document - User or Admin"""
+    return await ParDocumentService.link("furniture", furniture_id, request, current_user)
+
+
+@router.get("/{furniture_id}/par-preview")
+async def get_par_document_preview(
+    furniture_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """PAR page count, metadata and thumbnail link (no PDF download) - User or Admin"""
+    return await ParPreviewService.get_preview("furniture", furniture_id, current_user)
+
+
+@router.get("/{furniture_id}/par-thumbnail")
+async def get_par_document_thumbnail(
+    furniture_id: str,
+    request: Request,
+    v: Optional[str] = Query(None, description="Document SHA-256 - makes the response cacheable for a year"),
+    current_user: User = Depends(get_current_user)
+):
+    """First-page thumbnail of the PAR document (WebP) - User or Admin"""
+    return await ParPreviewService.thumbnail("furniture", furniture_id, request, current_user, version=v)
\ No newline at end of file
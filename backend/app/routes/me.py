@@ -0,0 +1,51 @@
+# backend/app/routes/me.py
+import asyncio
+
+from fastapi import APIRouter, Depends, Request
+
+from app.models.user import User
+from app.models.equipment import Equipment, Furniture
+from app.schemas.equipment_schema import EquipmentResponseSchema, FurnitureResponseSchema, MyAssetsSchema
+from app.utils.dependencies import get_current_user
+from app.repositories.asset_repository import AssetRepository
+from app.services.stats_service import InventoryStatsService
+from app.utils.serialization import RawJSONResponse
+from app.utils.http_cache import make_etag, not_modified_response, set_cache_validators
+
+router = APIRouter(prefix="/api/me", tags=["Me"])
+
+
+@router.get("/assets", response_model=MyAssetsSchema)
+async def get_my_assets(request: Request, current_user: User = Depends(get_current_user)):
+    """Equipment and furniture assigned to the current user, in one request - USER ACCESS"""
+    user_id = str(current_user.id)
+
+    # Both collection versions must match for the client's copy to be current
+    (equipment_version, equipment_modified), (furniture_version, furniture_modified) = await asyncio.gather(
+        InventoryStatsService.get_version("equipment"),
+        InventoryStatsService.get_version("furniture")
+    )
+    etag = make_etag("my-assets", user_id, equipment_version, furniture_version)
+    last_modified = max(
+        (modified for modified in (equipment_modified, furniture_modified) if modified is not None),
+        default=None
+    )
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    equipment, furniture = await asyncio.gather(
+        AssetRepository.find_assigned_to(Equipment, EquipmentResponseSchema, user_id),
+        AssetRepository.find_assigned_to(Furniture, FurnitureResponseSchema, user_id)
+    )
+    response = RawJSONResponse({
+        "equipment": equipment,
+        "furniture": furniture,
+        "counts": {
+            "equipment": len(equipment),
+            "furniture": len(furniture),
+            "total": len(equipment) + len(furniture)
+        }
+    })
+    set_cache_validators(response, etag, last_modified)
+    return response
@@ -1,6 +1,6 @@
 # backend/app/schemas/audit_schema.py
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 class AuditLogResponseSchema(BaseModel):
@@ -15,4 +15,21 @@ class AuditLogResponseSchema(BaseModel):
     changes: Dict
     old_values: Optional[Dict]
     new_values: Optional[Dict]
-    timestamp: datetime
\ No newline at end of file
+    timestamp: datetime
+
+class AuditLogPageSchema(BaseModel):
+    items: List[AuditLogResponseSchema]
+    next_cursor: Optional[str] = None
+
+class AuditRollupBucketSchema(BaseModel):
+    bucket: datetime
+    total: int
+    by_action: Dict[str, int]
+    by_resource_type: Dict[str, int]
+    by_user: Optional[Dict[str, int]] = None
+
+class AuditRollupSeriesSchema(BaseModel):
+    granularity: str
+    start: datetime
+    end: datetime
+    buckets: List[AuditRollupBucketSchema]
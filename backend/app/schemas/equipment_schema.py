@@ -1,6 +1,6 @@
 # backend/app/schemas/equipment_schema.py
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, validator
 
 # ============ EQUIPMENT SCHEMAS ============
@@ -67,11 +67,23 @@ class EquipmentResponseSchema(BaseModel):
     status: str
     remarks: Optional[str]
     par_file_path: Optional[str]
+    par_sha256: Optional[str] = None  # Version for cacheable download-par?v= links
     par_number: Optional[str]
     created_by: str
     created_at: datetime
     updated_at: datetime
 
+class EquipmentBulkAssignSchema(EquipmentAssignSchema):
+    ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+class EquipmentSearchResponseSchema(BaseModel):
+    items: List[EquipmentResponseSchema]
+    next_cursor: Optional[str] = None
+
+class EquipmentPageSchema(BaseModel):
+    items: List[EquipmentResponseSchema]
+    next_cursor: Optional[str] = None
+
 class EquipmentTransferSchema(BaseModel):
     new_user_id: str
     new_user_name: str
@@ -127,6 +139,10 @@ class FurnitureAssignSchema(BaseModel):
     par_number: Optional[str] = None
 
 
+class FurnitureBulkAssignSchema(FurnitureAssignSchema):
+    ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+
 class FurnitureResponseSchema(BaseModel):
     id: str
     property_number: str
@@ -144,12 +160,87 @@ class FurnitureResponseSchema(BaseModel):
     assigned_to_name: Optional[str]
     assigned_date: Optional[datetime]
     assignment_type: Optional[str] = None  # CHANGED: Made optional with default None
+    previous_recipient: Optional[str] = None
     location: Optional[str]
     condition: str
     status: str
     remarks: Optional[str]
     par_file_path: Optional[str]
+    par_sha256: Optional[str] = None  # Version for cacheable download-par?v= links
     par_number: Optional[str]
     created_by: str
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+
+class FurnitureSearchResponseSchema(BaseModel):
+    items: List[FurnitureResponseSchema]
+    next_cursor: Optional[str] = None
+
+
+class FurniturePageSchema(BaseModel):
+    items: List[FurnitureResponseSchema]
+    next_cursor: Optional[str] = None
+
+
+class FurnitureTransferSchema(BaseModel):
+    new_user_id: str
+    new_user_name: str
+    transfer_date: datetime
+    transfer_reason: Optional[str] = None
+    previous_recipient: Optional[str] = None
+    assignment_type: Optional[str] = None
+    par_number: Optional[str] = None
+    location: Optional[str] = None
+
+
+class CustodyEntrySchema(BaseModel):
+    from_user_id: Optional[str] = None
+    from_name: Optional[str] = None
+    to_user_id: str
+    to_name: str
+    transfer_date: datetime
+    reason: Optional[str] = None
+    transferred_by: str
+    recorded_at: datetime
+
+
+class CustodyHistorySchema(BaseModel):
+    id: str
+    property_number: str
+    current_holder: Optional[str] = None
+    custody_history: List[CustodyEntrySchema]
+
+
+# ============ BULK OPERATION SCHEMAS ============
+
+class BulkIdsSchema(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkStatusSchema(BulkIdsSchema):
+    status: str
+
+
+class BulkSkippedSchema(BaseModel):
+    id: str
+    reason: str
+
+
+class BulkOperationResultSchema(BaseModel):
+    succeeded: List[str]
+    skipped: List[BulkSkippedSchema]
+
+
+# ============ MY ASSETS SCHEMAS ============
+
+class AssetCountsSchema(BaseModel):
+    equipment: int
+    furniture: int
+    total: int
+
+
+class MyAssetsSchema(BaseModel):
+    equipment: List[EquipmentResponseSchema]
+    furniture: List[FurnitureResponseSchema]
+    counts: AssetCountsSchema
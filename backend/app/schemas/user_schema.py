@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field, validator
 
+from app.models.user import format_full_name
+
 class UserRegisterSchema(BaseModel):
     # Personal Information
     surname: str = Field(..., min_length=1, max_length=100)
@@ -70,9 +72,7 @@ class UserResponseSchema(BaseModel):
     
     @property
     def full_name(self) -> str:
-        if self.middle_name:
-            return f"{self.first_name} {self.middle_name} {self.surname}"
-        return f"{self.first_name} {self.surname}"
+        return format_full_name(self.first_name, self.middle_name, self.surname)
 
 
 class TokenSchema(BaseModel):
@@ -89,4 +89,12 @@ class PendingUserResponseSchema(BaseModel):
     salary_grade: str
     job_category: str
     assigned_unit: str
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+class UserPageSchema(BaseModel):
+    items: List[UserResponseSchema]
+    next_cursor: Optional[str] = None
+
+class PendingUserPageSchema(BaseModel):
+    items: List[PendingUserResponseSchema]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,473 @@
+# backend/app/services/assignment_service.py
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple, Type, Union
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from pymongo import ReturnDocument
+
+from app.models.equipment import ASSIGNMENT_TYPES, STATUSES
+from app.models.user import User
+from app.services.audit_service import AuditService, INVENTORY_AUDIT_RESOURCES
+from app.repositories.asset_repository import AssetRepository
+from app.services.stats_service import INVENTORY_KINDS, InventoryStatsService
+
+
+def _now() -> datetime:
+    # Mongo keeps milliseconds - truncate so the written value can be matched exactly
+    now = datetime.utcnow()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+class AssignmentService:
+    """Assignment state transitions for equipment and furniture"""
+
+    @staticmethod
+    def validate_assignment(assign_data: BaseModel):
+        """Assignment type and PAR number rules shared by single and bulk assignment"""
+        if assign_data.assignment_type not in ASSIGNMENT_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Assignment type must be either 'PAR' or 'Job Order'"
+            )
+
+        if assign_data.assignment_type == "PAR" and not assign_data.par_number:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="PAR number is required for PAR assignments"
+            )
+
+    @staticmethod
+    async def get_assignee(user_id: str) -> User:
+        """The user items are being assigned to (404 if missing)"""
+        user = await User.get(user_id) if ObjectId.is_valid(user_id) else None
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        return user
+
+    @staticmethod
+    def assign_fields(assign_data: BaseModel, now: datetime) -> Dict:
+        """$set document for an assignment - only the fields that change"""
+        fields = assign_data.model_dump(exclude={"ids"})
+        if fields["assignment_type"] != "PAR":
+            fields["par_number"] = None
+        fields["status"] = "Assigned"
+        fields["updated_at"] = now
+        return fields
+
+    @staticmethod
+    def unassign_fields(kind: str, before: Dict, now: datetime) -> Dict:
+        """What unassign_update leaves on an item, given its pre-image"""
+        fields = AssignmentService.unassign_update(kind, now)[0]["$set"]
+        fields["previous_recipient"] = before.get("assigned_to_name") or before.get("previous_recipient")
+        return fields
+
+    @staticmethod
+    def unassign_update(kind: str, now: datetime) -> List[Dict]:
+        """Update pipeline for an unassignment - the last holder becomes the previous recipient"""
+        fields = {
+            "assigned_to_user_id": None,
+            "assigned_to_name": None,
+            "assigned_date": None,
+            "previous_recipient": {"$ifNull": ["$assigned_to_name", "$previous_recipient"]},
+            "status": "Available",
+            "updated_at": now
+        }
+        if kind == "furniture":
+            fields.update(assignment_type=None, location=None, par_number=None)
+        return [{"$set": fields}]
+
+    @staticmethod
+    async def _transition(
+        kind: str,
+        schema: Type[BaseModel],
+        item_id: str,
+        precondition: Dict,
+        update: Union[Dict, List[Dict]],
+        resolve: Callable[[Dict], Dict],
+        conflict_detail: Callable[[Dict], str]
+    ) -> Tuple[Dict, Dict]:
+        """
+        One conditional find_one_and_update (a single round trip)
+
+        The pre-image comes back from the same atomic operation; the
+        post-image is the pre-image with the fields `resolve` says the
+        update wrote. Raises 404/400 when the item is missing or the
+        precondition no longer holds.
+
+        Returns:
+            (before, after) - after is a response row
+        """
+        document_model, _ = INVENTORY_KINDS[kind]
+        collection = document_model.get_motor_collection()
+
+        before = None
+        if ObjectId.is_valid(item_id):
+            before = await collection.find_one_and_update(
+                {"_id": ObjectId(item_id), **precondition},
+                update,
+                projection=AssetRepository.response_projection(schema),
+                return_document=ReturnDocument.BEFORE
+            )
+
+        if before is None:
+            current = await collection.find_one({"_id": ObjectId(item_id)}, {"status": 1}) \
+                if ObjectId.is_valid(item_id) else None
+            if current is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"{kind.capitalize()} not found"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=conflict_detail(current)
+            )
+
+        after = AssetRepository.to_rows(schema, [{**before, **resolve(before)}])[0]
+        await InventoryStatsService.record_change(
+            kind,
+            old=InventoryStatsService.snapshot_document(kind, before),
+            new=InventoryStatsService.snapshot_document(kind, after)
+        )
+        return before, after
+
+    @staticmethod
+    async def update(kind: str, schema: Type[BaseModel], item_id: str, fields: Dict) -> Tuple[Dict, Dict]:
+        """
+        Edit an item's details - only the given fields are written
+
+        A $set of just these fields, so an assignment, transfer or PAR upload
+        that lands at the same time is never overwritten with stale values.
+        """
+        fields = {**fields, "updated_at": _now()}
+        return await AssignmentService._transition(
+            kind, schema, item_id,
+            precondition={},
+            update={"$set": fields},
+            resolve=lambda before: fields,
+            conflict_detail=lambda current: f"{kind.capitalize()} not found"
+        )
+
+    @staticmethod
+    async def assign(
+        kind: str,
+        schema: Type[BaseModel],
+        item_id: str,
+        assign_data: BaseModel
+    ) -> Tuple[Dict, Dict]:
+        """Assign an item that isn't already assigned"""
+        AssignmentService.validate_assignment(assign_data)
+        await AssignmentService.get_assignee(assign_data.assigned_to_user_id)
+
+        fields = AssignmentService.assign_fields(assign_data, _now())
+        return await AssignmentService._transition(
+            kind, schema, item_id,
+            precondition={"status": {"$ne": "Assigned"}},
+            update={"$set": fields},
+            resolve=lambda before: fields,
+            conflict_detail=lambda current: (
+                f"{kind.capitalize()} is already assigned. Please unassign first or transfer."
+            )
+        )
+
+    @staticmethod
+    def unassign_audit(doc: Dict) -> Dict:
+        """UNASSIGN audit entry fields, given the item's pre-image"""
+        return {
+            "action": "UNASSIGN",
+            "changes": {"status": "Available", "previous_recipient": doc.get("assigned_to_name")},
+            "old_values": {"status": doc["status"], "assigned_to": doc.get("assigned_to_name")},
+            "new_values": {"status": "Available", "assigned_to": None}
+        }
+
+    @staticmethod
+    async def unassign(kind: str, schema: Type[BaseModel], item_id: str, current_admin: User) -> Tuple[Dict, Dict]:
+        """Return an assigned item to Available (audited like a bulk unassignment)"""
+        now = _now()
+        before, after = await AssignmentService._transition(
+            kind, schema, item_id,
+            precondition={"status": "Assigned"},
+            update=AssignmentService.unassign_update(kind, now),
+            resolve=lambda before: AssignmentService.unassign_fields(kind, before, now),
+            conflict_detail=lambda current: f"{kind.capitalize()} is not assigned"
+        )
+
+        resource_type, resource_name = INVENTORY_AUDIT_RESOURCES[kind]
+        await AuditService.log_actions(current_admin, [{
+            "resource_type": resource_type,
+            "resource_id": after["id"],
+            "resource_name": resource_name(before),
+            **AssignmentService.unassign_audit(before)
+        }])
+        return before, after
+
+    @staticmethod
+    async def transfer(
+        kind: str,
+        schema: Type[BaseModel],
+        item_id: str,
+        transfer_data: BaseModel,
+        current_admin: User
+    ) -> Tuple[Dict, Dict]:
+        """
+        Move an assigned item straight to a new holder - it is never Available in between
+
+        One pipeline update swaps the holder, records the outgoing holder as
+        previous_recipient (unless the request names one) and appends a
+        custody entry, so the history can't drift from the assignment.
+        """
+        if transfer_data.assignment_type is not None:
+            AssignmentService.validate_assignment(transfer_data)
+        await AssignmentService.get_assignee(transfer_data.new_user_id)
+
+        now = _now()
+        fields = {
+            "assigned_to_user_id": transfer_data.new_user_id,
+            "assigned_to_name": transfer_data.new_user_name,
+            "assigned_date": transfer_data.transfer_date,
+            "updated_at": now
+        }
+        if transfer_data.assignment_type is not None:
+            fields["assignment_type"] = transfer_data.assignment_type
+            fields["par_number"] = transfer_data.par_number if transfer_data.assignment_type == "PAR" else None
+        elif transfer_data.par_number is not None:
+            fields["par_number"] = transfer_data.par_number
+        if getattr(transfer_data, "location", None) is not None:
+            fields["location"] = transfer_data.location
+
+        # Request values are wrapped in $literal so they are never taken as field paths
+        stage = {key: {"$literal": value} for key, value in fields.items()}
+        stage["previous_recipient"] = (
+            {"$literal": transfer_data.previous_recipient}
+            if transfer_data.previous_recipient else "$assigned_to_name"
+        )
+        custody_entry = {
+            "from_user_id": "$assigned_to_user_id",
+            "from_name": "$assigned_to_name",
+            "to_user_id": {"$literal": transfer_data.new_user_id},
+            "to_name": {"$literal": transfer_data.new_user_name},
+            "transfer_date": {"$literal": transfer_data.transfer_date},
+            "reason": {"$literal": transfer_data.transfer_reason},
+            "transferred_by": {"$literal": current_admin.email},
+            "recorded_at": {"$literal": now}
+        }
+        stage["custody_history"] = {
+            "$concatArrays": [{"$ifNull": ["$custody_history", []]}, [custody_entry]]
+        }
+
+        def resolve(before: Dict) -> Dict:
+            return {
+                **fields,
+                "previous_recipient": transfer_data.previous_recipient or before.get("assigned_to_name")
+            }
+
+        return await AssignmentService._transition(
+            kind, schema, item_id,
+            precondition={"status": "Assigned", "assigned_to_user_id": {"$ne": transfer_data.new_user_id}},
+            update=[{"$set": stage}],
+            resolve=resolve,
+            conflict_detail=lambda current: (
+                f"{kind.capitalize()} is already assigned to this user"
+                if current.get("status") == "Assigned"
+                else f"{kind.capitalize()} is not assigned. Use assign instead."
+            )
+        )
+
+    @staticmethod
+    async def custody_history(kind: str, item_id: str) -> Dict:
+        """An item's custody transfers, oldest first"""
+        document_model, _ = INVENTORY_KINDS[kind]
+        doc = None
+        if ObjectId.is_valid(item_id):
+            doc = await document_model.get_motor_collection().find_one(
+                {"_id": ObjectId(item_id)},
+                {"property_number": 1, "assigned_to_name": 1, "custody_history": 1}
+            )
+        if doc is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{kind.capitalize()} not found"
+            )
+        return {
+            "id": str(doc["_id"]),
+            "property_number": doc.get("property_number"),
+            "current_holder": doc.get("assigned_to_name"),
+            "custody_history": doc.get("custody_history", [])
+        }
+
+    @staticmethod
+    async def _apply_bulk(
+        kind: str,
+        ids: List[str],
+        precondition: Dict,
+        skip_reason: Callable[[Dict], str],
+        update: Union[Dict, List[Dict]],
+        now: datetime,
+        new_status: str,
+        audit_entry: Callable[[Dict], Dict],
+        current_admin: User
+    ) -> Dict:
+        """
+        Apply one update_many to every item that satisfies the precondition
+
+        Items are read once up front (for counters, audit and skip reasons);
+        the precondition is repeated in the update filter so an item changed
+        by someone else in between is skipped rather than overwritten.
+        """
+        document_model, type_field = INVENTORY_KINDS[kind]
+        collection = document_model.get_motor_collection()
+        projection = {
+            "status": 1, type_field: 1, "condition": 1, "property_number": 1,
+            "assigned_to_name": 1, "brand": 1, "model": 1, "description": 1
+        }
+
+        skipped = []
+        object_ids = []
+        for item_id in dict.fromkeys(ids):
+            if ObjectId.is_valid(item_id):
+                object_ids.append(ObjectId(item_id))
+            else:
+                skipped.append({"id": item_id, "reason": "Invalid id"})
+
+        eligible = await collection.find(
+            {"_id": {"$in": object_ids}, **precondition}, projection
+        ).to_list(length=None)
+        eligible_ids = {doc["_id"] for doc in eligible}
+
+        rest = [object_id for object_id in object_ids if object_id not in eligible_ids]
+        if rest:
+            found = {
+                doc["_id"]: doc
+                async for doc in collection.find({"_id": {"$in": rest}}, {"status": 1})
+            }
+            for object_id in rest:
+                reason = skip_reason(found[object_id]) if object_id in found else "Not found"
+                skipped.append({"id": str(object_id), "reason": reason})
+
+        if not eligible:
+            return {"succeeded": [], "skipped": skipped}
+
+        result = await collection.update_many(
+            {"_id": {"$in": list(eligible_ids)}, **precondition}, update
+        )
+        if result.modified_count < len(eligible):
+            # Lost some races - keep only the items that carry this update's timestamp
+            changed = {
+                doc["_id"]
+                async for doc in collection.find(
+                    {"_id": {"$in": list(eligible_ids)}, "updated_at": now}, {"_id": 1}
+                )
+            }
+            skipped.extend(
+                {"id": str(doc["_id"]), "reason": "Changed by another request"}
+                for doc in eligible if doc["_id"] not in changed
+            )
+            eligible = [doc for doc in eligible if doc["_id"] in changed]
+
+        if eligible:
+            changes = []
+            for doc in eligible:
+                old = InventoryStatsService.snapshot_document(kind, doc)
+                changes.append((old, {**old, "status": new_status}))
+            await InventoryStatsService.record_changes(kind, changes)
+
+            resource_type, resource_name = INVENTORY_AUDIT_RESOURCES[kind]
+            await AuditService.log_actions(current_admin, [
+                {
+                    "resource_type": resource_type,
+                    "resource_id": str(doc["_id"]),
+                    "resource_name": resource_name(doc),
+                    **audit_entry(doc)
+                }
+                for doc in eligible
+            ])
+
+        return {"succeeded": [str(doc["_id"]) for doc in eligible], "skipped": skipped}
+
+    @staticmethod
+    async def bulk_assign(kind: str, assign_data: BaseModel, current_admin: User) -> Dict:
+        """Assign many items to one user"""
+        AssignmentService.validate_assignment(assign_data)
+        await AssignmentService.get_assignee(assign_data.assigned_to_user_id)
+
+        now = _now()
+        return await AssignmentService._apply_bulk(
+            kind,
+            assign_data.ids,
+            precondition={"status": {"$ne": "Assigned"}},
+            skip_reason=lambda doc: "Already assigned",
+            update={"$set": AssignmentService.assign_fields(assign_data, now)},
+            now=now,
+            new_status="Assigned",
+            audit_entry=lambda doc: {
+                "action": "ASSIGN",
+                "changes": {
+                    "assigned_to": assign_data.assigned_to_name,
+                    "assignment_type": assign_data.assignment_type,
+                    "status": "Assigned"
+                },
+                "old_values": {"status": doc["status"], "assigned_to": doc.get("assigned_to_name")},
+                "new_values": {
+                    "status": "Assigned",
+                    "assigned_to": assign_data.assigned_to_name,
+                    "assignment_type": assign_data.assignment_type
+                },
+                "notes": "Bulk assignment"
+            },
+            current_admin=current_admin
+        )
+
+    @staticmethod
+    async def bulk_unassign(kind: str, ids: List[str], current_admin: User) -> Dict:
+        """Return many assigned items to Available"""
+        now = _now()
+        return await AssignmentService._apply_bulk(
+            kind,
+            ids,
+            precondition={"status": "Assigned"},
+            skip_reason=lambda doc: "Not assigned",
+            update=AssignmentService.unassign_update(kind, now),
+            now=now,
+            new_status="Available",
+            audit_entry=lambda doc: {**AssignmentService.unassign_audit(doc), "notes": "Bulk unassignment"},
+            current_admin=current_admin
+        )
+
+    @staticmethod
+    async def bulk_set_status(kind: str, ids: List[str], new_status: str, current_admin: User) -> Dict:
+        """Move many unassigned items to a new status (e.g. Under Repair, Disposed)"""
+        if new_status not in STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Status must be one of: {', '.join(STATUSES)}"
+            )
+        if new_status == "Assigned":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use bulk assign to assign items"
+            )
+
+        now = _now()
+        return await AssignmentService._apply_bulk(
+            kind,
+            ids,
+            precondition={"status": {"$nin": ["Assigned", new_status]}},
+            skip_reason=lambda doc: (
+                "Assigned - unassign first" if doc["status"] == "Assigned" else f"Already {new_status}"
+            ),
+            update={"$set": {"status": new_status, "updated_at": now}},
+            now=now,
+            new_status=new_status,
+            audit_entry=lambda doc: {
+                "action": "UPDATE",
+                "changes": {"status": new_status},
+                "old_values": {"status": doc["status"]},
+                "new_values": {"status": new_status},
+                "notes": "Bulk status change"
+            },
+            current_admin=current_admin
+        )
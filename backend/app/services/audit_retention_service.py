@@ -0,0 +1,320 @@
+# backend/app/services/audit_retention_service.py
+import asyncio
+import gzip
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from bson import json_util
+from pymongo.errors import DuplicateKeyError
+
+from app.config import settings
+from app.models.audit import AuditArchiveChunk, AuditLog
+from app.repositories.pagination import find_page
+from app.utils.cursor import decode_cursor, encode_cursor
+
+_retention_task: Optional[asyncio.Task] = None
+
+
+def _resource_key(resource_type: str, resource_id: str) -> str:
+    return f"{resource_type}:{resource_id}"
+
+
+def _day(timestamp: datetime) -> datetime:
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _encode_chunk(documents: List[Dict]) -> bytes:
+    raw = "".join(
+        json_util.dumps(document, json_options=json_util.CANONICAL_JSON_OPTIONS) + "\n"
+        for document in documents
+    )
+    return gzip.compress(raw.encode("utf-8"), compresslevel=6)
+
+
+def _decode_chunk(data: bytes) -> List[Dict]:
+    return [json_util.loads(line) for line in gzip.decompress(data).decode("utf-8").splitlines() if line]
+
+
+class AuditRetentionService:
+    """
+    Keeps audit_logs to the last AUDIT_HOT_DAYS days
+
+    Older entries are moved, whole UTC days at a time, into gzip-compressed
+    chunks in audit_archive. Chunks belong to fixed windows of the day and
+    hold at most AUDIT_ARCHIVE_BATCH_SIZE entries each. Each chunk records
+    its day, time range and the resources it mentions, so resource history
+    can still reach archived entries without scanning the archive. The
+    hourly/daily rollups are left alone, so activity charts keep covering
+    archived periods.
+    """
+
+    @staticmethod
+    def cutoff(now: Optional[datetime] = None) -> datetime:
+        """Entries before this (a UTC midnight) belong in the archive"""
+        return _day(now or datetime.utcnow()) - timedelta(days=settings.AUDIT_HOT_DAYS)
+
+    @staticmethod
+    async def archived_until() -> Optional[datetime]:
+        """End of the newest archived day - audit_logs is incomplete before this"""
+        chunk = await AuditArchiveChunk.get_motor_collection().find_one(
+            {}, {"day": 1}, sort=[("day", -1)]
+        )
+        return chunk["day"] + timedelta(days=1) if chunk else None
+
+    @staticmethod
+    def _window(timestamp: datetime) -> datetime:
+        """Start of the fixed archive window holding `timestamp`"""
+        day = _day(timestamp)
+        minutes = settings.AUDIT_ARCHIVE_CHUNK_MINUTES
+        return day + timedelta(minutes=(timestamp - day) // timedelta(minutes=minutes) * minutes)
+
+    @staticmethod
+    async def _archived_ids(window: datetime, window_end: datetime) -> Tuple[Set, int]:
+        """_ids already in a window's chunks, and the next free sequence number"""
+        ids: Set = set()
+        next_seq = 0
+        loop = asyncio.get_running_loop()
+        async for chunk in AuditArchiveChunk.get_motor_collection().find(
+            {"day": _day(window), "first_timestamp": {"$gte": window, "$lt": window_end}},
+            {"batch_id": 1, "data": 1}
+        ):
+            ids.update(document["_id"] for document in await loop.run_in_executor(None, _decode_chunk, chunk["data"]))
+            next_seq = max(next_seq, int(chunk["batch_id"].rsplit("/", 1)[1]) + 1)
+        return ids, next_seq
+
+    @staticmethod
+    async def _write_chunk(window: datetime, seq: int, documents: List[Dict]):
+        """Insert one chunk - DuplicateKeyError if another run already took the sequence number"""
+        data = await asyncio.get_running_loop().run_in_executor(None, _encode_chunk, documents)
+        await AuditArchiveChunk.get_motor_collection().insert_one({
+            "day": _day(window),
+            "batch_id": f"{window:%Y-%m-%dT%H:%M}/{seq:04d}",
+            "entries": len(documents),
+            "first_timestamp": documents[0]["timestamp"],
+            "last_timestamp": documents[-1]["timestamp"],
+            "resources": sorted({
+                _resource_key(document.get("resource_type"), document.get("resource_id"))
+                for document in documents
+            }),
+            "data": data,
+            "size": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "created_at": datetime.utcnow()
+        })
+
+    @staticmethod
+    async def _archive_window(window: datetime, window_end: datetime, max_chunks: Optional[int]) -> Tuple[int, int]:
+        """
+        Stream one window of audit_logs into chunks, deleting each chunk's entries once it is written
+
+        Entries that are already in one of the window's chunks (a run that
+        stopped before deleting) are only deleted; the rest go into new
+        chunks numbered after the existing ones, so an entry is never
+        archived twice, however often the window is rerun or how late its
+        entries arrive (spool replay).
+
+        Returns:
+            (entries archived, chunks written)
+        """
+        collection = AuditLog.get_motor_collection()
+        archived_ids, seq = await AuditRetentionService._archived_ids(window, window_end)
+        archived = chunks = 0
+        pending: List[Dict] = []
+        done: List = []
+
+        async def delete(ids: List):
+            nonlocal archived
+            if ids:
+                result = await collection.delete_many({"_id": {"$in": ids}})
+                archived += result.deleted_count
+            ids.clear()
+
+        async def write():
+            nonlocal chunks, seq
+            if pending:
+                await AuditRetentionService._write_chunk(window, seq, pending)
+                seq += 1
+                chunks += 1
+                await delete([document["_id"] for document in pending])
+            pending.clear()
+
+        cursor = collection.find({"timestamp": {"$gte": window, "$lt": window_end}}) \
+            .sort([("timestamp", 1), ("_id", 1)])
+        async for document in cursor:
+            if document["_id"] in archived_ids:
+                done.append(document["_id"])
+                if len(done) >= settings.AUDIT_ARCHIVE_BATCH_SIZE:
+                    await delete(done)
+                continue
+            pending.append(document)
+            if len(pending) >= settings.AUDIT_ARCHIVE_BATCH_SIZE:
+                await write()
+                if max_chunks is not None and chunks >= max_chunks:
+                    break
+        else:
+            await write()
+        await delete(done)
+        await cursor.close()
+        return archived, chunks
+
+    @staticmethod
+    async def archive(dry_run: bool = False, max_chunks: Optional[int] = None) -> Dict:
+        """
+        Move entries older than the hot window into the archive, oldest first
+
+        Entries are archived window by window (AUDIT_ARCHIVE_CHUNK_MINUTES),
+        each chunk written and only then its entries deleted, so an
+        interrupted run loses nothing and the next run finishes it.
+
+        Returns:
+            cutoff, entries archived (or that would be), chunks written
+        """
+        cutoff = AuditRetentionService.cutoff()
+        collection = AuditLog.get_motor_collection()
+        query = {"timestamp": {"$lt": cutoff}}
+
+        if dry_run:
+            return {"cutoff": cutoff, "entries": await collection.count_documents(query), "chunks": 0}
+
+        archived = chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            oldest = await collection.find_one(query, {"timestamp": 1}, sort=[("timestamp", 1)])
+            if not oldest:
+                break
+
+            window = AuditRetentionService._window(oldest["timestamp"])
+            window_end = min(window + timedelta(minutes=settings.AUDIT_ARCHIVE_CHUNK_MINUTES), cutoff)
+            try:
+                window_archived, window_chunks = await AuditRetentionService._archive_window(
+                    window, window_end, None if max_chunks is None else max_chunks - chunks
+                )
+            except DuplicateKeyError:
+                # Another node is archiving the same window - start it over from what is archived now
+                continue
+            archived += window_archived
+            chunks += window_chunks
+
+        if archived:
+            print(f"🗄️  Audit Log: archived {archived} entries older than {cutoff:%Y-%m-%d} in {chunks} chunks")
+        return {"cutoff": cutoff, "entries": archived, "chunks": chunks}
+
+    @staticmethod
+    async def manifest() -> List[Dict]:
+        """One row per archived day: chunks, entries, compressed bytes and time range"""
+        pipeline = [
+            {
+                "$group": {
+                    "_id": "$day",
+                    "chunks": {"$sum": 1},
+                    "entries": {"$sum": "$entries"},
+                    "size": {"$sum": "$size"},
+                    "first_timestamp": {"$min": "$first_timestamp"},
+                    "last_timestamp": {"$max": "$last_timestamp"}
+                }
+            },
+            {"$sort": {"_id": 1}}
+        ]
+        rows = await AuditArchiveChunk.get_motor_collection().aggregate(pipeline).to_list(length=None)
+        return [{"day": row.pop("_id"), **row} for row in rows]
+
+    @staticmethod
+    async def _archived_history(
+        resource_type: str,
+        resource_id: str,
+        before: Optional[Tuple[datetime, object]],
+        count: int
+    ) -> List[Dict]:
+        """Up to `count` archived entries of one resource older than `before`, newest first"""
+        key = _resource_key(resource_type, resource_id)
+        query: Dict = {"resources": key}
+        if before:
+            query["first_timestamp"] = {"$lte": before[0]}
+
+        found: Dict = {}
+        loop = asyncio.get_running_loop()
+        # Chunks of one window may overlap in time (late entries), so stop only once the
+        # remaining chunks end before the oldest of the `count` newest entries found
+        async for chunk in AuditArchiveChunk.get_motor_collection().find(query).sort("last_timestamp", -1):
+            if len(found) >= count:
+                newest = sorted(found.values(), key=lambda doc: (doc["timestamp"], doc["_id"]), reverse=True)
+                if chunk["last_timestamp"] < newest[count - 1]["timestamp"]:
+                    break
+            for document in await loop.run_in_executor(None, _decode_chunk, chunk["data"]):
+                if _resource_key(document.get("resource_type"), document.get("resource_id")) != key:
+                    continue
+                if before and (document["timestamp"], document["_id"]) >= before:
+                    continue
+                found[document["_id"]] = document
+
+        documents = sorted(found.values(), key=lambda doc: (doc["timestamp"], doc["_id"]), reverse=True)
+        return documents[:count]
+
+    @staticmethod
+    async def resource_history_page(
+        resource_type: str,
+        resource_id: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        projection: Optional[Dict] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        A keyset page of a resource's history that continues into the archive
+
+        Pages come from audit_logs while it has entries; once it runs out the
+        same cursor walks on through the archived chunks.
+        """
+        query = {"resource_type": resource_type, "resource_id": resource_id}
+        docs, next_cursor = await find_page(
+            AuditLog.get_motor_collection(),
+            query,
+            "timestamp",
+            limit,
+            cursor=cursor,
+            projection=projection,
+            descending=True
+        )
+        if next_cursor:
+            return docs, next_cursor
+
+        before = None
+        if docs:
+            before = (docs[-1]["timestamp"], docs[-1]["_id"])
+        elif cursor:
+            position = decode_cursor(cursor)
+            before = (position["v"], position["id"])
+
+        room = limit - len(docs)
+        archived = await AuditRetentionService._archived_history(resource_type, resource_id, before, room + 1)
+        if projection:
+            archived = [
+                {"_id": doc["_id"], **{field: doc.get(field) for field in projection}}
+                for doc in archived
+            ]
+        docs += archived[:room]
+        if len(archived) > room:
+            last = docs[-1]
+            next_cursor = encode_cursor({"s": "timestamp", "v": last["timestamp"], "id": last["_id"]})
+        return docs, next_cursor
+
+
+async def _retention_loop():
+    while True:
+        try:
+            await AuditRetentionService.archive()
+        except Exception as e:
+            print(f"⚠️  Audit Log: archiving failed ({e.__class__.__name__}: {e})")
+        await asyncio.sleep(settings.AUDIT_ARCHIVE_INTERVAL_HOURS * 3600)
+
+
+def start_audit_retention():
+    """Archive old audit entries now and every AUDIT_ARCHIVE_INTERVAL_HOURS"""
+    global _retention_task
+    if settings.AUDIT_ARCHIVE_INTERVAL_HOURS > 0:
+        _retention_task = asyncio.create_task(_retention_loop())
+
+
+def shutdown_audit_retention():
+    """Stop the archive job - a batch cut short is finished by the next run"""
+    if _retention_task is not None:
+        _retention_task.cancel()
@@ -0,0 +1,313 @@
+# backend/app/services/audit_rollup_service.py
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.config import settings
+from app.models.audit import AuditLog, AuditRollup
+from app.models.user import User
+from app.services.audit_retention_service import AuditRetentionService
+from app.services.stats_service import counter_key
+
+GRANULARITIES = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+# Rollup breakdown -> audit log field it counts
+ROLLUP_BREAKDOWNS = {
+    "by_action": "action",
+    "by_resource_type": "resource_type",
+    "by_user": "user_id",
+}
+
+# Buckets returned when no start date is given, and the most one request may ask for
+DEFAULT_BUCKETS = {"hour": 24, "day": 30}
+MAX_BUCKETS = {"hour": 24 * 92, "day": 366 * 5}
+
+DUPLICATE_KEY = 11000
+
+Increments = Dict[Tuple[str, datetime], Dict[str, int]]
+
+
+def _utc(value: datetime) -> datetime:
+    """Naive UTC, the way timestamps are stored"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Start of the UTC hour or day that holds `timestamp`"""
+    hour = _utc(timestamp).replace(minute=0, second=0, microsecond=0)
+    return hour.replace(hour=0) if granularity == "day" else hour
+
+
+def _add(counts: Dict[str, int], key: str, amount: int):
+    counts[key] = counts.get(key, 0) + amount
+
+
+def _flatten(doc: Dict) -> Dict[str, int]:
+    """A rollup document as the dotted counter keys used for $inc"""
+    counts = {"total": doc.get("total", 0)}
+    for breakdown in ROLLUP_BREAKDOWNS:
+        for key, count in doc.get(breakdown, {}).items():
+            counts[f"{breakdown}.{key}"] = count
+    return counts
+
+
+def _bucket_row(doc: Dict, include_users: bool) -> Dict:
+    breakdowns = [b for b in ROLLUP_BREAKDOWNS if include_users or b != "by_user"]
+    return {
+        "bucket": doc["bucket"],
+        "total": doc.get("total", 0),
+        **{
+            breakdown: {key: count for key, count in doc.get(breakdown, {}).items() if count}
+            for breakdown in breakdowns
+        }
+    }
+
+
+class AuditRollupService:
+    """
+    Hourly and daily audit counters, kept up to date as entries are written
+
+    Every entry increments its hour and its day, so a day always equals the sum
+    of its hours. Charts read these few documents instead of the audit log.
+    """
+
+    @staticmethod
+    def increments(documents: Iterable[Dict]) -> Increments:
+        """Per-bucket $inc amounts for a batch of raw audit documents"""
+        increments: Increments = {}
+        for document in documents:
+            for granularity in GRANULARITIES:
+                counts = increments.setdefault((granularity, bucket_start(document["timestamp"], granularity)), {})
+                _add(counts, "total", 1)
+                for breakdown, field in ROLLUP_BREAKDOWNS.items():
+                    _add(counts, f"{breakdown}.{counter_key(document.get(field))}", 1)
+        return increments
+
+    @staticmethod
+    async def apply(increments: Increments):
+        """$inc every bucket in one bulk write, creating buckets on first use"""
+        now = datetime.utcnow()
+        operations = []
+        for (granularity, bucket), counts in increments.items():
+            counts = {key: amount for key, amount in counts.items() if amount}
+            if counts:
+                operations.append(UpdateOne(
+                    {"granularity": granularity, "bucket": bucket},
+                    {"$inc": counts, "$set": {"updated_at": now}},
+                    upsert=True
+                ))
+        if not operations:
+            return
+
+        collection = AuditRollup.get_motor_collection()
+        try:
+            await collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # Another process created the same bucket first - the retry matches it as a plain update
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY for error in errors):
+                raise
+            await collection.bulk_write([operations[error["index"]] for error in errors], ordered=False)
+
+    @staticmethod
+    async def record(documents: List[Dict]):
+        """Count newly inserted audit documents into their hour and day"""
+        if documents:
+            await AuditRollupService.apply(AuditRollupService.increments(documents))
+
+    @staticmethod
+    async def rebuild(start: datetime, end: Optional[datetime] = None) -> Dict:
+        """
+        Recount the hours in [start, end) from the audit log and correct their rollups
+
+        The difference between the recount and the stored hour is applied to
+        the hour and to its day, so a partly rebuilt day stays consistent.
+        Archived days (no longer in audit_logs) keep the counts they have.
+
+        An entry is inserted before its rollup increment, so recounting an
+        hour the writer is still adding to would count a fresh entry twice
+        (once in the difference, once in its own increment). Only hours that
+        ended AUDIT_ROLLUP_SETTLE_SECONDS before the rebuild started are
+        touched; after an outage, rebuild again once the spool is replayed.
+
+        Returns:
+            hours: hours recounted, entries: audit entries counted, corrected: hours that changed
+        """
+        # Taken before anything is read: later hours may still be receiving entries
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.AUDIT_ROLLUP_SETTLE_SECONDS)
+        settled_until = bucket_start(cutoff, "hour")
+        start = bucket_start(start, "hour")
+        archived_until = await AuditRetentionService.archived_until()
+        if archived_until:
+            start = max(start, archived_until)
+        end = min(bucket_start(end, "hour") if end else settled_until, settled_until)
+        if start >= end:
+            return {"hours": 0, "entries": 0, "corrected": 0}
+
+        pipeline = [
+            {"$match": {"timestamp": {"$gte": start, "$lt": end}}},
+            {
+                "$group": {
+                    "_id": {
+                        "hour": {
+                            "$dateFromParts": {
+                                "year": {"$year": "$timestamp"},
+                                "month": {"$month": "$timestamp"},
+                                "day": {"$dayOfMonth": "$timestamp"},
+                                "hour": {"$hour": "$timestamp"}
+                            }
+                        },
+                        **{field: f"${field}" for field in ROLLUP_BREAKDOWNS.values()}
+                    },
+                    "count": {"$sum": 1}
+                }
+            }
+        ]
+        counted: Dict[datetime, Dict[str, int]] = {}
+        entries = 0
+        async for row in AuditLog.get_motor_collection().aggregate(pipeline, allowDiskUse=True):
+            group = row["_id"]
+            counts = counted.setdefault(group["hour"], {})
+            _add(counts, "total", row["count"])
+            for breakdown, field in ROLLUP_BREAKDOWNS.items():
+                _add(counts, f"{breakdown}.{counter_key(group.get(field))}", row["count"])
+            entries += row["count"]
+
+        stored = {
+            doc["bucket"]: _flatten(doc)
+            async for doc in AuditRollup.get_motor_collection().find(
+                {"granularity": "hour", "bucket": {"$gte": start, "$lt": end}}
+            )
+        }
+
+        increments: Increments = {}
+        corrected = 0
+        for hour in set(counted) | set(stored):
+            new, old = counted.get(hour, {}), stored.get(hour, {})
+            difference = {key: new.get(key, 0) - old.get(key, 0) for key in set(new) | set(old)}
+            difference = {key: amount for key, amount in difference.items() if amount}
+            if not difference:
+                continue
+            corrected += 1
+            for granularity in GRANULARITIES:
+                counts = increments.setdefault((granularity, bucket_start(hour, granularity)), {})
+                for key, amount in difference.items():
+                    _add(counts, key, amount)
+
+        await AuditRollupService.apply(increments)
+        return {
+            "hours": int((end - start) / GRANULARITIES["hour"]),
+            "entries": entries,
+            "corrected": corrected
+        }
+
+    @staticmethod
+    def _window(granularity: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[datetime, datetime]:
+        if granularity not in GRANULARITIES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"granularity must be one of: {', '.join(GRANULARITIES)}"
+            )
+        step = GRANULARITIES[granularity]
+        last = bucket_start(end_date or datetime.utcnow(), granularity)
+        first = bucket_start(start_date, granularity) if start_date else last - step * (DEFAULT_BUCKETS[granularity] - 1)
+        if first > last:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must be before end_date"
+            )
+        if (last - first) / step >= MAX_BUCKETS[granularity]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_BUCKETS[granularity]} {granularity} buckets per request"
+            )
+        return first, last
+
+    @staticmethod
+    async def get_buckets(
+        granularity: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        include_users: bool = False
+    ) -> Dict:
+        """
+        Counts per hour or day between two dates, oldest first
+
+        Buckets with no activity are filled in with zeros so charts get an
+        unbroken series. Per-user counts are only sent when asked for.
+        """
+        first, last = AuditRollupService._window(granularity, start_date, end_date)
+        projection = {"_id": 0, "bucket": 1, "total": 1, "by_action": 1, "by_resource_type": 1}
+        if include_users:
+            projection["by_user"] = 1
+
+        stored = {
+            doc["bucket"]: _bucket_row(doc, include_users)
+            async for doc in AuditRollup.get_motor_collection().find(
+                {"granularity": granularity, "bucket": {"$gte": first, "$lte": last}},
+                projection
+            )
+        }
+
+        buckets = []
+        bucket, step = first, GRANULARITIES[granularity]
+        while bucket <= last:
+            buckets.append(stored.get(bucket) or _bucket_row({"bucket": bucket}, include_users))
+            bucket += step
+        return {
+            "granularity": granularity,
+            "start": first,
+            "end": last + step,
+            "buckets": buckets
+        }
+
+    @staticmethod
+    async def get_summary(days: int, top_users: int = 10) -> Dict:
+        """
+        Totals for the last `days` UTC days (today included) from the daily rollups
+
+        Same breakdowns as AuditService.get_stats, aligned to whole days.
+        """
+        today = bucket_start(datetime.utcnow(), "day")
+        first = today - timedelta(days=days - 1)
+
+        totals: Dict[str, int] = {}
+        async for doc in AuditRollup.get_motor_collection().find(
+            {"granularity": "day", "bucket": {"$gte": first, "$lte": today}}
+        ):
+            for key, count in _flatten(doc).items():
+                _add(totals, key, count)
+
+        def breakdown(name: str) -> Dict[str, int]:
+            prefix = f"{name}."
+            counts = {key[len(prefix):]: count for key, count in totals.items() if key.startswith(prefix) and count}
+            return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+        users = list(breakdown("by_user").items())[:top_users]
+        object_ids = [ObjectId(user_id) for user_id, _ in users if ObjectId.is_valid(user_id)]
+        emails = {
+            str(doc["_id"]): doc["email"]
+            async for doc in User.get_motor_collection().find({"_id": {"$in": object_ids}}, {"email": 1})
+        } if object_ids else {}
+
+        return {
+            "total_actions": totals.get("total", 0),
+            "date_range": {
+                "start": first,
+                "end": today + timedelta(days=1),
+                "days": days
+            },
+            "actions_breakdown": breakdown("by_action"),
+            "resource_types_breakdown": breakdown("by_resource_type"),
+            # Users that no longer exist are listed by ID
+            "most_active_users": {emails.get(user_id, user_id): count for user_id, count in users}
+        }
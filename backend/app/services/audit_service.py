@@ -1,11 +1,26 @@
 # backend/app/services/audit_service.py
-from typing import Dict, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from beanie import PydanticObjectId
+from beanie.odm.utils.dump import get_dict
 from app.models.audit import AuditLog
 from app.models.user import User
+from app.services.audit_writer import audit_writer
+
+# Inventory kind -> audit resource type and how the resource is named in audit logs
+INVENTORY_AUDIT_RESOURCES = {
+    "equipment": ("EQUIPMENT", lambda doc: f"{doc.get('brand')} {doc.get('model')}"),
+    "furniture": ("FURNITURE", lambda doc: doc.get("description")),
+}
+
+def _audit_document(audit_log: AuditLog) -> Dict:
+    """Raw document for the audit writer, with its _id fixed up front so retries can't duplicate it"""
+    audit_log.id = PydanticObjectId()
+    # Beanie's encoder, as insert() would use - turns Decimals, sets, models etc. into BSON types
+    return get_dict(audit_log, to_db=True)
 
 class AuditService:
-    """Service for creating audit logs"""
+    """Service for creating audit logs (written in batches by the audit writer)"""
     
     @staticmethod
     async def log_action(
@@ -22,7 +37,7 @@ class AuditService:
         notes: Optional[str] = None
     ):
         """
-        Create an audit log entry
+        Queue an audit log entry - the request doesn't wait for the write
         
         Args:
             user: User who performed the action
@@ -53,10 +68,80 @@ class AuditService:
             notes=notes
         )
         
-        await audit_log.insert()
-        print(f"📝 Audit Log: {user.email} - {action} - {resource_type} - {resource_id}")
+        await audit_writer.submit([_audit_document(audit_log)])
         return audit_log
     
+    @staticmethod
+    async def log_actions(user: User, entries: List[Dict]) -> int:
+        """
+        Queue many audit log entries for one user
+        
+        Args:
+            user: User who performed the actions
+            entries: log_action keyword arguments (action, resource_type, resource_id, ...)
+        
+        Returns:
+            Number of entries queued
+        """
+        if not entries:
+            return 0
+        
+        documents = [
+            _audit_document(AuditLog(
+                user_id=str(user.id),
+                user_email=user.email,
+                user_role=user.role,
+                **entry
+            ))
+            for entry in entries
+        ]
+        await audit_writer.submit(documents)
+        return len(documents)
+    
+    @staticmethod
+    async def get_stats(days: int, top_users: int = 10) -> Dict:
+        """
+        Action, resource type and most-active-user breakdowns for the last `days`
+        
+        One aggregation: the timestamp index selects the window, $facet counts
+        each breakdown server-side, so only the counts cross the wire.
+        """
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
+        
+        pipeline = [
+            {"$match": {"timestamp": {"$gte": start_date}}},
+            {"$project": {"_id": 0, "action": 1, "resource_type": 1, "user_email": 1}},
+            {
+                "$facet": {
+                    "total": [{"$count": "count"}],
+                    "actions": [{"$sortByCount": "$action"}],
+                    "resource_types": [{"$sortByCount": "$resource_type"}],
+                    "users": [{"$sortByCount": "$user_email"}, {"$limit": top_users}]
+                }
+            }
+        ]
+        results = await AuditLog.get_motor_collection().aggregate(
+            pipeline, allowDiskUse=True
+        ).to_list(length=1)
+        facets = results[0] if results else {}
+        total = facets.get("total") or []
+        
+        def breakdown(name: str) -> Dict[str, int]:
+            return {row["_id"]: row["count"] for row in facets.get(name, [])}
+        
+        return {
+            "total_actions": total[0]["count"] if total else 0,
+            "date_range": {
+                "start": start_date,
+                "end": end_date,
+                "days": days
+            },
+            "actions_breakdown": breakdown("actions"),
+            "resource_types_breakdown": breakdown("resource_types"),
+            "most_active_users": breakdown("users")
+        }
+    
     @staticmethod
     async def get_user_activity(user_id: str, limit: int = 50):
         """Get recent activity for a specific user"""
@@ -0,0 +1,227 @@
+# backend/app/services/audit_writer.py
+import asyncio
+import contextlib
+import os
+from typing import Dict, List, Optional
+
+import aiofiles
+from bson import json_util
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from app.config import settings
+from app.models.audit import AuditLog
+from app.services.audit_rollup_service import AuditRollupService
+
+DUPLICATE_KEY = 11000
+_SENTINEL = None
+
+
+class AuditWriter:
+    """
+    Batches audit entries into insert_many calls off the request path
+
+    Handlers enqueue fully built documents (with client-side _ids) into a
+    bounded queue; when it is full they wait, which is the backpressure. A
+    background task flushes every AUDIT_BATCH_SIZE entries or
+    AUDIT_FLUSH_INTERVAL_SECONDS. Batches that can't be written are appended
+    to AUDIT_SPOOL_FILE and replayed once MongoDB accepts writes again;
+    because _ids are fixed, replaying an entry twice is harmless. Entries
+    are counted into the audit rollups as they are inserted.
+
+    Until start() (scripts, tests) entries are written straight through.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: List[Dict] = []
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._closing
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=settings.AUDIT_QUEUE_MAX_SIZE)
+        self._closing = False
+        await self.replay_spool()
+        self._task = asyncio.create_task(self._run())
+
+    async def submit(self, documents: List[Dict]):
+        """Queue audit documents - waits while the queue is full"""
+        if not self.running:
+            await self._insert(documents)
+            return
+        for document in documents:
+            await self._queue.put(document)
+
+    async def _insert(self, documents: List[Dict]):
+        try:
+            await AuditLog.get_motor_collection().insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            # Only entries this call inserted are counted, so replays don't double the rollups
+            failed = {error["index"] for error in errors}
+            await self._record_rollups([doc for index, doc in enumerate(documents) if index not in failed])
+            # Entries already written by an earlier attempt are fine; anything else is a failure
+            if any(error.get("code") != DUPLICATE_KEY for error in errors):
+                raise
+            if e.details.get("writeConcernErrors"):
+                raise
+            return
+        await self._record_rollups(documents)
+
+    async def _record_rollups(self, documents: List[Dict]):
+        # The entries are safely written; a missed count is fixed by scripts/rebuild_audit_rollups.py
+        try:
+            await AuditRollupService.record(documents)
+        except PyMongoError as e:
+            print(f"⚠️  Audit Log: rollup update failed for {len(documents)} entries ({e.__class__.__name__})")
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            batch = [] if first is _SENTINEL else [first]
+            stop = first is _SENTINEL
+            deadline = loop.time() + settings.AUDIT_FLUSH_INTERVAL_SECONDS
+            while not stop and len(batch) < settings.AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    document = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if document is _SENTINEL:
+                    stop = True
+                else:
+                    batch.append(document)
+
+            if batch:
+                try:
+                    await self._flush(batch)
+                except Exception as e:
+                    # Never let one batch stop the writer (e.g. the spool disk is full)
+                    print(f"❌ Audit Log: lost {len(batch)} entries ({e.__class__.__name__}: {e})")
+            if stop:
+                return
+
+    async def _flush(self, batch: List[Dict]):
+        self._in_flight = batch
+        try:
+            await self._insert(batch)
+            written = len(batch)
+        except PyMongoError as e:
+            await self._spool(batch)
+            print(f"⚠️  Audit Log: MongoDB unavailable ({e.__class__.__name__}), spooled {len(batch)} entries")
+            return
+        except Exception:
+            # Something in the batch can't be encoded (bson InvalidDocument) - isolate it
+            written = await self._flush_each(batch)
+        finally:
+            self._in_flight = []
+
+        print(f"📝 Audit Log: {written} entries written")
+        if os.path.exists(settings.AUDIT_SPOOL_FILE) or os.path.exists(self._replay_file):
+            await self.replay_spool()
+
+    async def _flush_each(self, batch: List[Dict]) -> int:
+        """Write entries one at a time, dropping the ones MongoDB can't store"""
+        written = 0
+        for document in batch:
+            try:
+                await self._insert([document])
+                written += 1
+            except PyMongoError:
+                await self._spool([document])
+            except Exception as e:
+                print(f"❌ Audit Log: dropped unwritable entry {document.get('_id')} "
+                      f"({document.get('action')} {document.get('resource_type')}): {e}")
+        return written
+
+    @property
+    def _replay_file(self) -> str:
+        return f"{settings.AUDIT_SPOOL_FILE}.replay"
+
+    async def _spool(self, documents: List[Dict]):
+        directory = os.path.dirname(settings.AUDIT_SPOOL_FILE)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        async with aiofiles.open(settings.AUDIT_SPOOL_FILE, "a", encoding="utf-8") as spool:
+            await spool.write("".join(
+                json_util.dumps(document, json_options=json_util.CANONICAL_JSON_OPTIONS) + "\n"
+                for document in documents
+            ))
+            await spool.flush()
+            os.fsync(spool.fileno())
+
+    async def replay_spool(self) -> int:
+        """Write spooled entries to MongoDB; returns how many were replayed"""
+        # New failures keep appending to the spool while the renamed copy is replayed
+        # Other workers sharing the spool may rename or remove the files under us
+        if not os.path.exists(self._replay_file):
+            if not os.path.exists(settings.AUDIT_SPOOL_FILE):
+                return 0
+            try:
+                os.replace(settings.AUDIT_SPOOL_FILE, self._replay_file)
+            except FileNotFoundError:
+                pass
+
+        documents = []
+        try:
+            async with aiofiles.open(self._replay_file, "r", encoding="utf-8") as spool:
+                async for line in spool:
+                    if not line.strip():
+                        continue
+                    try:
+                        documents.append(json_util.loads(line))
+                    except ValueError:
+                        # Torn last line from a crash mid-append
+                        print(f"⚠️  Audit Log: skipped unreadable spool line: {line[:80]!r}")
+        except FileNotFoundError:
+            return 0
+
+        batch_size = settings.AUDIT_BATCH_SIZE
+        try:
+            for start in range(0, len(documents), batch_size):
+                await self._insert(documents[start:start + batch_size])
+        except PyMongoError:
+            return 0
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._replay_file)
+        if documents:
+            print(f"📝 Audit Log: replayed {len(documents)} spooled entries")
+        return len(documents)
+
+    async def drain(self):
+        """Flush everything queued before shutdown; whatever can't be written is spooled"""
+        if self._task is None:
+            return
+        self._closing = True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.AUDIT_DRAIN_TIMEOUT_SECONDS
+        finished = False
+        if not self._task.done():
+            try:
+                # A full queue with a stuck consumer must not block shutdown
+                await asyncio.wait_for(self._queue.put(_SENTINEL), settings.AUDIT_DRAIN_TIMEOUT_SECONDS)
+                await asyncio.wait_for(asyncio.shield(self._task), max(deadline - loop.time(), 0))
+                finished = True
+            except asyncio.TimeoutError:
+                pass
+        if not finished:
+            self._task.cancel()
+            leftover = list(self._in_flight)
+            while not self._queue.empty():
+                document = self._queue.get_nowait()
+                if document is not _SENTINEL:
+                    leftover.append(document)
+            if leftover:
+                await self._spool(leftover)
+            print(f"⚠️  Audit Log: drain timed out, spooled {len(leftover)} entries")
+        self._task = None
+
+
+audit_writer = AuditWriter()
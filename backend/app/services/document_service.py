@@ -0,0 +1,365 @@
+# backend/app/services/document_service.py
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import aiofiles
+import aiofiles.os
+from bson import ObjectId
+from fastapi import HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import RedirectResponse
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.config import settings
+from app.models.blob import StoredBlob
+from app.models.user import User
+from app.services.file_link_service import FileLinkService
+from app.services.stats_service import INVENTORY_KINDS, InventoryStatsService
+from app.storage import get_blob_store
+from app.storage.local import read_file_range
+from app.utils.downloads import IMMUTABLE, file_download
+from app.utils.http_cache import REVALIDATE, make_etag
+from app.utils.uploads import receive_pdf_upload
+
+# How long an upload waits for GC to finish deleting the same content, and when
+# a delete that is still marked is considered abandoned
+CLAIM_WAIT_SECONDS = 5
+GC_DELETE_STALE_SECONDS = 300
+
+
+class ParDocumentService:
+    """
+    PAR documents in the content-addressed blob store.
+
+    An item points at its document by SHA-256 (`par_sha256`); identical PDFs
+    covering a batch of items are stored once. The `blobs` collection counts
+    references so unreferenced blobs can be garbage-collected.
+    """
+
+    @staticmethod
+    async def _claim(digest: str, size: int) -> bool:
+        """
+        Count a reference before the bytes land, so GC never sees a referenced blob at zero
+
+        A blob that GC is deleting can't be claimed: its row only goes once the
+        bytes are gone, and the upload then stores them afresh. A delete that
+        stalled (GC died mid-way) is taken over instead.
+
+        Returns:
+            True if the stored bytes may be missing and must be written again
+        """
+        blobs = StoredBlob.get_motor_collection()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CLAIM_WAIT_SECONDS
+        while True:
+            now = datetime.utcnow()
+            try:
+                await blobs.update_one(
+                    {"digest": digest, "deleting_at": None},
+                    {
+                        "$inc": {"ref_count": 1},
+                        "$set": {"updated_at": now},
+                        "$setOnInsert": {"size": size, "content_type": "application/pdf", "created_at": now}
+                    },
+                    upsert=True
+                )
+                return False
+            except DuplicateKeyError:
+                # The row exists and is being deleted
+                pass
+
+            if loop.time() >= deadline:
+                taken_over = await blobs.update_one(
+                    {"digest": digest, "deleting_at": {"$lt": now - timedelta(seconds=GC_DELETE_STALE_SECONDS)}},
+                    {"$set": {"deleting_at": None, "updated_at": now}, "$inc": {"ref_count": 1}}
+                )
+                if taken_over.modified_count:
+                    return True
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Document store is busy, please try again"
+                )
+            await asyncio.sleep(0.1)
+
+    @staticmethod
+    async def _store(digest: str, size: int, temp_path: str) -> bool:
+        """
+        Claim a reference and move the uploaded file into the store
+
+        The reference is released again if the store rejects the file, and
+        the temp file is always cleaned up.
+
+        Returns:
+            True if the content was new to the store
+        """
+        store = get_blob_store()
+        try:
+            rewrite = await ParDocumentService._claim(digest, size)
+            try:
+                if rewrite:
+                    await store.delete(digest)
+                return await store.put_file(digest, temp_path, "application/pdf")
+            except Exception:
+                await ParDocumentService.release(digest)
+                raise
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    async def release(digest: Optional[str]):
+        """Drop one reference to a blob"""
+        if not digest:
+            return
+        await StoredBlob.get_motor_collection().update_one(
+            {"digest": digest},
+            {"$inc": {"ref_count": -1}, "$set": {"updated_at": datetime.utcnow()}}
+        )
+
+    @staticmethod
+    async def attach(kind: str, item_id: str, file: UploadFile) -> Dict:
+        """
+        Store an uploaded PAR and point the item at it
+
+        Args:
+            kind: equipment or furniture
+            item_id: Item the document belongs to
+            file: Uploaded PDF
+
+        Returns:
+            Upload summary (key, digest, size, whether the content was already stored)
+        """
+        document_model, _ = INVENTORY_KINDS[kind]
+        collection = document_model.get_motor_collection()
+        not_found = HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{kind.capitalize()} not found"
+        )
+
+        if not ObjectId.is_valid(item_id) or not await collection.find_one({"_id": ObjectId(item_id)}, {"_id": 1}):
+            raise not_found
+
+        store = get_blob_store()
+        temp_path, digest, size = await receive_pdf_upload(file, store.temp_dir)
+        is_new = await ParDocumentService._store(digest, size, temp_path)
+
+        key = store.key(digest)
+        before = await collection.find_one_and_update(
+            {"_id": ObjectId(item_id)},
+            {"$set": {"par_sha256": digest, "par_file_path": key, "updated_at": datetime.utcnow()}},
+            projection={"par_sha256": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        if before is None:
+            # Deleted while uploading
+            await ParDocumentService.release(digest)
+            raise not_found
+
+        # The replaced document (or this one, on a re-upload of the same file) loses a reference
+        await ParDocumentService.release(before.get("par_sha256"))
+        await InventoryStatsService.bump_version(kind)
+
+        return {
+            "message": "PAR document uploaded successfully",
+            "file_path": key,
+            "sha256": digest,
+            "size": size,
+            "deduplicated": not is_new
+        }
+
+    @staticmethod
+    async def migrate_legacy(kind: str, item: Dict) -> Optional[str]:
+        """
+        Move a pre-blob-store upload (par_file_path on this node's disk) into the document store
+
+        The item is only repointed if it still references the same file.
+
+        Returns:
+            The document's digest, or None if the item changed meanwhile
+        """
+        document_model, _ = INVENTORY_KINDS[kind]
+        path = item["par_file_path"]
+        store = get_blob_store()
+
+        # Same checks as an upload: PDF header, size cap, streamed hashing
+        async with aiofiles.open(path, "rb") as source:
+            temp_path, digest, size = await receive_pdf_upload(source, store.temp_dir)
+        await ParDocumentService._store(digest, size, temp_path)
+
+        result = await document_model.get_motor_collection().update_one(
+            {"_id": item["_id"], "par_file_path": path, "par_sha256": None},
+            {"$set": {"par_sha256": digest, "par_file_path": store.key(digest)}}
+        )
+        if not result.modified_count:
+            await ParDocumentService.release(digest)
+            return None
+        return digest
+
+    @staticmethod
+    async def authorized_item(kind: str, item_id: str, current_user: User) -> Dict:
+        """The item's PAR fields, if the user is an admin or the assignee"""
+        document_model, _ = INVENTORY_KINDS[kind]
+        item = None
+        if ObjectId.is_valid(item_id):
+            item = await document_model.get_motor_collection().find_one(
+                {"_id": ObjectId(item_id)},
+                {"assigned_to_user_id": 1, "property_number": 1, "par_sha256": 1, "par_file_path": 1}
+            )
+        if item is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{kind.capitalize()} not found"
+            )
+
+        if current_user.role != "admin" and item.get("assigned_to_user_id") != str(current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have access to this PAR document"
+            )
+        return item
+
+    @staticmethod
+    async def download(
+        kind: str,
+        item_id: str,
+        request: Request,
+        current_user: User,
+        version: Optional[str] = None
+    ) -> Response:
+        """
+        Serve an item's PAR to its assignee or an admin
+
+        Blob-store documents get their SHA-256 as a strong ETag; requests that
+        name it (`?v=<sha256>`) may be cached for a year, since that URL's
+        content can never change. Pre-blob-store uploads are still served from
+        their original path.
+        """
+        item = await ParDocumentService.authorized_item(kind, item_id, current_user)
+        missing = HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="PAR document not found"
+        )
+        filename = f"PAR_{item.get('property_number')}.pdf"
+
+        digest = item.get("par_sha256")
+        if digest:
+            if settings.PAR_DOWNLOAD_MODE == "redirect":
+                link = await FileLinkService.create_link(request, digest, filename, "application/pdf")
+                return RedirectResponse(link["url"], status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+            return await FileLinkService.blob_response(
+                request,
+                digest,
+                filename,
+                "application/pdf",
+                cache_control=IMMUTABLE if version == digest else REVALIDATE,
+                not_found_detail="PAR document not found"
+            )
+
+        path = item.get("par_file_path")
+        if not path:
+            raise missing
+        try:
+            stat = await aiofiles.os.stat(path)
+        except FileNotFoundError:
+            raise missing
+        chunk_size = settings.UPLOAD_CHUNK_SIZE
+        return file_download(
+            request,
+            read=lambda start, end: read_file_range(path, chunk_size, start, end),
+            size=stat.st_size,
+            etag=make_etag(path, stat.st_size, stat.st_mtime_ns),
+            filename=filename,
+            media_type="application/pdf",
+            last_modified=datetime.utcfromtimestamp(int(stat.st_mtime)),
+            file_path=path
+        )
+
+    @staticmethod
+    async def link(kind: str, item_id: str, request: Request, current_user: User) -> Dict:
+        """Time-limited direct download link for an item's PAR"""
+        item = await ParDocumentService.authorized_item(kind, item_id, current_user)
+        digest = item.get("par_sha256")
+        if not digest:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No PAR document in the document store (run scripts/migrate_par_files.py)"
+                if item.get("par_file_path") else "PAR document not found"
+            )
+        return await FileLinkService.create_link(
+            request, digest, f"PAR_{item.get('property_number')}.pdf", "application/pdf"
+        )
+
+    @staticmethod
+    async def recount() -> int:
+        """Rebuild every reference count from the inventory collections; returns blobs updated"""
+        counts: Dict[str, int] = {}
+        for document_model, _ in INVENTORY_KINDS.values():
+            pipeline = [
+                {"$match": {"par_sha256": {"$type": "string"}}},
+                {"$group": {"_id": "$par_sha256", "count": {"$sum": 1}}}
+            ]
+            async for row in document_model.get_motor_collection().aggregate(pipeline):
+                counts[row["_id"]] = counts.get(row["_id"], 0) + row["count"]
+
+        blobs = StoredBlob.get_motor_collection()
+        updated = 0
+        async for blob in blobs.find({}, {"digest": 1, "ref_count": 1}):
+            count = counts.get(blob["digest"], 0)
+            if blob["ref_count"] != count:
+                await blobs.update_one(
+                    {"_id": blob["_id"]},
+                    {"$set": {"ref_count": count, "updated_at": datetime.utcnow()}}
+                )
+                updated += 1
+        return updated
+
+    @staticmethod
+    async def collect_garbage(dry_run: bool = False) -> Dict:
+        """
+        Delete blobs nobody references
+
+        Only blobs unreferenced for longer than BLOB_GC_GRACE_SECONDS are
+        removed. The row is first marked as deleting (only while still
+        unreferenced), then the bytes go, then the row; uploads of the same
+        content wait for the row to disappear and store the bytes afresh, so
+        an item can never end up pointing at deleted bytes. Stored files
+        without any reference row are removed too.
+        """
+        store = get_blob_store()
+        blobs = StoredBlob.get_motor_collection()
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.BLOB_GC_GRACE_SECONDS)
+
+        removed = []
+        async for blob in blobs.find({"ref_count": {"$lte": 0}, "updated_at": {"$lt": cutoff}}, {"digest": 1}):
+            if dry_run:
+                removed.append(blob["digest"])
+                continue
+            marked = await blobs.update_one(
+                {"_id": blob["_id"], "ref_count": {"$lte": 0}, "updated_at": {"$lt": cutoff}},
+                {"$set": {"deleting_at": datetime.utcnow()}}
+            )
+            if marked.modified_count:
+                await store.delete(blob["digest"])
+                await blobs.delete_one({"_id": blob["_id"], "deleting_at": {"$ne": None}})
+                removed.append(blob["digest"])
+
+        known = {blob["digest"] async for blob in blobs.find({}, {"digest": 1})}
+        untracked = []
+        async for digest in store.iter_digests():
+            if digest in known or digest in removed:
+                continue
+            path = store.local_path(digest)
+            if path and datetime.utcfromtimestamp(os.path.getmtime(path)) >= cutoff:
+                continue
+            if await blobs.find_one({"digest": digest}, {"_id": 1}):
+                # Claimed since the sweep started
+                continue
+            if not dry_run:
+                await store.delete(digest)
+            untracked.append(digest)
+
+        print(f"🧹 Blob GC: {len(removed)} unreferenced, {len(untracked)} untracked"
+              + (" [dry run]" if dry_run else " removed"))
+        return {"dry_run": dry_run, "unreferenced": removed, "untracked": untracked}
@@ -0,0 +1,95 @@
+# backend/app/services/file_link_service.py
+from datetime import datetime, timedelta
+from typing import Dict
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.config import settings
+from app.storage import get_blob_store
+from app.utils.downloads import IMMUTABLE, file_download
+from app.utils.http_cache import REVALIDATE
+from app.utils.signed_links import sign_link, verify_link
+
+
+def _link_secret() -> str:
+    # Separate from the JWT signing input so a link can never pass as a token
+    return f"{settings.SECRET_KEY}:file-links"
+
+
+class FileLinkService:
+    """
+    Serving stored blobs: authorized downloads and direct download links
+
+    A direct link is a presigned URL on backends that support it (S3), or a
+    signed /api/files link otherwise. Either way the link itself is the
+    credential, so file traffic needs no user or item lookup.
+    """
+
+    @staticmethod
+    async def blob_response(
+        request: Request,
+        digest: str,
+        filename: str,
+        content_type: str,
+        cache_control: str = REVALIDATE,
+        not_found_detail: str = "File not found"
+    ) -> Response:
+        """Stream (or offload) a blob with its SHA-256 as a strong ETag"""
+        store = get_blob_store()
+        size = await store.size(digest)
+        if size is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=not_found_detail
+            )
+        chunk_size = settings.UPLOAD_CHUNK_SIZE
+        # Only files on local disk can be handed to the fronting server
+        file_path = store.local_path(digest)
+        return file_download(
+            request,
+            read=lambda start, end: store.read(digest, chunk_size, start, end),
+            size=size,
+            etag=f'"{digest}"',
+            filename=filename,
+            media_type=content_type,
+            cache_control=cache_control,
+            file_path=file_path,
+            accel_uri=settings.PAR_ACCEL_REDIRECT_PREFIX + store.key(digest) if file_path else None
+        )
+
+    @staticmethod
+    async def create_link(request: Request, digest: str, filename: str, content_type: str) -> Dict:
+        """
+        Time-limited direct download link for a blob
+
+        Call only after the caller has been authorized for the file.
+
+        Returns:
+            {"url": ..., "expires_at": ...}
+        """
+        expires_in = settings.DOWNLOAD_LINK_TTL_SECONDS
+        expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+
+        url = await get_blob_store().presigned_url(digest, filename, content_type, expires_in)
+        if url is None:
+            token = sign_link(
+                _link_secret(),
+                {"d": digest, "f": filename, "t": content_type},
+                expires_in
+            )
+            url = str(request.url_for("download_signed_file", token=token))
+
+        return {"url": url, "expires_at": expires_at}
+
+    @staticmethod
+    async def serve_link(request: Request, token: str) -> Response:
+        """Serve the blob behind a signed /api/files link"""
+        claims = verify_link(_link_secret(), token)
+        if claims is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Download link is invalid or has expired"
+            )
+        return await FileLinkService.blob_response(
+            request, claims["d"], claims["f"], claims["t"], cache_control=IMMUTABLE
+        )
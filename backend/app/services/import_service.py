@@ -0,0 +1,249 @@
+# backend/app/services/import_service.py
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from pymongo.errors import BulkWriteError
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.models.user import User
+from app.services.audit_service import AuditService, INVENTORY_AUDIT_RESOURCES
+from app.services.stats_service import INVENTORY_KINDS, InventoryStatsService
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def _chunks(items: List, size: int) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _raw_rows(file: BinaryIO, import_format: str) -> Iterator[Tuple[int, object]]:
+    """(line number, raw row) pairs - a row that can't be parsed is yielded as an exception"""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if import_format == "csv":
+            reader = csv.DictReader(text)
+            for row in reader:
+                # Blank cells mean "not provided" so schema defaults apply
+                yield reader.line_num, {
+                    key.strip(): value.strip()
+                    for key, value in row.items()
+                    if key and value is not None and value.strip() != ""
+                }
+        else:
+            for line_number, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, e
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be UTF-8 encoded"
+        )
+    finally:
+        # Leave the upload's file open for FastAPI to close
+        text.detach()
+
+
+def _validate_rows(
+    file: BinaryIO,
+    import_format: str,
+    create_schema: Type[BaseModel]
+) -> Tuple[List[Tuple[int, BaseModel]], List[Dict]]:
+    """Parse and validate every row - CPU bound, runs in the thread pool"""
+    valid: List[Tuple[int, BaseModel]] = []
+    errors: List[Dict] = []
+
+    for count, (line, raw) in enumerate(_raw_rows(file, import_format), start=1):
+        if count > settings.IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Too many rows. Maximum is {settings.IMPORT_MAX_ROWS}"
+            )
+
+        if isinstance(raw, Exception):
+            errors.append({"line": line, "property_number": None, "errors": [f"Invalid JSON: {raw}"]})
+            continue
+        if not isinstance(raw, dict):
+            errors.append({"line": line, "property_number": None, "errors": ["Row must be a JSON object"]})
+            continue
+
+        try:
+            valid.append((line, create_schema.model_validate(raw)))
+        except ValidationError as e:
+            errors.append({
+                "line": line,
+                "property_number": raw.get("property_number"),
+                "errors": [
+                    f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+                    for error in e.errors()
+                ]
+            })
+
+    return valid, errors
+
+
+class ImportService:
+    """Bulk equipment/furniture import from CSV or NDJSON uploads"""
+
+    @staticmethod
+    def resolve_format(filename: Optional[str], import_format: Optional[str]) -> str:
+        """Explicit format wins, otherwise go by the file extension"""
+        if import_format:
+            return import_format
+        extension = os.path.splitext(filename or "")[1].lower().lstrip(".")
+        if extension in ("ndjson", "jsonl"):
+            return "ndjson"
+        if extension == "csv":
+            return "csv"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown file type. Upload a .csv or .ndjson file, or pass format=csv|ndjson"
+        )
+
+    @staticmethod
+    async def import_file(
+        kind: str,
+        create_schema: Type[BaseModel],
+        file: BinaryIO,
+        import_format: str,
+        current_admin: User,
+        dry_run: bool = False
+    ) -> Dict:
+        """
+        Validate, de-duplicate and insert an inventory file
+
+        Args:
+            kind: equipment or furniture
+            create_schema: Schema every row is validated against
+            file: Uploaded file (binary)
+            import_format: csv or ndjson
+            current_admin: Admin performing the import (created_by + audit)
+            dry_run: Validate and report without writing anything
+
+        Returns:
+            Summary with a per-row error report (line numbers refer to the file)
+        """
+        document_model, _ = INVENTORY_KINDS[kind]
+        collection = document_model.get_motor_collection()
+        batch_size = settings.IMPORT_BATCH_SIZE
+
+        valid, errors = await run_in_threadpool(_validate_rows, file, import_format, create_schema)
+        total_rows = len(valid) + len(errors)
+
+        # Duplicates inside the file - first occurrence wins
+        seen = set()
+        unique: List[Tuple[int, BaseModel]] = []
+        for line, item in valid:
+            if item.property_number in seen:
+                errors.append({
+                    "line": line,
+                    "property_number": item.property_number,
+                    "errors": ["Duplicate property number in file"]
+                })
+                continue
+            seen.add(item.property_number)
+            unique.append((line, item))
+
+        # Duplicates already in the database - one $in query per batch
+        existing = set()
+        for numbers in _chunks(list(seen), batch_size):
+            async for doc in collection.find({"property_number": {"$in": numbers}}, {"property_number": 1}):
+                existing.add(doc["property_number"])
+
+        now = datetime.utcnow()
+        pending: List[Tuple[int, Dict]] = []
+        for line, item in unique:
+            if item.property_number in existing:
+                errors.append({
+                    "line": line,
+                    "property_number": item.property_number,
+                    "errors": ["Property number already exists"]
+                })
+                continue
+            document = document_model(
+                **item.model_dump(),
+                created_by=current_admin.email,
+                created_at=now,
+                updated_at=now
+            )
+            pending.append((line, document.model_dump(exclude={"id", "revision_id"})))
+
+        inserted: List[Dict] = []
+        if not dry_run:
+            for batch in _chunks(pending, batch_size):
+                failed = {}
+                try:
+                    await collection.insert_many([doc for _, doc in batch], ordered=False)
+                except BulkWriteError as e:
+                    # Unordered: everything except the reported rows was written
+                    failed = {error["index"]: error for error in e.details.get("writeErrors", [])}
+
+                for index, (line, doc) in enumerate(batch):
+                    error = failed.get(index)
+                    if error is None:
+                        inserted.append(doc)
+                        continue
+                    errors.append({
+                        "line": line,
+                        "property_number": doc["property_number"],
+                        "errors": [
+                            "Property number already exists" if error.get("code") == DUPLICATE_KEY_ERROR
+                            else error.get("errmsg", "Insert failed")
+                        ]
+                    })
+
+            if inserted:
+                await InventoryStatsService.record_changes(
+                    kind, [(None, InventoryStatsService.snapshot_document(kind, doc)) for doc in inserted]
+                )
+                await ImportService._audit(kind, inserted, current_admin)
+
+        print(f"📦 Import ({kind}): {len(inserted)} inserted, {len(errors)} rejected of {total_rows} rows"
+              + (" [dry run]" if dry_run else ""))
+
+        return {
+            "dry_run": dry_run,
+            "total_rows": total_rows,
+            "valid_rows": len(pending),
+            "inserted": len(inserted),
+            "failed": len(errors),
+            "errors": sorted(errors, key=lambda error: error["line"])
+        }
+
+    @staticmethod
+    async def _audit(kind: str, documents: List[Dict], current_admin: User):
+        _, type_field = INVENTORY_KINDS[kind]
+        resource_type, resource_name = INVENTORY_AUDIT_RESOURCES[kind]
+
+        for batch in _chunks(documents, settings.IMPORT_BATCH_SIZE):
+            await AuditService.log_actions(current_admin, [
+                {
+                    "action": "CREATE",
+                    "resource_type": resource_type,
+                    "resource_id": str(doc["_id"]),
+                    "resource_name": resource_name(doc),
+                    "changes": {
+                        "property_number": doc["property_number"],
+                        type_field: doc[type_field],
+                        "status": doc["status"]
+                    },
+                    "new_values": {
+                        "property_number": doc["property_number"],
+                        type_field: doc[type_field],
+                        "status": doc["status"]
+                    },
+                    "notes": "Bulk import"
+                }
+                for doc in batch
+            ])
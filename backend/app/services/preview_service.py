@@ -0,0 +1,201 @@
+# backend/app/services/preview_service.py
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set
+
+import aiofiles
+from fastapi import HTTPException, Request, Response, status
+
+from app.config import settings
+from app.models.blob import StoredBlob
+from app.models.user import User
+from app.services.document_service import ParDocumentService
+from app.storage import get_blob_store
+from app.utils.downloads import IMMUTABLE
+from app.utils.http_cache import REVALIDATE, make_etag, not_modified_response, set_cache_validators
+from app.utils.pdf_preview import THUMBNAIL_TYPE, render_preview
+
+# Rendering is CPU-bound and pdfium isn't thread-safe, so it runs in worker
+# processes. "spawn" keeps the workers clear of the event loop's threads and
+# sockets. Beyond PREVIEW_MAX_PENDING queued renders new ones are skipped
+# (scripts/backfill_previews.py picks them up later).
+_preview_executor: Optional[ProcessPoolExecutor] = None
+_preview_tasks: Set[asyncio.Task] = set()
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _preview_executor
+    if _preview_executor is None:
+        _preview_executor = ProcessPoolExecutor(
+            max_workers=settings.PREVIEW_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _preview_executor
+
+
+def _reset_executor():
+    global _preview_executor
+    if _preview_executor is not None:
+        _preview_executor.shutdown(wait=False, cancel_futures=True)
+        _preview_executor = None
+
+
+def shutdown_preview_worker():
+    """Stop rendering; previews left pending are re-claimed after PREVIEW_STALE_SECONDS"""
+    for task in list(_preview_tasks):
+        task.cancel()
+    if _preview_executor is not None:
+        _preview_executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ParPreviewService:
+    """First-page thumbnails and page counts for PAR documents, kept on the blob's row"""
+
+    @staticmethod
+    def schedule(digest: str):
+        """Queue preview generation for a stored PDF without waiting for it"""
+        if len(_preview_tasks) >= settings.PREVIEW_MAX_PENDING:
+            print(f"⚠️  Preview queue full, skipping {digest[:12]}")
+            return
+        task = asyncio.create_task(ParPreviewService.generate(digest))
+        _preview_tasks.add(task)
+        task.add_done_callback(_preview_tasks.discard)
+
+    @staticmethod
+    async def _claim(digest: str, force: bool) -> bool:
+        # One node renders each document; a render abandoned mid-way can be claimed again
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=settings.PREVIEW_STALE_SECONDS)
+        claimable = [
+            {"preview_status": None},
+            {"preview_status": "failed"},
+            {"preview_status": "pending", "preview_started_at": {"$lt": stale}}
+        ]
+        if force:
+            claimable += [{"preview_status": "ready"}, {"preview_status": "unavailable"}]
+        result = await StoredBlob.get_motor_collection().update_one(
+            {"digest": digest, "$or": claimable},
+            {"$set": {"preview_status": "pending", "preview_started_at": now}}
+        )
+        return result.modified_count == 1
+
+    @staticmethod
+    async def generate(digest: str, force: bool = False) -> Optional[str]:
+        """
+        Render and store the preview for one blob
+
+        Returns:
+            The resulting preview status, or None if another worker has it
+        """
+        if not await ParPreviewService._claim(digest, force):
+            return None
+
+        store = get_blob_store()
+        path = store.local_path(digest)
+        temp_path = None
+        update: Dict = {"preview_error": None}
+        try:
+            if path is None:
+                # Remote backend - the renderer needs a file, so fetch a local copy
+                fd, temp_path = tempfile.mkstemp(dir=store.temp_dir, prefix="preview-", suffix=".pdf")
+                os.close(fd)
+                async with aiofiles.open(temp_path, "wb") as out:
+                    async for chunk in store.read(digest, settings.UPLOAD_CHUNK_SIZE):
+                        await out.write(chunk)
+                path = temp_path
+
+            loop = asyncio.get_running_loop()
+            preview = await loop.run_in_executor(
+                _executor(), render_preview, path, settings.PREVIEW_THUMBNAIL_WIDTH
+            )
+            update.update({
+                "preview_status": "ready",
+                "page_count": preview["page_count"],
+                "pdf_metadata": preview["metadata"],
+                "thumbnail": preview["thumbnail"],
+                "thumbnail_width": preview["width"],
+                "thumbnail_height": preview["height"]
+            })
+        except ImportError as e:
+            update.update({"preview_status": "unavailable", "preview_error": str(e)})
+        except BrokenProcessPool as e:
+            # A worker died (e.g. a PDF crashed pdfium) - start a fresh pool for the next render
+            _reset_executor()
+            update.update({"preview_status": "failed", "preview_error": str(e)[:500]})
+        except Exception as e:
+            print(f"❌ Preview failed for {digest[:12]}: {e}")
+            update.update({"preview_status": "failed", "preview_error": str(e)[:500]})
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        await StoredBlob.get_motor_collection().update_one(
+            {"digest": digest},
+            {"$set": {**update, "preview_started_at": None}}
+        )
+        return update["preview_status"]
+
+    @staticmethod
+    async def get_preview(kind: str, item_id: str, current_user: User) -> Dict:
+        """Page count, metadata and thumbnail link for an item's PAR - no PDF bytes"""
+        item = await ParDocumentService.authorized_item(kind, item_id, current_user)
+        digest = item.get("par_sha256")
+        if not digest:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="PAR document not found"
+            )
+
+        blob = await StoredBlob.get_motor_collection().find_one(
+            {"digest": digest}, {"thumbnail": 0}
+        ) or {}
+        ready = blob.get("preview_status") == "ready"
+        return {
+            "sha256": digest,
+            "size": blob.get("size"),
+            "status": blob.get("preview_status") or "pending",
+            "page_count": blob.get("page_count"),
+            "metadata": blob.get("pdf_metadata") or {},
+            "thumbnail_url": f"/api/{kind}/{item_id}/par-thumbnail?v={digest}" if ready else None,
+            "thumbnail_width": blob.get("thumbnail_width"),
+            "thumbnail_height": blob.get("thumbnail_height")
+        }
+
+    @staticmethod
+    async def thumbnail(
+        kind: str,
+        item_id: str,
+        request: Request,
+        current_user: User,
+        version: Optional[str] = None
+    ) -> Response:
+        """The first-page thumbnail of an item's PAR"""
+        item = await ParDocumentService.authorized_item(kind, item_id, current_user)
+        digest = item.get("par_sha256")
+        not_ready = HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="PAR preview not available"
+        )
+        if not digest:
+            raise not_ready
+
+        etag = make_etag(digest, "thumbnail", settings.PREVIEW_THUMBNAIL_WIDTH)
+        cache_control = IMMUTABLE if version == digest else REVALIDATE
+        not_modified = not_modified_response(request, etag, cache_control=cache_control)
+        if not_modified is not None:
+            return not_modified
+
+        blob = await StoredBlob.get_motor_collection().find_one(
+            {"digest": digest, "preview_status": "ready"}, {"thumbnail": 1}
+        )
+        if not blob or not blob.get("thumbnail"):
+            raise not_ready
+
+        response = Response(content=bytes(blob["thumbnail"]), media_type=THUMBNAIL_TYPE)
+        set_cache_validators(response, etag, cache_control=cache_control)
+        return response
@@ -0,0 +1,126 @@
+# backend/app/services/search_service.py
+import re
+from typing import Dict, List, Optional, Tuple, Type
+
+from beanie import Document
+from pydantic import BaseModel
+from pymongo.errors import OperationFailure
+
+from app.models.equipment import Equipment, Furniture
+from app.repositories.asset_repository import AssetRepository
+from app.utils.cursor import encode_cursor, decode_cursor
+
+# Fields matched by prefix (each has its own index); the rest is covered by the search_text index
+IDENTIFIER_FIELDS = {
+    Equipment: ["property_number", "gsd_code", "serial_number"],
+    Furniture: ["property_number", "gsd_code"],
+}
+
+MAX_SEARCH_LIMIT = 100
+
+# "text index required for $text query" - search_text is still being built
+INDEX_NOT_FOUND = 27
+
+
+class InventorySearchService:
+    """
+    Ranked inventory search in two phases:
+
+    1. Identifier prefix matches (property/GSD/serial number), ordered by
+       property_number and paged by keyset - these are the most relevant hits.
+    2. Full-text matches on the search_text index, ordered by text score and
+       excluding everything phase 1 returns.
+
+    The continuation token records the phase and position within it. While
+    the search_text index is still being built, only phase 1 results come back.
+    """
+
+    @staticmethod
+    def _prefix_clause(document_model: Type[Document], query: str) -> Dict:
+        # Anchored, case-sensitive regexes are answered from the identifier indexes
+        variants = {query, query.upper()}
+        patterns = [re.compile("^" + re.escape(variant)) for variant in variants]
+        return {
+            "$or": [
+                {field: {"$in": patterns}}
+                for field in IDENTIFIER_FIELDS[document_model]
+            ]
+        }
+
+    @staticmethod
+    async def search(
+        document_model: Type[Document],
+        schema: Type[BaseModel],
+        query: str,
+        filters: Dict,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[BaseModel], Optional[str]]:
+        """
+        Search equipment or furniture
+
+        Args:
+            document_model: Equipment or Furniture
+            schema: Response schema to build items with
+            query: Search text
+            filters: Exact-match filters (type, status)
+            limit: Page size
+            cursor: Continuation token from a previous page
+
+        Returns:
+            (items, next_cursor) - next_cursor is None on the last page
+        """
+        collection = document_model.get_motor_collection()
+        projection = AssetRepository.response_projection(schema)
+        prefix_clause = InventorySearchService._prefix_clause(document_model, query)
+        limit = min(limit, MAX_SEARCH_LIMIT)
+
+        position = decode_cursor(cursor) if cursor else {"phase": "prefix"}
+        items: List[BaseModel] = []
+
+        if position.get("phase") == "prefix":
+            prefix_filter = {**filters, **prefix_clause}
+            if "after" in position:
+                prefix_filter["property_number"] = {"$gt": position["after"]}
+
+            docs = await collection.find(prefix_filter, projection) \
+                .sort("property_number", 1) \
+                .limit(limit + 1) \
+                .to_list(length=limit + 1)
+
+            if len(docs) > limit:
+                page = docs[:limit]
+                next_cursor = encode_cursor({"phase": "prefix", "after": page[-1]["property_number"]})
+                return [AssetRepository.to_response(schema, doc) for doc in page], next_cursor
+
+            items = [AssetRepository.to_response(schema, doc) for doc in docs]
+            position = {"phase": "text", "offset": 0}
+
+        # Text phase - textScore order has no keyset, so it pages by offset
+        offset = int(position.get("offset", 0))
+        remaining = limit - len(items)
+        text_filter = {
+            **filters,
+            "$text": {"$search": query},
+            "$nor": [prefix_clause]
+        }
+
+        try:
+            docs = await collection.find(text_filter, {**projection, "score": {"$meta": "textScore"}}) \
+                .sort([("score", {"$meta": "textScore"}), ("_id", 1)]) \
+                .skip(offset) \
+                .limit(remaining + 1) \
+                .to_list(length=remaining + 1)
+        except OperationFailure as e:
+            if e.code != INDEX_NOT_FOUND:
+                raise
+            # Identifier matches still work until the text index is ready
+            print(f"⚠️  Search: no text index on {collection.name} yet, returning identifier matches only")
+            return items, None
+
+        next_cursor = None
+        if len(docs) > remaining:
+            next_cursor = encode_cursor({"phase": "text", "offset": offset + remaining})
+
+        items.extend(AssetRepository.to_response(schema, doc) for doc in docs[:remaining])
+        return items, next_cursor
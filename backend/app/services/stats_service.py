@@ -0,0 +1,174 @@
+# backend/app/services/stats_service.py
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.models.equipment import Equipment, Furniture
+from app.models.stats import InventoryCounters
+
+# Inventory kind -> (document model, name of its type field)
+INVENTORY_KINDS = {
+    "equipment": (Equipment, "equipment_type"),
+    "furniture": (Furniture, "furniture_type"),
+}
+
+BREAKDOWNS = {
+    "by_status": "status",
+    "by_type": "type",
+    "by_condition": "condition",
+}
+
+
+def counter_key(value) -> str:
+    """Make a field value safe to use as a key in the counters document"""
+    key = str(value) if value is not None else "Unknown"
+    return key.replace(".", "_").lstrip("$") or "Unknown"
+
+
+def _group_counts(rows: List[Dict]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for row in rows:
+        key = counter_key(row["_id"])
+        counts[key] = counts.get(key, 0) + row["count"]
+    return counts
+
+
+class InventoryStatsService:
+    """Inventory breakdowns served from write-maintained counters"""
+
+    @staticmethod
+    def snapshot(kind: str, item) -> Dict:
+        """The fields of an equipment/furniture item that the counters track"""
+        _, type_field = INVENTORY_KINDS[kind]
+        return {
+            "status": item.status,
+            "type": getattr(item, type_field),
+            "condition": item.condition
+        }
+
+    @staticmethod
+    def snapshot_document(kind: str, doc: Dict) -> Dict:
+        """Same as snapshot, for a raw Mongo document"""
+        _, type_field = INVENTORY_KINDS[kind]
+        return {
+            "status": doc.get("status"),
+            "type": doc.get(type_field),
+            "condition": doc.get("condition")
+        }
+
+    @staticmethod
+    async def compute(kind: str) -> Dict:
+        """Count status/type/condition breakdowns in a single $facet aggregation"""
+        document_model, type_field = INVENTORY_KINDS[kind]
+
+        pipeline = [
+            {
+                "$facet": {
+                    "total": [{"$count": "count"}],
+                    "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+                    "by_type": [{"$group": {"_id": f"${type_field}", "count": {"$sum": 1}}}],
+                    "by_condition": [{"$group": {"_id": "$condition", "count": {"$sum": 1}}}]
+                }
+            }
+        ]
+        results = await document_model.get_motor_collection().aggregate(pipeline).to_list(length=1)
+        facets = results[0] if results else {}
+
+        total = facets.get("total") or []
+        return {
+            "total": total[0]["count"] if total else 0,
+            "by_status": _group_counts(facets.get("by_status", [])),
+            "by_type": _group_counts(facets.get("by_type", [])),
+            "by_condition": _group_counts(facets.get("by_condition", []))
+        }
+
+    @staticmethod
+    async def rebuild(kind: str) -> Dict:
+        """Recount from the inventory collection and overwrite the counters document"""
+        counts = await InventoryStatsService.compute(kind)
+        now = datetime.utcnow()
+
+        await InventoryCounters.get_motor_collection().update_one(
+            {"kind": kind},
+            {"$set": {**counts, "rebuilt_at": now, "updated_at": now}, "$inc": {"version": 1}},
+            upsert=True
+        )
+        return {**counts, "rebuilt_at": now}
+
+    @staticmethod
+    async def get_stats(kind: str, refresh: bool = False) -> Dict:
+        """Read the counters document (one indexed lookup), rebuilding it if missing"""
+        if not refresh:
+            doc = await InventoryCounters.get_motor_collection().find_one({"kind": kind})
+            if doc is not None:
+                return {
+                    "total": doc.get("total", 0),
+                    **{
+                        breakdown: {key: count for key, count in doc.get(breakdown, {}).items() if count}
+                        for breakdown in BREAKDOWNS
+                    },
+                    "rebuilt_at": doc.get("rebuilt_at")
+                }
+
+        return await InventoryStatsService.rebuild(kind)
+
+    @staticmethod
+    async def record_change(kind: str, old: Optional[Dict] = None, new: Optional[Dict] = None):
+        """
+        Incrementally update the counters for one item
+
+        Args:
+            kind: equipment or furniture
+            old: Snapshot before the change (None for creates)
+            new: Snapshot after the change (None for deletes)
+        """
+        await InventoryStatsService.record_changes(kind, [(old, new)])
+
+    @staticmethod
+    async def record_changes(kind: str, changes: List[tuple]):
+        """Apply many (old, new) snapshot pairs as a single $inc"""
+        increments: Dict[str, int] = {}
+
+        def add(key: str, amount: int):
+            increments[key] = increments.get(key, 0) + amount
+
+        for old, new in changes:
+            for snapshot, amount in ((old, -1), (new, 1)):
+                if snapshot is None:
+                    continue
+                for breakdown, field in BREAKDOWNS.items():
+                    add(f"{breakdown}.{counter_key(snapshot[field])}", amount)
+            if old is None and new is not None:
+                add("total", 1)
+            elif old is not None and new is None:
+                add("total", -1)
+
+        increments = {key: amount for key, amount in increments.items() if amount}
+        # Every write bumps the version, even when no count changed
+        increments["version"] = 1
+
+        collection = InventoryCounters.get_motor_collection()
+        result = await collection.update_one(
+            {"kind": kind},
+            {"$inc": increments, "$set": {"updated_at": datetime.utcnow()}}
+        )
+        if result.matched_count == 0:
+            # No counters yet - a full recount already includes this change
+            await InventoryStatsService.rebuild(kind)
+
+    @staticmethod
+    async def bump_version(kind: str):
+        """Mark the inventory as changed for writes that don't affect any counter"""
+        await InventoryStatsService.record_changes(kind, [])
+
+    @staticmethod
+    async def get_version(kind: str) -> Tuple[int, Optional[datetime]]:
+        """Collection-level (version, last write time), used to build list ETags"""
+        doc = await InventoryCounters.get_motor_collection().find_one(
+            {"kind": kind}, {"version": 1, "updated_at": 1}
+        )
+        if doc is None:
+            await InventoryStatsService.rebuild(kind)
+            doc = await InventoryCounters.get_motor_collection().find_one(
+                {"kind": kind}, {"version": 1, "updated_at": 1}
+            )
+        return doc.get("version", 0), doc.get("updated_at")
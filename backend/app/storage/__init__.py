@@ -0,0 +1,42 @@
+# backend/app/storage/__init__.py
+import os
+import tempfile
+from typing import Optional
+
+from app.config import settings
+from app.storage.base import BlobStore
+from app.storage.gridfs import GridFSBlobStore
+from app.storage.local import LocalBlobStore
+from app.storage.s3 import S3BlobStore
+
+_blob_store: Optional[BlobStore] = None
+
+
+def _upload_temp_dir() -> str:
+    return settings.UPLOAD_TEMP_DIR or os.path.join(tempfile.gettempdir(), "pcc-pass-uploads")
+
+
+def get_blob_store() -> BlobStore:
+    """The configured blob store (created on first use)"""
+    global _blob_store
+    if _blob_store is None:
+        if settings.STORAGE_BACKEND == "local":
+            _blob_store = LocalBlobStore(settings.BLOB_STORE_DIR)
+        elif settings.STORAGE_BACKEND == "gridfs":
+            _blob_store = GridFSBlobStore(settings.GRIDFS_BUCKET, _upload_temp_dir())
+        elif settings.STORAGE_BACKEND == "s3":
+            _blob_store = S3BlobStore(
+                endpoint_url=settings.S3_ENDPOINT_URL,
+                bucket=settings.S3_BUCKET,
+                access_key=settings.S3_ACCESS_KEY,
+                secret_key=settings.S3_SECRET_KEY,
+                region=settings.S3_REGION,
+                temp_dir=_upload_temp_dir(),
+                public_endpoint_url=settings.S3_PUBLIC_ENDPOINT_URL or None
+            )
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+    return _blob_store
+
+
+__all__ = ['BlobStore', 'LocalBlobStore', 'GridFSBlobStore', 'S3BlobStore', 'get_blob_store']
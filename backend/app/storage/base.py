@@ -0,0 +1,74 @@
+# backend/app/storage/base.py
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed blob storage.
+
+    Blobs are immutable and keyed by the SHA-256 of their content, so the
+    same bytes are only ever stored once. Reference counting lives in the
+    `blobs` collection (StoredBlob), not in the store itself.
+    """
+
+    # Where uploads are spooled before put_file - same filesystem as the store when possible
+    temp_dir: str
+
+    @staticmethod
+    def key(digest: str) -> str:
+        """Sharded relative key - two levels of 256 directories keep each one small"""
+        return f"{digest[:2]}/{digest[2:4]}/{digest}"
+
+    @abstractmethod
+    async def put_file(self, digest: str, source_path: str, content_type: str = "application/octet-stream") -> bool:
+        """
+        Move a fully written file in as blob `digest`
+
+        The source file is consumed either way.
+
+        Returns:
+            True if the blob was new, False if identical content was already stored
+        """
+
+    @abstractmethod
+    async def exists(self, digest: str) -> bool:
+        """Whether the blob is stored"""
+
+    @abstractmethod
+    async def size(self, digest: str) -> Optional[int]:
+        """Size of the blob in bytes, None if it is not stored"""
+
+    @abstractmethod
+    def read(self, digest: str, chunk_size: int, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream the blob's content, or the inclusive byte range start..end"""
+
+    @abstractmethod
+    async def delete(self, digest: str):
+        """Remove the blob (missing blobs are ignored)"""
+
+    @abstractmethod
+    def iter_digests(self) -> AsyncIterator[str]:
+        """Every stored digest - used by garbage collection"""
+
+    def local_path(self, digest: str) -> Optional[str]:
+        """Filesystem path of the blob, for backends that have one"""
+        return None
+
+    async def presigned_url(
+        self,
+        digest: str,
+        filename: str,
+        content_type: str,
+        expires_in: int
+    ) -> Optional[str]:
+        """
+        Time-limited URL that fetches the blob without going through the API
+
+        Backends that can't sign their own links return None; callers then
+        fall back to a signed link served by /api/files.
+        """
+        return None
+
+    async def close(self):
+        """Release connections at shutdown"""
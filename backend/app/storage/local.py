@@ -0,0 +1,74 @@
+# backend/app/storage/local.py
+import os
+import re
+from typing import AsyncIterator, Optional
+
+import aiofiles
+import aiofiles.os
+
+from app.storage.base import BlobStore
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+async def read_file_range(path: str, chunk_size: int, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+    """Stream a file, or the inclusive byte range start..end of it"""
+    remaining = None if end is None else end - start + 1
+    async with aiofiles.open(path, "rb") as f:
+        if start:
+            await f.seek(start)
+        while remaining is None or remaining > 0:
+            chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files under a root directory: <root>/ab/cd/abcd..."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.temp_dir = os.path.join(root, ".tmp")
+        os.makedirs(self.temp_dir, exist_ok=True)
+
+    def local_path(self, digest: str) -> Optional[str]:
+        return os.path.join(self.root, *self.key(digest).split("/"))
+
+    async def put_file(self, digest: str, source_path: str, content_type: str = "application/octet-stream") -> bool:
+        target = self.local_path(digest)
+        if os.path.exists(target):
+            os.remove(source_path)
+            return False
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Atomic on the same filesystem - readers never see a partial blob
+        os.replace(source_path, target)
+        return True
+
+    async def exists(self, digest: str) -> bool:
+        return os.path.exists(self.local_path(digest))
+
+    async def size(self, digest: str) -> Optional[int]:
+        try:
+            return (await aiofiles.os.stat(self.local_path(digest))).st_size
+        except FileNotFoundError:
+            return None
+
+    def read(self, digest: str, chunk_size: int, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        return read_file_range(self.local_path(digest), chunk_size, start, end)
+
+    async def delete(self, digest: str):
+        try:
+            os.remove(self.local_path(digest))
+        except FileNotFoundError:
+            pass
+
+    async def iter_digests(self) -> AsyncIterator[str]:
+        for directory, subdirectories, filenames in os.walk(self.root):
+            subdirectories[:] = [name for name in subdirectories if not name.startswith(".")]
+            for filename in filenames:
+                if DIGEST_PATTERN.match(filename):
+                    yield filename
@@ -0,0 +1,234 @@
+# backend/app/storage/s3.py
+import hashlib
+import hmac
+import os
+import xml.etree.ElementTree as ElementTree
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+import aiofiles
+
+from app.storage.base import BlobStore
+from app.utils.downloads import content_disposition
+
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+S3_NAMESPACE = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def _quote(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+def _canonical_query(query: Dict[str, str]) -> str:
+    return "&".join(f"{_quote(key)}={_quote(value)}" for key, value in sorted(query.items()))
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+class S3BlobStore(BlobStore):
+    """
+    Blobs as objects in an S3-compatible bucket (AWS S3, MinIO, Ceph RGW...)
+
+    Requests are signed with AWS Signature V4 over httpx, with path-style
+    addressing so a local MinIO works unchanged. Uploads are signed with the
+    blob's own SHA-256 as the payload hash, so the store verifies the bytes.
+    """
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        access_key: str,
+        secret_key: str,
+        region: str,
+        temp_dir: str,
+        public_endpoint_url: Optional[str] = None
+    ):
+        self.endpoint_url = endpoint_url.rstrip("/")
+        # Host browsers use for presigned links, when the API reaches the store on an internal name
+        self.public_endpoint_url = (public_endpoint_url or endpoint_url).rstrip("/")
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.temp_dir = temp_dir
+        os.makedirs(self.temp_dir, exist_ok=True)
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import httpx  # Only needed with STORAGE_BACKEND=s3
+
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(30.0, connect=5.0))
+        return self._client
+
+    def _path(self, key: str = "") -> str:
+        return f"/{_quote(self.bucket)}/{_quote(key, safe='/-_.~')}" if key else f"/{_quote(self.bucket)}"
+
+    def _scope(self, now: datetime) -> Tuple[str, str]:
+        date = now.strftime("%Y%m%d")
+        return date, f"{date}/{self.region}/s3/aws4_request"
+
+    def _signature(self, now: datetime, canonical_request: str) -> str:
+        date, scope = self._scope(now)
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256",
+            now.strftime("%Y%m%dT%H%M%SZ"),
+            scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()
+        ])
+        key = _hmac(f"AWS4{self.secret_key}".encode("utf-8"), date)
+        for part in (self.region, "s3", "aws4_request"):
+            key = _hmac(key, part)
+        return hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def _signed_headers(self, method: str, path: str, query: Dict[str, str], payload_hash: str) -> Dict[str, str]:
+        now = datetime.utcnow()
+        headers = {
+            "host": urlsplit(self.endpoint_url).netloc,
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": now.strftime("%Y%m%dT%H%M%SZ")
+        }
+        signed = ";".join(sorted(headers))
+        canonical_request = "\n".join([
+            method,
+            path,
+            _canonical_query(query),
+            "".join(f"{name}:{headers[name]}\n" for name in sorted(headers)),
+            signed,
+            payload_hash
+        ])
+        _, scope = self._scope(now)
+        headers["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+            f"SignedHeaders={signed}, Signature={self._signature(now, canonical_request)}"
+        )
+        del headers["host"]
+        return headers
+
+    def _build(self, method: str, key: str = "", query: Optional[Dict[str, str]] = None,
+               payload_hash: str = EMPTY_SHA256, headers: Optional[Dict[str, str]] = None, content=None):
+        query = query or {}
+        path = self._path(key)
+        url = f"{self.endpoint_url}{path}" + (f"?{_canonical_query(query)}" if query else "")
+        return self.client.build_request(
+            method,
+            url,
+            headers={**self._signed_headers(method, path, query, payload_hash), **(headers or {})},
+            content=content
+        )
+
+    async def put_file(self, digest: str, source_path: str, content_type: str = "application/octet-stream") -> bool:
+        try:
+            if await self.exists(digest):
+                return False
+
+            async def body() -> AsyncIterator[bytes]:
+                async with aiofiles.open(source_path, "rb") as f:
+                    while True:
+                        chunk = await f.read(UPLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        yield chunk
+
+            request = self._build(
+                "PUT",
+                self.key(digest),
+                payload_hash=digest,
+                headers={"content-length": str(os.path.getsize(source_path)), "content-type": content_type},
+                content=body()
+            )
+            response = await self.client.send(request)
+            response.raise_for_status()
+            return True
+        finally:
+            os.remove(source_path)
+
+    async def size(self, digest: str) -> Optional[int]:
+        response = await self.client.send(self._build("HEAD", self.key(digest)))
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return int(response.headers["content-length"])
+
+    async def exists(self, digest: str) -> bool:
+        return await self.size(digest) is not None
+
+    async def read(self, digest: str, chunk_size: int, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        headers = {}
+        if start or end is not None:
+            headers["range"] = f"bytes={start}-{'' if end is None else end}"
+        response = await self.client.send(self._build("GET", self.key(digest), headers=headers), stream=True)
+        try:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def delete(self, digest: str):
+        response = await self.client.send(self._build("DELETE", self.key(digest)))
+        if response.status_code != 404:
+            response.raise_for_status()
+
+    async def iter_digests(self) -> AsyncIterator[str]:
+        query = {"list-type": "2"}
+        while True:
+            response = await self.client.send(self._build("GET", query=query))
+            response.raise_for_status()
+            root = ElementTree.fromstring(response.content)
+            for element in root.iter(f"{S3_NAMESPACE}Key"):
+                yield element.text.rsplit("/", 1)[-1]
+            token = root.findtext(f"{S3_NAMESPACE}NextContinuationToken")
+            if not token:
+                break
+            query = {"list-type": "2", "continuation-token": token}
+
+    def _presign(self, now: datetime, path: str, query: Dict[str, str], expires_in: int) -> str:
+        """Query-string signed GET URL on the public endpoint"""
+        _, scope = self._scope(now)
+        query = {
+            **query,
+            "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+            "X-Amz-Credential": f"{self.access_key}/{scope}",
+            "X-Amz-Date": now.strftime("%Y%m%dT%H%M%SZ"),
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": "host"
+        }
+        canonical_request = "\n".join([
+            "GET",
+            path,
+            _canonical_query(query),
+            f"host:{urlsplit(self.public_endpoint_url).netloc}\n",
+            "host",
+            "UNSIGNED-PAYLOAD"
+        ])
+        query["X-Amz-Signature"] = self._signature(now, canonical_request)
+        return f"{self.public_endpoint_url}{path}?{_canonical_query(query)}"
+
+    async def presigned_url(
+        self,
+        digest: str,
+        filename: str,
+        content_type: str,
+        expires_in: int
+    ) -> Optional[str]:
+        return self._presign(
+            datetime.utcnow(),
+            self._path(self.key(digest)),
+            {
+                "response-content-disposition": content_disposition(filename),
+                "response-content-type": content_type
+            },
+            expires_in
+        )
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,49 @@
+# backend/app/utils/cursor.py
+import base64
+import hashlib
+import hmac
+from typing import Dict
+from bson import json_util
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+def _cursor_secret() -> bytes:
+    # Separate from the JWT and file-link signing inputs
+    return f"{settings.SECRET_KEY}:cursors".encode("utf-8")
+
+def _mac(payload: str) -> str:
+    digest = hmac.new(_cursor_secret(), payload.encode("ascii"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+def encode_cursor(position: Dict) -> str:
+    """
+    Encode a pagination position (may hold ObjectIds/datetimes) as an opaque token
+
+    The token is signed: positions go straight into Mongo filters, so a
+    client must not be able to put its own values (or operators) in them.
+    """
+    raw = json_util.dumps(position).encode("utf-8")
+    payload = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+    return f"{payload}.{_mac(payload)}"
+
+def decode_cursor(cursor: str) -> Dict:
+    """Decode a token produced by encode_cursor - 400 if it was tampered with"""
+    invalid = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+    payload, _, mac = cursor.partition(".")
+    try:
+        if not payload or not hmac.compare_digest(mac, _mac(payload)):
+            raise invalid
+        padded = payload + "=" * (-len(payload) % 4)
+        position = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except HTTPException:
+        raise
+    except Exception:
+        raise invalid
+
+    if not isinstance(position, dict):
+        raise invalid
+    return position
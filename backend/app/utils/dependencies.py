@@ -2,6 +2,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.models.user import User
 from app.utils.security import decode_access_token
+from app.utils.user_cache import principal_cache
 
 security = HTTPBearer()
 
@@ -23,12 +24,20 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="Invalid authentication credentials"
         )
     
-    user = await User.get(user_id)
+    # Serve the user snapshot from the principal cache when possible
+    token_exp = payload.get("exp")
+    token_key = payload.get("jti") or str(token_exp)
+    user = principal_cache.get(user_id, token_key)
+    
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        generation = principal_cache.generation(user_id)
+        user = await User.get(user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        principal_cache.set(user_id, token_key, user, token_exp=token_exp, generation=generation)
     
     if not user.is_active:
         raise HTTPException(
@@ -0,0 +1,138 @@
+# backend/app/utils/downloads.py
+import os
+import re
+from datetime import datetime
+from typing import AsyncIterator, Callable, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.utils.http_cache import REVALIDATE, not_modified_response, set_cache_validators
+
+# Content-addressed downloads requested with ?v=<sha256> never change
+IMMUTABLE = "private, max-age=31536000, immutable"
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Replaced in the quoted ASCII filename: non-ASCII, control characters, quotes and backslashes
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\x20-\x7e]|["\\]')
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Content-Disposition for an attachment, safe for any filename
+
+    Names that aren't plain ASCII get an ASCII fallback plus the RFC 5987
+    `filename*` form (as Starlette's FileResponse does), so quotes can't
+    break the header and non-latin-1 names don't fail to encode.
+    """
+    fallback = UNSAFE_FILENAME_CHARS.sub("_", filename)
+    if fallback == filename:
+        return f'attachment; filename="{filename}"'
+    return f"attachment; filename=\"{fallback}\"; filename*=utf-8''{quote(filename, safe='')}"
+
+
+def _byte_range(request: Request, size: int, etag: str) -> Optional[Tuple[int, int]]:
+    """
+    The inclusive (start, end) the client asked for, or None for the whole file
+
+    Only single ranges are honoured; multi-range and malformed headers
+    (including a last byte before the first) get the full body, which RFC 9110
+    allows. A stale If-Range also means the full body.
+    """
+    header = request.headers.get("range")
+    if not header:
+        return None
+
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range.strip() != etag:
+        return None
+
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        start, end = max(size - length, 0), size - 1
+        satisfiable = length > 0 and size > 0
+    else:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = min(int(last), size - 1) if last else size - 1
+        satisfiable = start < size and start <= end
+
+    if not satisfiable:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+
+def file_download(
+    request: Request,
+    *,
+    read: Callable[[int, int], AsyncIterator[bytes]],
+    size: int,
+    etag: str,
+    filename: str,
+    media_type: str = "application/octet-stream",
+    last_modified: Optional[datetime] = None,
+    cache_control: str = REVALIDATE,
+    file_path: Optional[str] = None,
+    accel_uri: Optional[str] = None
+) -> Response:
+    """
+    Download response with conditional GET, single-range support and optional sendfile offload
+
+    Call this after authorization. With PAR_DOWNLOAD_MODE set, the response
+    carries X-Accel-Redirect (needs accel_uri) or X-Sendfile (needs file_path)
+    and no body; the fronting server then sends the bytes and handles ranges.
+
+    Args:
+        read: read(start, end) streams the inclusive byte range
+        size: Content length in bytes
+        etag: Strong validator for the content
+        filename: Name offered in Content-Disposition
+    """
+    not_modified = not_modified_response(request, etag, last_modified, cache_control)
+    if not_modified is not None:
+        return not_modified
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": content_disposition(filename)
+    }
+
+    offload = None
+    if settings.PAR_DOWNLOAD_MODE == "x-accel-redirect" and accel_uri:
+        offload = ("X-Accel-Redirect", accel_uri)
+    elif settings.PAR_DOWNLOAD_MODE == "x-sendfile" and file_path:
+        offload = ("X-Sendfile", os.path.abspath(file_path))
+
+    if offload is not None:
+        response = Response(media_type=media_type, headers={**headers, offload[0]: offload[1]})
+        set_cache_validators(response, etag, last_modified, cache_control)
+        return response
+
+    byte_range = _byte_range(request, size, etag)
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    response = StreamingResponse(
+        read(start, end), status_code=status_code, media_type=media_type, headers=headers
+    )
+    set_cache_validators(response, etag, last_modified, cache_control)
+    return response
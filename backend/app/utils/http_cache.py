@@ -0,0 +1,96 @@
+# backend/app/utils/http_cache.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.utils.serialization import RawJSONResponse
+
+# Clients may keep a copy but must revalidate it (cheap 304) before every use
+REVALIDATE = "private, no-cache"
+
+# Reference lists only change with a deploy
+REFERENCE_DATA = "public, max-age=3600"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values that identify a representation"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _is_not_modified(request: Request, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+    # HTTP dates only have whole seconds, so two writes in the same second look
+    # unchanged - when there is an ETag, only the ETag can answer 304
+    if etag:
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+        return modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def set_cache_validators(
+    response: Response,
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+    cache_control: str = REVALIDATE
+):
+    if etag is not None:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        response.headers["Last-Modified"] = _http_date(last_modified)
+
+
+def not_modified_response(
+    request: Request,
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+    cache_control: str = REVALIDATE
+) -> Optional[Response]:
+    """A 304 response if the client's copy is current, otherwise None"""
+    if not _is_not_modified(request, etag, last_modified):
+        return None
+
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_validators(response, etag, last_modified, cache_control)
+    return response
+
+
+def cacheable_json(
+    request: Request,
+    content,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = REVALIDATE
+) -> Response:
+    """Serialize content with validators attached, or answer 304 without serializing"""
+    not_modified = not_modified_response(request, etag, last_modified, cache_control)
+    if not_modified is not None:
+        return not_modified
+
+    response = RawJSONResponse(content)
+    set_cache_validators(response, etag, last_modified, cache_control)
+    return response
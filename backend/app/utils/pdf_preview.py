@@ -0,0 +1,44 @@
+# backend/app/utils/pdf_preview.py
+"""
+First-page thumbnail and metadata for a PDF.
+
+Runs inside the preview process pool, so it only imports the stdlib at module
+level - pypdfium2 and Pillow are loaded in the worker on first use.
+"""
+import io
+from typing import Dict
+
+THUMBNAIL_TYPE = "image/webp"
+
+
+def render_preview(path: str, max_width: int) -> Dict:
+    """
+    Render page one no wider than max_width (and no taller than twice that)
+
+    Returns:
+        page_count, metadata (lower-cased Info keys), thumbnail bytes and its size
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        metadata = {
+            key.lower(): str(value)
+            for key, value in pdf.get_metadata_dict(skip_empty=True).items()
+        }
+        page = pdf[0]
+        width, height = page.get_size()
+        scale = min(max_width / width, 2 * max_width / height)
+        image = page.render(scale=scale).to_pil().convert("RGB")
+
+        buffer = io.BytesIO()
+        image.save(buffer, "WEBP", quality=70)
+        return {
+            "page_count": len(pdf),
+            "metadata": metadata,
+            "thumbnail": buffer.getvalue(),
+            "width": image.width,
+            "height": image.height
+        }
+    finally:
+        pdf.close()
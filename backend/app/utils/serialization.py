@@ -0,0 +1,37 @@
+# backend/app/utils/serialization.py
+from typing import Any, Dict, Iterable, List
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import Response
+
+
+def _default(value: Any):
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode to JSON bytes in one pass - datetimes natively, ObjectIds as strings"""
+    return orjson.dumps(content, default=_default)
+
+
+def documents_to_rows(docs: Iterable[Dict], fields: Iterable[str]) -> List[Dict]:
+    """Reshape raw Mongo documents into response rows (`_id` -> `id`, missing fields -> None)"""
+    fields = [field for field in fields if field != "_id"]
+    return [{"id": str(doc["_id"]), **{field: doc.get(field) for field in fields}} for doc in docs]
+
+
+class RawJSONResponse(Response):
+    """
+    JSON response for read-only endpoints that already hold plain rows.
+
+    Returning it from a handler skips FastAPI's response_model validation,
+    so rows are serialized exactly once (no Beanie model, no response schema).
+    Keep `response_model` on the route for the OpenAPI docs.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,65 @@
+# backend/app/utils/uploads.py
+import hashlib
+import os
+import tempfile
+from typing import Tuple
+
+import aiofiles
+from fastapi import HTTPException, UploadFile, status
+
+from app.config import settings
+
+PDF_MAGIC = b"%PDF-"
+
+
+async def receive_pdf_upload(file: UploadFile, temp_dir: str) -> Tuple[str, str, int]:
+    """
+    Stream an uploaded PDF into a temp file in fixed-size chunks, hashing as it goes
+
+    Only one chunk is held in memory; the upload is abandoned as soon as it
+    passes PAR_MAX_UPLOAD_BYTES or its first bytes aren't a PDF header.
+    The caller owns the temp file and must move or remove it.
+
+    Returns:
+        (temp_path, sha256 hex digest, size in bytes)
+    """
+    os.makedirs(temp_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=temp_dir, prefix="upload-", suffix=".part")
+    os.close(fd)
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, "wb") as out:
+            while True:
+                chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                if size == 0 and not chunk.startswith(PDF_MAGIC):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Only PDF files are allowed"
+                    )
+
+                size += len(chunk)
+                if size > settings.PAR_MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large. Maximum size is {settings.PAR_MAX_UPLOAD_BYTES // (1024 * 1024)}MB"
+                    )
+
+                digest.update(chunk)
+                await out.write(chunk)
+
+        if size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Uploaded file is empty"
+            )
+
+        return temp_path, digest.hexdigest(), size
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,137 @@
+# backend/app/utils/user_cache.py
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from app.config import settings
+from app.models.user import User
+
+
+class PrincipalCache:
+    """Bounded, TTL'd in-process cache of authenticated User snapshots.
+
+    Entries are keyed by (user_id, token key) so a new login never reuses a
+    snapshot resolved for an older token. Admin actions that change a user's
+    access (approve/reject/deactivate) must call `invalidate(user_id)`.
+
+    The cache is per process: with several workers, `invalidate` only reaches
+    the worker that handled the admin request, and the others keep serving
+    their snapshot for up to PRINCIPAL_CACHE_TTL_SECONDS. Keep the TTL short,
+    or set it to 0 to always read the user from the database.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, User]]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[Tuple[str, str]]] = {}
+        # Bumped by invalidate, so a lookup that raced an invalidation isn't cached
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, user_id: str, token_key: str) -> Optional[User]:
+        """Return a copy of the cached user, or None on miss/expiry"""
+        if not self.enabled:
+            return None
+
+        key = (user_id, token_key)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Hand out a shallow copy so a handler mutating its user can't leak into other requests
+        return user.model_copy()
+
+    def generation(self, user_id: str) -> int:
+        """Take before loading a user, and pass to `set` with the result"""
+        return self._generations.get(user_id, 0)
+
+    def set(
+        self,
+        user_id: str,
+        token_key: str,
+        user: User,
+        token_exp: Optional[float] = None,
+        generation: Optional[int] = None
+    ):
+        """
+        Cache a user snapshot until the TTL or the token expiry, whichever comes first
+
+        Nothing is cached if the user was invalidated since `generation` was
+        taken - the snapshot may predate the change.
+        """
+        if not self.enabled:
+            return
+        if generation is not None and generation != self.generation(user_id):
+            return
+
+        ttl = self.ttl_seconds
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+
+        key = (user_id, token_key)
+        self._entries[key] = (time.monotonic() + ttl, user.model_copy())
+        self._entries.move_to_end(key)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def invalidate(self, user_id: str):
+        """Drop every cached snapshot of a user, for all of their tokens"""
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+        self._generations[user_id] = self.generation(user_id) + 1
+        self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+    def _remove(self, key: Tuple[str, str]):
+        self._entries.pop(key, None)
+        user_keys = self._keys_by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[0]]
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,45 @@
+# backend/scripts/archive_audit_logs.py
+import argparse
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.models import AuditLog, AuditArchiveChunk
+from app.services.audit_retention_service import AuditRetentionService
+
+async def main(dry_run: bool, max_chunks: int):
+    """Move audit entries older than AUDIT_HOT_DAYS into the compressed archive"""
+    print(f"🔄 Archiving audit entries older than {settings.AUDIT_HOT_DAYS} days...")
+
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    await init_beanie(
+        database=client[settings.MONGODB_DB_NAME],
+        document_models=[AuditLog, AuditArchiveChunk]
+    )
+
+    result = await AuditRetentionService.archive(dry_run=dry_run, max_chunks=max_chunks or None)
+    label = "Would archive" if dry_run else "Archived"
+    print(f"   Cutoff: {result['cutoff']:%Y-%m-%d} (UTC)")
+    print(f"   {label}: {result['entries']} entries" + ("" if dry_run else f" in {result['chunks']} chunks"))
+
+    manifest = await AuditRetentionService.manifest()
+    if manifest:
+        entries = sum(day["entries"] for day in manifest)
+        size = sum(day["size"] for day in manifest)
+        print(f"\n   Archive: {len(manifest)} days, {entries} entries, {size / 1024 / 1024:.1f} MB compressed")
+        print(f"   From {manifest[0]['day']:%Y-%m-%d} to {manifest[-1]['day']:%Y-%m-%d}")
+
+    client.close()
+    print("\n✅ Audit archiving complete!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move old audit log entries into the compressed archive")
+    parser.add_argument("--dry-run", action="store_true", help="Only count what would be archived")
+    parser.add_argument("--max-chunks", type=int, default=0, help="Stop after N chunks (default: until done)")
+    args = parser.parse_args()
+    asyncio.run(main(dry_run=args.dry_run, max_chunks=args.max_chunks))
@@ -0,0 +1,54 @@
+# backend/scripts/backfill_previews.py
+import argparse
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.models import StoredBlob
+from app.services.preview_service import ParPreviewService, shutdown_preview_worker
+from app.storage import get_blob_store
+
+async def main(force: bool):
+    """Generate PAR previews that are missing, failed or were skipped under load"""
+    print("🔄 Generating PAR previews...")
+
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    await init_beanie(
+        database=client[settings.MONGODB_DB_NAME],
+        document_models=[StoredBlob]
+    )
+
+    query = {"ref_count": {"$gt": 0}}
+    if not force:
+        query["preview_status"] = {"$ne": "ready"}
+    digests = [blob["digest"] async for blob in StoredBlob.get_motor_collection().find(query, {"digest": 1})]
+    print(f"   Documents to preview: {len(digests)}")
+
+    results = {}
+    batch = settings.PREVIEW_WORKERS
+    for start in range(0, len(digests), batch):
+        statuses = await asyncio.gather(*(
+            ParPreviewService.generate(digest, force=force) for digest in digests[start:start + batch]
+        ))
+        for preview_status in statuses:
+            key = preview_status or "skipped (in progress elsewhere)"
+            results[key] = results.get(key, 0) + 1
+
+    for preview_status, count in sorted(results.items()):
+        print(f"   {preview_status}: {count}")
+
+    shutdown_preview_worker()
+    await get_blob_store().close()
+    client.close()
+    print("\n✅ Preview backfill complete!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render missing PAR document previews")
+    parser.add_argument("--force", action="store_true", help="Re-render every referenced document")
+    args = parser.parse_args()
+    asyncio.run(main(force=args.force))
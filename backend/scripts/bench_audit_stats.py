@@ -0,0 +1,144 @@
+# backend/scripts/bench_audit_stats.py
+"""
+Benchmark: GET /api/audit/stats on a large audit collection.
+
+"legacy"       the previous handler body: AuditLog.find(timestamp >= start)
+               .to_list() and counting actions/resource types/users in
+               Python dicts.
+"aggregation"  AuditService.get_stats - one $match/$facet/$sortByCount
+               pipeline; only the counts come back.
+
+Entries are spread evenly over the last 365 days, so the 30-day window holds
+about 1/12 of them. Peak RSS growth is reported for each method (ru_maxrss
+only ever grows, so legacy runs last).
+
+Needs a running MongoDB (MONGODB_URL). Works in a scratch database,
+<MONGODB_DB_NAME>_bench, which is dropped at the end.
+
+Usage: python scripts/bench_audit_stats.py [--entries 5000000] [--days 30 365] [--skip-legacy]
+"""
+import argparse
+import asyncio
+import random
+import resource
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.models import AuditLog
+from app.services.audit_service import AuditService
+
+ACTIONS = ["CREATE", "UPDATE", "DELETE", "ASSIGN", "UNASSIGN", "TRANSFER", "APPROVE", "REJECT"]
+RESOURCE_TYPES = ["EQUIPMENT", "FURNITURE", "USER", "HR_FILE"]
+INSERT_BATCH = 10000
+
+
+async def seed(entries: int):
+    collection = AuditLog.get_motor_collection()
+    now = datetime.utcnow()
+    rng = random.Random(42)
+    users = [f"user{i:03d}@pcc.gov.ph" for i in range(200)]
+    written = 0
+    while written < entries:
+        batch = min(INSERT_BATCH, entries - written)
+        await collection.insert_many([
+            {
+                "user_id": str(rng.randrange(200)),
+                # Skewed so the top-N actually ranks something
+                "user_email": users[min(int(rng.paretovariate(1.1)) - 1, 199)],
+                "user_role": "admin",
+                "action": rng.choice(ACTIONS),
+                "resource_type": rng.choice(RESOURCE_TYPES),
+                "resource_id": f"{rng.randrange(10 ** 6):024x}",
+                "resource_name": "Dell Latitude 5440",
+                "changes": {"status": "Assigned"},
+                "old_values": None,
+                "new_values": None,
+                "ip_address": None,
+                "user_agent": None,
+                "notes": None,
+                "timestamp": now - timedelta(seconds=rng.randrange(365 * 86400))
+            }
+            for _ in range(batch)
+        ], ordered=False)
+        written += batch
+        if written % 500000 == 0 or written == entries:
+            print(f"   seeded {written:,}")
+
+
+async def legacy(days: int) -> dict:
+    start_date = datetime.utcnow() - timedelta(days=days)
+    logs = await AuditLog.find(AuditLog.timestamp >= start_date).to_list()
+    actions_count, resource_types_count, users_count = {}, {}, {}
+    for log in logs:
+        actions_count[log.action] = actions_count.get(log.action, 0) + 1
+        resource_types_count[log.resource_type] = resource_types_count.get(log.resource_type, 0) + 1
+        users_count[log.user_email] = users_count.get(log.user_email, 0) + 1
+    return {
+        "total_actions": len(logs),
+        "actions_breakdown": actions_count,
+        "resource_types_breakdown": resource_types_count,
+        "most_active_users": dict(sorted(users_count.items(), key=lambda x: x[1], reverse=True)[:10])
+    }
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def measure(label: str, func, days: int) -> dict:
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+    result = await func(days)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {days:>3}d  {elapsed * 1000:10.1f} ms   "
+          f"peak RSS +{peak_rss_mb() - rss_before:8.1f} MB   {result['total_actions']:>10,} entries")
+    return result
+
+
+async def main(entries: int, windows: list, skip_legacy: bool):
+    print(f"🔄 Seeding {entries:,} audit entries...\n")
+
+    client = AsyncIOMotorClient(settings.MONGODB_URL, serverSelectionTimeoutMS=3000)
+    db_name = f"{settings.MONGODB_DB_NAME}_bench"
+    try:
+        await client.admin.command("ping")
+    except Exception as e:
+        print(f"❌ MongoDB is not reachable at {settings.MONGODB_URL}: {e}")
+        sys.exit(1)
+
+    await init_beanie(database=client[db_name], document_models=[AuditLog])
+
+    try:
+        await seed(entries)
+        print()
+        for days in windows:
+            aggregated = await measure("aggregation", AuditService.get_stats, days)
+            if not skip_legacy:
+                counted = await measure("legacy", legacy, days)
+                same = all(aggregated[key] == counted[key]
+                           for key in ("total_actions", "actions_breakdown", "resource_types_breakdown"))
+                print(f"{'':<12} breakdowns match: {'yes' if same else 'NO'}")
+            print()
+    finally:
+        await client.drop_database(db_name)
+        client.close()
+
+    print("✅ Benchmark complete (scratch database dropped)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=5000000)
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 365])
+    parser.add_argument("--skip-legacy", action="store_true", help="Legacy loads every entry in the window into memory")
+    args = parser.parse_args()
+    asyncio.run(main(args.entries, args.days, args.skip_legacy))
@@ -0,0 +1,95 @@
+# backend/scripts/bench_password_hashing.py
+"""
+Benchmark: latency of a concurrent /api/equipment/my-equipment style workload
+while a burst of logins is verifying passwords.
+
+"before" verifies on the event loop (verify_password), "after" uses the
+hashing pool (verify_password_async). The my-equipment probe is modelled as
+a coroutine that awaits one simulated Mongo round trip, so the measured
+latency is dominated by how long the event loop is blocked.
+
+Usage: python scripts/bench_password_hashing.py [--logins 200] [--probes 20]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.security import (
+    hash_password,
+    verify_password,
+    verify_password_async,
+    shutdown_password_hasher
+)
+
+DB_ROUND_TRIP = 0.002
+
+
+async def my_equipment_probe(latencies: list, stop: asyncio.Event):
+    """Repeatedly issue a simulated my-equipment request and record latency"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(DB_ROUND_TRIP)
+        latencies.append(time.perf_counter() - started)
+
+
+async def login_sync(password: str, password_hash: str):
+    await asyncio.sleep(0)
+    verify_password(password, password_hash)
+
+
+async def login_async(password: str, password_hash: str):
+    await asyncio.sleep(0)
+    await verify_password_async(password, password_hash)
+
+
+async def run_scenario(login, logins: int, probes: int, password_hash: str):
+    latencies = []
+    stop = asyncio.Event()
+    probe_tasks = [asyncio.create_task(my_equipment_probe(latencies, stop)) for _ in range(probes)]
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login(f"password-{i}", password_hash) for i in range(logins)))
+    login_elapsed = time.perf_counter() - started
+
+    stop.set()
+    await asyncio.gather(*probe_tasks)
+    return login_elapsed, latencies
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(name: str, login_elapsed: float, latencies: list):
+    print(f"{name}:")
+    print(f"   Logins finished in:    {login_elapsed * 1000:9.1f} ms")
+    print(f"   Probe requests:        {len(latencies):9d}")
+    print(f"   Probe p50 latency:     {statistics.median(latencies) * 1000:9.2f} ms")
+    print(f"   Probe p99 latency:     {percentile(latencies, 99) * 1000:9.2f} ms")
+    print(f"   Probe max latency:     {max(latencies) * 1000:9.2f} ms")
+
+
+async def main(logins: int, probes: int):
+    print(f"🔄 Benchmarking {logins} concurrent logins with {probes} concurrent my-equipment probes...\n")
+    password_hash = hash_password("benchmark-password")
+
+    report("Before (verify on event loop)", *await run_scenario(login_sync, logins, probes, password_hash))
+    print()
+    report("After (verify in hashing pool)", *await run_scenario(login_async, logins, probes, password_hash))
+
+    shutdown_password_hasher()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--probes", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.probes))
@@ -0,0 +1,120 @@
+# backend/scripts/bench_serialization.py
+"""
+Microbenchmark: per-item cost of serializing an equipment list response.
+
+"before" mirrors the previous handler path for each raw Mongo document:
+model validation of the Equipment fields (what Beanie does on read, without
+needing a database) -> hand-built EquipmentResponseSchema -> FastAPI
+response_model validation -> jsonable dump -> stdlib json.dumps.
+"after" is the raw path: documents_to_rows -> orjson, once.
+
+Usage: python scripts/bench_serialization.py [--items 10000] [--rounds 5]
+"""
+import argparse
+import json
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from pydantic import TypeAdapter, create_model
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.equipment import Equipment
+from app.schemas.equipment_schema import EquipmentResponseSchema
+from app.repositories.asset_repository import AssetRepository
+from app.utils.serialization import documents_to_rows, dumps
+
+
+# Same fields and validation as the Equipment document, minus Beanie's collection binding
+EquipmentFields = create_model(
+    "EquipmentFields",
+    **{
+        name: (field.annotation, field)
+        for name, field in Equipment.model_fields.items()
+        if name not in ("id", "revision_id")
+    }
+)
+
+
+def make_documents(count: int) -> List[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "property_number": f"PCC-2024-IT-{i:06d}",
+            "gsd_code": f"GSD-{i:05d}",
+            "item_number": str(i),
+            "equipment_type": "Laptop",
+            "brand": "Dell",
+            "model": "Latitude 5440",
+            "serial_number": f"SN{i:08d}",
+            "specifications": "Intel Core i7, 16GB RAM, 512GB SSD",
+            "acquisition_date": now - timedelta(days=i % 900),
+            "acquisition_cost": 65000.0,
+            "assigned_to_user_id": None,
+            "assigned_to_name": None,
+            "assigned_date": None,
+            "assignment_type": None,
+            "previous_recipient": None,
+            "condition": "Good",
+            "status": "Available",
+            "remarks": None,
+            "par_file_path": None,
+            "par_number": None,
+            "created_by": "admin@pcc.gov.ph",
+            "created_at": now,
+            "updated_at": now
+        }
+        for i in range(count)
+    ]
+
+
+def before(docs: List[dict]) -> bytes:
+    adapter = TypeAdapter(List[EquipmentResponseSchema])
+    responses = []
+    for doc in docs:
+        eq = EquipmentFields.model_validate(doc)
+        responses.append(EquipmentResponseSchema(id=str(doc["_id"]), **eq.model_dump()))
+    validated = adapter.validate_python(responses)
+    return json.dumps(adapter.dump_python(validated, mode="json")).encode("utf-8")
+
+
+def after(docs: List[dict]) -> bytes:
+    return dumps(documents_to_rows(docs, AssetRepository.response_projection(EquipmentResponseSchema)))
+
+
+def measure(func, docs: List[dict], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func(docs)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(items: int, rounds: int):
+    print(f"🔄 Serializing {items} equipment documents (best of {rounds} rounds)...\n")
+    docs = make_documents(items)
+
+    assert json.loads(before(docs)) == json.loads(after(docs)), "paths produce different JSON"
+
+    before_s = measure(before, docs, rounds)
+    after_s = measure(after, docs, rounds)
+
+    print(f"Before (validate -> schema -> response_model -> json):{before_s * 1000:8.1f} ms  "
+          f"({before_s / items * 1e6:6.2f} µs/item)")
+    print(f"After  (raw rows -> orjson):                         {after_s * 1000:8.1f} ms  "
+          f"({after_s / items * 1e6:6.2f} µs/item)")
+    print(f"\n⚡ Speedup: {before_s / after_s:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.items, args.rounds)
@@ -0,0 +1,207 @@
+# backend/scripts/bench_transfer.py
+"""
+Benchmark: server-side latency of moving equipment from one user to another.
+
+"two-call (legacy)"  replays the unassign + assign workaround the way the
+                     handlers used to do it: Equipment.get -> save() twice,
+                     a User lookup, counter updates and the assign audit insert.
+"two-call (atomic)"  the same workaround on the current unassign/assign
+                     operations (one conditional update each).
+"transfer"           AssignmentService.transfer + its audit insert - one
+                     conditional update that also appends the custody entry.
+
+HTTP overhead is excluded, so the two-call numbers are a lower bound: the
+workaround also pays for two requests and two token checks.
+
+Needs a running MongoDB (MONGODB_URL). Works in a scratch database,
+<MONGODB_DB_NAME>_bench, which is dropped at the end.
+
+Usage: python scripts/bench_transfer.py [--items 200]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+from datetime import datetime
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.models import User, Equipment, Furniture, AuditLog, AuditRollup, AuditArchiveChunk, InventoryCounters, StoredBlob
+from app.schemas.equipment_schema import (
+    EquipmentAssignSchema,
+    EquipmentResponseSchema,
+    EquipmentTransferSchema
+)
+from app.services.assignment_service import AssignmentService
+from app.services.audit_service import AuditService
+from app.services.stats_service import InventoryStatsService
+
+
+def make_user(email: str, first_name: str) -> User:
+    return User(
+        surname="Bench",
+        first_name=first_name,
+        email=email,
+        password_hash="-",
+        position="Benchmark",
+        salary_grade="SG 1",
+        starting_date=datetime.utcnow(),
+        job_category="Job Order",
+        assigned_unit="ISSU",
+        role="user",
+        is_approved=True
+    )
+
+
+async def legacy_two_call(equipment_id: str, new_user: User, admin: User):
+    # Unassign: get -> mutate -> full save
+    equipment = await Equipment.get(equipment_id)
+    old_snapshot = InventoryStatsService.snapshot("equipment", equipment)
+    equipment.previous_recipient = equipment.assigned_to_name
+    equipment.assigned_to_user_id = None
+    equipment.assigned_to_name = None
+    equipment.assigned_date = None
+    equipment.status = "Available"
+    equipment.updated_at = datetime.utcnow()
+    await equipment.save()
+    await InventoryStatsService.record_change(
+        "equipment", old=old_snapshot, new=InventoryStatsService.snapshot("equipment", equipment)
+    )
+
+    # Assign: get -> user lookup -> mutate -> full save -> audit
+    equipment = await Equipment.get(equipment_id)
+    old_snapshot = InventoryStatsService.snapshot("equipment", equipment)
+    await User.get(str(new_user.id))
+    equipment.assigned_to_user_id = str(new_user.id)
+    equipment.assigned_to_name = new_user.first_name
+    equipment.assigned_date = datetime.utcnow()
+    equipment.assignment_type = "Job Order"
+    equipment.status = "Assigned"
+    equipment.updated_at = datetime.utcnow()
+    await equipment.save()
+    await InventoryStatsService.record_change(
+        "equipment", old=old_snapshot, new=InventoryStatsService.snapshot("equipment", equipment)
+    )
+    await AuditService.log_action(
+        user=admin, action="ASSIGN", resource_type="EQUIPMENT",
+        resource_id=equipment_id, resource_name=f"{equipment.brand} {equipment.model}"
+    )
+
+
+async def atomic_two_call(equipment_id: str, new_user: User, admin: User):
+    await AssignmentService.unassign("equipment", EquipmentResponseSchema, equipment_id, admin)
+    assign_data = EquipmentAssignSchema(
+        assigned_to_user_id=str(new_user.id),
+        assigned_to_name=new_user.first_name,
+        assigned_date=datetime.utcnow(),
+        assignment_type="Job Order"
+    )
+    _, equipment = await AssignmentService.assign(
+        "equipment", EquipmentResponseSchema, equipment_id, assign_data
+    )
+    await AuditService.log_action(
+        user=admin, action="ASSIGN", resource_type="EQUIPMENT",
+        resource_id=equipment_id, resource_name=f"{equipment['brand']} {equipment['model']}"
+    )
+
+
+async def transfer(equipment_id: str, new_user: User, admin: User):
+    transfer_data = EquipmentTransferSchema(
+        new_user_id=str(new_user.id),
+        new_user_name=new_user.first_name,
+        transfer_date=datetime.utcnow(),
+        transfer_reason="Benchmark"
+    )
+    _, equipment = await AssignmentService.transfer(
+        "equipment", EquipmentResponseSchema, equipment_id, transfer_data, admin
+    )
+    await AuditService.log_action(
+        user=admin, action="TRANSFER", resource_type="EQUIPMENT",
+        resource_id=equipment_id, resource_name=f"{equipment['brand']} {equipment['model']}"
+    )
+
+
+async def measure(method, equipment_ids, new_user: User, admin: User) -> list:
+    latencies = []
+    for equipment_id in equipment_ids:
+        started = time.perf_counter()
+        await method(equipment_id, new_user, admin)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(label: str, latencies: list):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<20} median {statistics.median(ordered) * 1000:7.2f} ms   p95 {p95 * 1000:7.2f} ms")
+
+
+async def main(items: int):
+    print(f"🔄 Transferring {items} equipment items per method...\n")
+
+    client = AsyncIOMotorClient(settings.MONGODB_URL, serverSelectionTimeoutMS=3000)
+    db_name = f"{settings.MONGODB_DB_NAME}_bench"
+    try:
+        await client.admin.command("ping")
+    except Exception as e:
+        print(f"❌ MongoDB is not reachable at {settings.MONGODB_URL}: {e}")
+        sys.exit(1)
+
+    await init_beanie(
+        database=client[db_name],
+        document_models=[User, Equipment, Furniture, AuditLog, AuditRollup, AuditArchiveChunk, InventoryCounters, StoredBlob]
+    )
+
+    try:
+        admin = make_user("bench-admin@pcc.gov.ph", "Admin")
+        old_holder = make_user("bench-old@pcc.gov.ph", "Old")
+        new_holder = make_user("bench-new@pcc.gov.ph", "New")
+        for user in (admin, old_holder, new_holder):
+            await user.insert()
+
+        methods = [
+            ("two-call (legacy)", legacy_two_call),
+            ("two-call (atomic)", atomic_two_call),
+            ("transfer", transfer),
+        ]
+        batches = {}
+        for label, _ in methods:
+            docs = [
+                Equipment(
+                    property_number=f"BENCH-{label}-{i:05d}",
+                    equipment_type="Laptop",
+                    brand="Dell",
+                    model="Latitude 5440",
+                    assigned_to_user_id=str(old_holder.id),
+                    assigned_to_name=old_holder.first_name,
+                    assigned_date=datetime.utcnow(),
+                    assignment_type="Job Order",
+                    status="Assigned",
+                    created_by=admin.email
+                )
+                for i in range(items)
+            ]
+            result = await Equipment.insert_many(docs)
+            batches[label] = [str(inserted_id) for inserted_id in result.inserted_ids]
+        await InventoryStatsService.rebuild("equipment")
+
+        for label, method in methods:
+            report(label, await measure(method, batches[label], new_holder, admin))
+    finally:
+        await client.drop_database(db_name)
+        client.close()
+
+    print("\n✅ Benchmark complete (scratch database dropped)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.items))
@@ -0,0 +1,46 @@
+# backend/scripts/gc_blobs.py
+import argparse
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.models import Equipment, Furniture, StoredBlob
+from app.services.document_service import ParDocumentService
+from app.storage import get_blob_store
+
+async def main(dry_run: bool, recount: bool):
+    """Remove PAR blobs that no equipment/furniture item references"""
+    print("🔄 Collecting unreferenced PAR documents...")
+    
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    await init_beanie(
+        database=client[settings.MONGODB_DB_NAME],
+        document_models=[Equipment, Furniture, StoredBlob]
+    )
+    
+    if recount:
+        updated = await ParDocumentService.recount()
+        print(f"   Reference counts corrected: {updated}")
+    
+    report = await ParDocumentService.collect_garbage(dry_run=dry_run)
+    
+    label = "Would remove" if dry_run else "Removed"
+    print(f"\n{label} {len(report['unreferenced'])} unreferenced and {len(report['untracked'])} untracked blobs")
+    for digest in report["unreferenced"] + report["untracked"]:
+        print(f"   {digest}")
+    
+    await get_blob_store().close()
+    client.close()
+    print("\n✅ Blob garbage collection complete!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Garbage-collect the content-addressed PAR document store")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be removed")
+    parser.add_argument("--recount", action="store_true", help="Rebuild reference counts from the inventory first")
+    args = parser.parse_args()
+    asyncio.run(main(dry_run=args.dry_run, recount=args.recount))
@@ -0,0 +1,79 @@
+# backend/scripts/migrate_par_files.py
+import argparse
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.models import Equipment, Furniture, StoredBlob
+from app.services.document_service import ParDocumentService
+from app.services.stats_service import INVENTORY_KINDS
+from app.storage import LocalBlobStore, get_blob_store
+
+async def copy_local_blobs(store, source_dir: str):
+    """Copy blobs from a local store directory into the configured backend"""
+    source = LocalBlobStore(source_dir)
+    copied = skipped = 0
+    async for digest in source.iter_digests():
+        if await store.exists(digest):
+            skipped += 1
+            continue
+        # put_file consumes its input, so hand it a copy
+        temp_path = os.path.join(store.temp_dir, f"copy-{digest}.part")
+        with open(source.local_path(digest), "rb") as src, open(temp_path, "wb") as dst:
+            while chunk := src.read(settings.UPLOAD_CHUNK_SIZE):
+                dst.write(chunk)
+        await store.put_file(digest, temp_path, "application/pdf")
+        copied += 1
+    print(f"   Local blobs copied: {copied} (already present: {skipped})")
+
+async def main(remove_source: bool, copy_from: str):
+    """Move PAR files still referenced by path into the configured document store"""
+    print(f"🔄 Migrating PAR documents into the {settings.STORAGE_BACKEND} document store...")
+
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    await init_beanie(
+        database=client[settings.MONGODB_DB_NAME],
+        document_models=[Equipment, Furniture, StoredBlob]
+    )
+    store = get_blob_store()
+
+    if copy_from:
+        await copy_local_blobs(store, copy_from)
+
+    for kind, (document_model, _) in INVENTORY_KINDS.items():
+        migrated = missing = changed = 0
+        cursor = document_model.get_motor_collection().find(
+            {"par_file_path": {"$type": "string"}, "par_sha256": None},
+            {"par_file_path": 1, "property_number": 1}
+        )
+        async for item in cursor:
+            path = item["par_file_path"]
+            if not os.path.exists(path):
+                print(f"   ⚠️  {item.get('property_number')}: {path} not found")
+                missing += 1
+                continue
+            digest = await ParDocumentService.migrate_legacy(kind, item)
+            if digest is None:
+                changed += 1
+                continue
+            migrated += 1
+            if remove_source:
+                os.remove(path)
+        print(f"   {kind}: {migrated} migrated, {missing} missing, {changed} changed during migration")
+
+    await store.close()
+    client.close()
+    print("\n✅ PAR migration complete!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move path-referenced PAR uploads into the configured document store")
+    parser.add_argument("--remove-source", action="store_true", help="Delete each legacy file once migrated")
+    parser.add_argument("--copy-local-blobs", metavar="DIR", default="",
+                        help="Also copy a local blob store directory (e.g. app/uploads/blobs) into the configured backend")
+    args = parser.parse_args()
+    asyncio.run(main(remove_source=args.remove_source, copy_from=args.copy_local_blobs))
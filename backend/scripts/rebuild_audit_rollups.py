@@ -0,0 +1,57 @@
+# backend/scripts/rebuild_audit_rollups.py
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.models import AuditLog, AuditRollup, AuditArchiveChunk
+from app.services.audit_rollup_service import AuditRollupService
+
+async def main(days: int, chunk_days: int):
+    """Backfill or correct the hourly/daily audit rollups from the audit log"""
+    print("🔄 Rebuilding audit rollups...")
+
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    await init_beanie(
+        database=client[settings.MONGODB_DB_NAME],
+        document_models=[AuditLog, AuditRollup, AuditArchiveChunk]
+    )
+
+    end = datetime.utcnow()
+    if days:
+        start = end - timedelta(days=days)
+    else:
+        oldest = await AuditLog.get_motor_collection().find_one({}, {"timestamp": 1}, sort=[("timestamp", 1)])
+        start = oldest["timestamp"] if oldest else end
+    print(f"   From {start:%Y-%m-%d %H:00} to the last settled hour (UTC)")
+
+    totals = {"hours": 0, "entries": 0, "corrected": 0}
+    # Chunks keep each aggregation's result small on a long history
+    while start < end:
+        chunk_end = min(start + timedelta(days=chunk_days), end)
+        result = await AuditRollupService.rebuild(start, chunk_end)
+        for key in totals:
+            totals[key] += result[key]
+        if result["corrected"]:
+            print(f"   {start:%Y-%m-%d}: {result['entries']} entries, {result['corrected']} hours corrected")
+        start = chunk_end
+
+    print(f"\n   Hours checked: {totals['hours']}")
+    print(f"   Entries counted: {totals['entries']}")
+    print(f"   Hours corrected: {totals['corrected']}")
+
+    client.close()
+    print("\n✅ Audit rollups rebuilt!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill the hourly/daily audit rollups from audit history")
+    parser.add_argument("--days", type=int, default=0, help="Only the last N days (default: all history)")
+    parser.add_argument("--chunk-days", type=int, default=7, help="Days recounted per aggregation")
+    args = parser.parse_args()
+    asyncio.run(main(days=args.days, chunk_days=args.chunk_days))
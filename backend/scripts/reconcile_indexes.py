@@ -0,0 +1,42 @@
+# backend/scripts/reconcile_indexes.py
+import argparse
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.database import reconcile_indexes
+
+async def main(build: bool, drop_extra: bool):
+    """Report missing/extra inventory indexes and optionally fix them"""
+    print("🔄 Reconciling inventory indexes...")
+    
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    database = client[settings.MONGODB_DB_NAME]
+    
+    report = await reconcile_indexes(database, build=build, drop_extra=drop_extra)
+    
+    for collection_name, result in report.items():
+        print(f"\n{collection_name}:")
+        print(f"   Missing: {', '.join(result['missing']) or '-'}")
+        print(f"   Extra:   {', '.join(result['extra']) or '-'}")
+        if build:
+            print(f"   Built:   {', '.join(result['built']) or '-'}")
+        if drop_extra:
+            print(f"   Dropped: {', '.join(result['dropped']) or '-'}")
+    
+    client.close()
+    
+    if any(result["failed"] for result in report.values()):
+        sys.exit(1)
+    print("\n✅ Index reconciliation complete!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile equipment/furniture indexes with app/models/indexes.py")
+    parser.add_argument("--dry-run", action="store_true", help="Only report, don't build missing indexes")
+    parser.add_argument("--drop-extra", action="store_true", help="Drop indexes that are not declared in the registry")
+    args = parser.parse_args()
+    asyncio.run(main(build=not args.dry_run, drop_extra=args.drop_extra and not args.dry_run))
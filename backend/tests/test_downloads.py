@@ -0,0 +1,79 @@
+# backend/tests/test_downloads.py
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.utils.downloads import _byte_range, content_disposition
+
+ETAG = '"abc"'
+
+
+def make_request(range_header=None, if_range=None) -> Request:
+    headers = []
+    if range_header is not None:
+        headers.append((b"range", range_header.encode("latin-1")))
+    if if_range is not None:
+        headers.append((b"if-range", if_range.encode("latin-1")))
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=2-4", (2, 4)),
+    ("bytes=5-", (5, 99)),
+    ("bytes=90-500", (90, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+    ("bytes=3-3", (3, 3)),
+])
+def test_byte_range_single(header, expected):
+    assert _byte_range(make_request(header), 100, ETAG) == expected
+
+
+@pytest.mark.parametrize("header", [
+    "bytes=5-3",
+    "bytes=0-1,5-6",
+    "bytes=-",
+    "items=0-1",
+    "bytes=a-b",
+])
+def test_byte_range_ignored(header):
+    assert _byte_range(make_request(header), 100, ETAG) is None
+
+
+def test_byte_range_without_header():
+    assert _byte_range(make_request(), 100, ETAG) is None
+
+
+@pytest.mark.parametrize("header, size", [
+    ("bytes=100-", 100),
+    ("bytes=150-200", 100),
+    ("bytes=-0", 100),
+    ("bytes=-5", 0),
+])
+def test_byte_range_unsatisfiable(header, size):
+    with pytest.raises(HTTPException) as error:
+        _byte_range(make_request(header), size, ETAG)
+    assert error.value.status_code == 416
+    assert error.value.headers["Content-Range"] == f"bytes */{size}"
+
+
+def test_byte_range_if_range():
+    assert _byte_range(make_request("bytes=0-9", if_range=ETAG), 100, ETAG) == (0, 9)
+    assert _byte_range(make_request("bytes=0-9", if_range='"stale"'), 100, ETAG) is None
+
+
+def test_content_disposition_plain_ascii():
+    assert content_disposition("PAR_P-001.pdf") == 'attachment; filename="PAR_P-001.pdf"'
+
+
+@pytest.mark.parametrize("filename, fallback, encoded", [
+    ("PAR_José.pdf", "PAR_Jos_.pdf", "PAR_Jos%C3%A9.pdf"),
+    ("名前.pdf", "__.pdf", "%E5%90%8D%E5%89%8D.pdf"),
+    ('a"b\\c.pdf', "a_b_c.pdf", "a%22b%5Cc.pdf"),
+])
+def test_content_disposition_rfc5987(filename, fallback, encoded):
+    header = content_disposition(filename)
+    assert header == f"attachment; filename=\"{fallback}\"; filename*=utf-8''{encoded}"
+    # Starlette encodes header values as latin-1
+    header.encode("latin-1")
@@ -0,0 +1,40 @@
+# backend/tests/test_http_cache.py
+from datetime import datetime
+
+from starlette.requests import Request
+
+from app.utils.http_cache import make_etag, not_modified_response
+
+ETAG = make_etag("equipment", "abc", "2026-10-18T00:00:00.500000")
+LAST_MODIFIED = datetime(2026, 10, 18, 0, 0, 0, 500000)
+
+
+def make_request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    })
+
+
+def test_matching_etag_is_304():
+    response = not_modified_response(make_request(if_none_match=ETAG), ETAG, LAST_MODIFIED)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == ETAG
+
+
+def test_weak_and_listed_etags():
+    assert not_modified_response(make_request(if_none_match=f'"other", W/{ETAG}'), ETAG) is not None
+    assert not_modified_response(make_request(if_none_match="*"), ETAG) is not None
+    assert not_modified_response(make_request(if_none_match='"other"'), ETAG) is None
+
+
+def test_date_alone_never_answers_for_an_etag():
+    # Same second as LAST_MODIFIED: a later write in that second would be missed
+    request = make_request(if_modified_since="Sun, 18 Oct 2026 00:00:00 GMT")
+    assert not_modified_response(request, ETAG, LAST_MODIFIED) is None
+
+
+def test_date_without_etag():
+    request = make_request(if_modified_since="Sun, 18 Oct 2026 00:00:00 GMT")
+    assert not_modified_response(request, None, LAST_MODIFIED) is not None
+    assert not_modified_response(request, None, datetime(2026, 10, 18, 0, 0, 1)) is None
@@ -0,0 +1,147 @@
+# backend/tests/test_pagination.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.repositories.pagination import find_page
+from app.utils.cursor import decode_cursor, encode_cursor
+
+OPERATORS = {
+    "$gt": lambda value, bound: value is not None and value > bound,
+    "$lt": lambda value, bound: value is not None and value < bound,
+}
+
+
+def matches(doc, query) -> bool:
+    """The subset of the query language find_page produces"""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(matches(doc, part) for part in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(doc, part) for part in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not all(OPERATORS[op](doc.get(key), bound) for op, bound in condition.items()):
+                return False
+        elif doc.get(key) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        return FakeCursor([dict(doc) for doc in self.docs if matches(doc, query)])
+
+
+def all_pages(collection, query, sort_field, limit, descending=False):
+    pages, cursor = [], None
+    while True:
+        docs, cursor = asyncio.run(
+            find_page(collection, query, sort_field, limit, cursor=cursor, descending=descending)
+        )
+        pages.append(docs)
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def collection():
+    start = datetime(2024, 1, 1)
+    docs = []
+    for i in range(7):
+        # Pairs share a sort value, so pages must break ties on _id
+        docs.append({
+            "_id": ObjectId(),
+            "property_number": f"P{i // 2:03d}",
+            "timestamp": start + timedelta(minutes=i // 2),
+            "status": "Assigned" if i % 3 == 0 else "Available"
+        })
+    return FakeCollection(docs)
+
+
+def test_cursor_round_trip():
+    position = {"s": "timestamp", "v": datetime(2024, 1, 1, 12, 30), "id": ObjectId()}
+    assert decode_cursor(encode_cursor(position)) == position
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7, 10])
+def test_pages_cover_everything_once(collection, limit):
+    pages = all_pages(collection, {}, "property_number", limit)
+    ids = [doc["_id"] for page in pages for doc in page]
+    expected = [doc["_id"] for doc in sorted(collection.docs, key=lambda doc: (doc["property_number"], doc["_id"]))]
+    assert ids == expected
+    assert all(len(page) == limit for page in pages[:-1])
+
+
+def test_descending_with_query(collection):
+    pages = all_pages(collection, {"status": "Available"}, "timestamp", 2, descending=True)
+    ids = [doc["_id"] for page in pages for doc in page]
+    available = [doc for doc in collection.docs if doc["status"] == "Available"]
+    expected = [doc["_id"] for doc in sorted(available, key=lambda doc: (doc["timestamp"], doc["_id"]), reverse=True)]
+    assert ids == expected
+    # The caller's filter stays in force on later pages
+    assert all(query.get("$and", [{}])[0] == {"status": "Available"} for query in collection.queries[1:])
+
+
+def test_last_page_has_no_cursor(collection):
+    docs, cursor = asyncio.run(find_page(collection, {}, "property_number", 7))
+    assert len(docs) == 7
+    assert cursor is None
+
+
+def test_cursor_from_other_listing(collection):
+    _, cursor = asyncio.run(find_page(collection, {}, "property_number", 2))
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(find_page(collection, {}, "timestamp", 2, cursor=cursor))
+    assert error.value.status_code == 400
+
+
+def test_empty_cursor_is_first_page(collection):
+    docs, _ = asyncio.run(find_page(collection, {}, "property_number", 2, cursor=""))
+    assert [doc["property_number"] for doc in docs] == ["P000", "P000"]
+
+
+@pytest.mark.parametrize("cursor", [
+    "garbage",
+    "e30.",
+    encode_cursor({"s": "property_number", "v": "P001", "id": ObjectId()}) + "x",
+])
+def test_tampered_cursor(collection, cursor):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(find_page(collection, {}, "property_number", 2, cursor=cursor))
+    assert error.value.status_code == 400
+
+
+def test_forged_operator_cursor(collection):
+    # A client can't swap its own position (or query operators) into a signed cursor
+    mac = encode_cursor({"s": "property_number", "v": "P001", "id": ObjectId()}).partition(".")[2]
+    forged = encode_cursor({"s": "property_number", "v": {"$ne": None}, "id": ObjectId()}).partition(".")[0]
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(find_page(collection, {}, "property_number", 2, cursor=f"{forged}.{mac}"))
+    assert error.value.status_code == 400
@@ -0,0 +1,52 @@
+# backend/tests/test_signed_links.py
+import time
+
+from app.utils.signed_links import sign_link, verify_link
+
+SECRET = "test-secret:file-links"
+
+
+def test_round_trip():
+    token = sign_link(SECRET, {"kind": "equipment", "id": "abc"}, 60)
+    claims = verify_link(SECRET, token)
+    assert claims["kind"] == "equipment"
+    assert claims["id"] == "abc"
+    assert claims["exp"] > time.time()
+
+
+def test_wrong_secret():
+    token = sign_link(SECRET, {"id": "abc"}, 60)
+    assert verify_link("other-secret", token) is None
+
+
+def test_tampered_payload():
+    token = sign_link(SECRET, {"id": "abc"}, 60)
+    other = sign_link(SECRET, {"id": "xyz"}, 60)
+    forged = f"{other.partition('.')[0]}.{token.partition('.')[2]}"
+    assert verify_link(SECRET, forged) is None
+
+
+def test_tampered_mac():
+    token = sign_link(SECRET, {"id": "abc"}, 60)
+    payload, _, mac = token.partition(".")
+    flipped = ("A" if mac[0] != "A" else "B") + mac[1:]
+    assert verify_link(SECRET, f"{payload}.{flipped}") is None
+
+
+def test_malformed():
+    assert verify_link(SECRET, "") is None
+    assert verify_link(SECRET, "no-dot") is None
+    assert verify_link(SECRET, ".") is None
+
+
+def test_non_ascii():
+    token = sign_link(SECRET, {"id": "abc"}, 60)
+    payload, _, mac = token.partition(".")
+    assert verify_link(SECRET, "é.abc") is None
+    assert verify_link(SECRET, "abc.é") is None
+    assert verify_link(SECRET, f"{payload}.{mac}é") is None
+
+
+def test_expired():
+    token = sign_link(SECRET, {"id": "abc"}, -1)
+    assert verify_link(SECRET, token) is None
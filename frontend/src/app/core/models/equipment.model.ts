@@ -79,6 +79,16 @@ export interface Furniture {
   updated_at?: string;
 }
 
+export interface MyAssets {
+  equipment: Equipment[];
+  furniture: Furniture[];
+  counts: {
+    equipment: number;
+    furniture: number;
+    total: number;
+  };
+}
+
 export interface FurnitureCreate {
   property_number: string;
   gsd_code: string;
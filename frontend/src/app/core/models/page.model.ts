@@ -0,0 +1,7 @@
+// frontend/src/app/core/models/page.model.ts
+
+// One page of a cursor-paginated listing; send next_cursor back as `cursor` for the next page
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
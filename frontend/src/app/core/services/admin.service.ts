@@ -1,9 +1,11 @@
 // frontend/src/app/core/services/admin.service.ts
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 import { environment } from '../../../environments/environment.prod';
 import { User, PendingUser } from '../models/user.model';
+import { Page } from '../models/page.model';
+import { fetchAllPages } from './pagination';
 
 @Injectable({
   providedIn: 'root'
@@ -13,19 +15,30 @@ export class AdminService {
 
   constructor(private http: HttpClient) {}
 
-  // Get all pending users (not approved)
+  private pageParams(cursor?: string): HttpParams {
+    return cursor ? new HttpParams().set('cursor', cursor) : new HttpParams();
+  }
+
+  // Get all pending users (not approved), following every page
   getPendingUsers(): Observable<PendingUser[]> {
-    return this.http.get<PendingUser[]>(`${this.apiUrl}/pending-users`);
+    return fetchAllPages(cursor =>
+      this.http.get<Page<PendingUser>>(`${this.apiUrl}/pending-users`, { params: this.pageParams(cursor) })
+    );
+  }
+
+  // Get one page of users, oldest registration first
+  getUsersPage(cursor?: string): Observable<Page<User>> {
+    return this.http.get<Page<User>>(`${this.apiUrl}/all-users`, { params: this.pageParams(cursor) });
   }
 
-  // Get all users (approved and pending)
+  // Get all users (approved and pending), following every page
   getAllUsers(): Observable<User[]> {
-    return this.http.get<User[]>(`${this.apiUrl}/all-users`);
+    return fetchAllPages(cursor => this.getUsersPage(cursor));
   }
 
   // Get approved users only - ADDED
   getApprovedUsers(): Observable<User[]> {
-    return this.http.get<User[]>(`${this.apiUrl}/all-users`);
+    return this.getAllUsers();
   }
 
   // Approve a pending user
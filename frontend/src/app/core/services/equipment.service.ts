@@ -1,9 +1,11 @@
 // frontend/src/app/core/services/equipment.service.ts
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 import { environment } from '../../../environments/environment.prod';
-import { Equipment, EquipmentCreate, EquipmentAssign, Furniture, FurnitureCreate, FurnitureAssign } from '../models/equipment.model';
+import { Equipment, EquipmentCreate, EquipmentAssign, Furniture, FurnitureCreate, FurnitureAssign, MyAssets } from '../models/equipment.model';
+import { Page } from '../models/page.model';
+import { fetchAllPages } from './pagination';
 
 @Injectable({
   providedIn: 'root'
@@ -13,16 +15,27 @@ export class EquipmentService {
 
   constructor(private http: HttpClient) {}
 
+  private pageParams(cursor?: string): HttpParams {
+    return cursor ? new HttpParams().set('cursor', cursor) : new HttpParams();
+  }
+
   // ============ EQUIPMENT ENDPOINTS ============
 
-  // Get all equipment (Admin)
+  // Get one page of equipment, ordered by property number (Admin)
+  getEquipmentPage(cursor?: string): Observable<Page<Equipment>> {
+    return this.http.get<Page<Equipment>>(`${this.apiUrl}/equipment/`, { params: this.pageParams(cursor) });
+  }
+
+  // Get all equipment, following every page (Admin)
   getAllEquipment(): Observable<Equipment[]> {
-    return this.http.get<Equipment[]>(`${this.apiUrl}/equipment/`);
+    return fetchAllPages(cursor => this.getEquipmentPage(cursor));
   }
 
-  // Get available equipment (Admin)
+  // Get available equipment, following every page (Admin)
   getAvailableEquipment(): Observable<Equipment[]> {
-    return this.http.get<Equipment[]>(`${this.apiUrl}/equipment/available`);
+    return fetchAllPages(cursor =>
+      this.http.get<Page<Equipment>>(`${this.apiUrl}/equipment/available`, { params: this.pageParams(cursor) })
+    );
   }
 
   // Get single equipment (Admin)
@@ -81,14 +94,21 @@ export class EquipmentService {
 
   // ============ FURNITURE ENDPOINTS ============
 
-  // Get all furniture (Admin)
+  // Get one page of furniture, ordered by property number (Admin)
+  getFurniturePage(cursor?: string): Observable<Page<Furniture>> {
+    return this.http.get<Page<Furniture>>(`${this.apiUrl}/furniture/`, { params: this.pageParams(cursor) });
+  }
+
+  // Get all furniture, following every page (Admin)
   getAllFurniture(): Observable<Furniture[]> {
-    return this.http.get<Furniture[]>(`${this.apiUrl}/furniture/`);
+    return fetchAllPages(cursor => this.getFurniturePage(cursor));
   }
 
-  // Get available furniture (Admin)
+  // Get available furniture, following every page (Admin)
   getAvailableFurniture(): Observable<Furniture[]> {
-    return this.http.get<Furniture[]>(`${this.apiUrl}/furniture/available`);
+    return fetchAllPages(cursor =>
+      this.http.get<Page<Furniture>>(`${this.apiUrl}/furniture/available`, { params: this.pageParams(cursor) })
+    );
   }
 
   // Get single furniture (Admin)
@@ -126,6 +146,11 @@ export class EquipmentService {
     return this.http.get<Furniture[]>(`${this.apiUrl}/furniture/my-furniture`);
   }
 
+  // Get my equipment and furniture in one request (User)
+  getMyAssets(): Observable<MyAssets> {
+    return this.http.get<MyAssets>(`${this.apiUrl}/me/assets`);
+  }
+
   // Upload PAR document (Admin)
   uploadFurniturePAR(id: string, file: File): Observable<any> {
     const formData = new FormData();
@@ -0,0 +1,13 @@
+// frontend/src/app/core/services/pagination.ts
+import { EMPTY, Observable } from 'rxjs';
+import { expand, scan } from 'rxjs/operators';
+import { Page } from '../models/page.model';
+
+// Follow next_cursor until the last page. Emits the rows loaded so far after
+// every page, so tables fill in as pages arrive instead of stopping at page one.
+export function fetchAllPages<T>(fetchPage: (cursor?: string) => Observable<Page<T>>): Observable<T[]> {
+  return fetchPage().pipe(
+    expand(page => page.next_cursor ? fetchPage(page.next_cursor) : EMPTY),
+    scan((rows: T[], page: Page<T>) => rows.concat(page.items), [] as T[])
+  );
+}
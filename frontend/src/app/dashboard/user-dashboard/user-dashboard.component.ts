@@ -76,44 +76,30 @@ export class UserDashboardComponent implements OnInit {
   ngOnInit(): void {
     console.log('User Dashboard initialized');
     console.log('Current User:', this.currentUser);
-    this.loadMyEquipment();
-    this.loadMyFurniture();
+    this.loadMyAssets();
   }
 
-  loadMyEquipment(): void {
+  loadMyAssets(): void {
     this.loading = true;
-    console.log('Loading equipment for user:', this.currentUser?.id);
+    console.log('Loading assets for user:', this.currentUser?.id);
     
-    this.equipmentService.getMyEquipment().subscribe({
+    this.equipmentService.getMyAssets().subscribe({
       next: (data) => {
-        console.log('Equipment loaded:', data);
-        this.equipmentList = data;
-        this.equipmentCount = data.length;
-        this.calculateEquipmentByType(data);
+        console.log('Assets loaded:', data.counts);
+        this.equipmentList = data.equipment;
+        this.equipmentCount = data.counts.equipment;
+        this.calculateEquipmentByType(data.equipment);
+        this.furnitureList = data.furniture;
+        this.furnitureCount = data.counts.furniture;
         this.loading = false;
       },
       error: (error) => {
-        console.error('Failed to load equipment:', error);
+        console.error('Failed to load assets:', error);
         this.loading = false;
       }
     });
   }
 
-  loadMyFurniture(): void {
-    console.log('Loading furniture for user:', this.currentUser?.id);
-    
-    this.equipmentService.getMyFurniture().subscribe({
-      next: (data) => {
-        console.log('Furniture loaded:', data);
-        this.furnitureList = data;
-        this.furnitureCount = data.length;
-      },
-      error: (error) => {
-        console.error('Failed to load furniture:', error);
-      }
-    });
-  }
-
   calculateEquipmentByType(equipment: Equipment[]): void {
     const typeMap = new Map<string, number>();
     equipment.forEach(eq => {